@@ -4,21 +4,8 @@ Add the Japanese show with correct Comedy genre to union mapping
 """
 
 import pandas as pd
-import re
 
-def normalize_show_name(name):
-    """Normalize show name for matching - consistent with ranking system."""
-    if pd.isna(name):
-        return ""
-
-    # Apply same normalization as ranking system
-    normalized = str(name).strip().lower()
-    # Remove all non-word/space characters
-    normalized = re.sub(r"[^\w\s]", "", normalized)
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    return normalized.strip()
+from show_name_normalization import normalize_show_name
 
 def add_japanese_show():
     """Add the Japanese show to union mapping with correct Comedy genre."""
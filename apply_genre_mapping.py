@@ -8,34 +8,21 @@ and creates comprehensive genre mapping across all platforms.
 
 import pandas as pd
 from pathlib import Path
-import re
 
-def normalize_show_name(name):
-    """Normalize show name for matching."""
-    if pd.isna(name):
-        return ""
-    normalized = str(name).lower().strip()
-    normalized = re.sub(r'[^\w\s]', '', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized)
-    return normalized
+from classification_lookup import get_classification_lookup
+from show_name_normalization import normalize_show_name
 
 def load_genre_mapping():
-    """Load the genre mapping CSV."""
-    genres_df = pd.read_csv("podcast_genres.csv")
-
-    # Create normalized mapping
-    genre_map = {}
-    for _, row in genres_df.iterrows():
-        normalized = normalize_show_name(row['show_name'])
-        genre_map[normalized] = row['genre']
-
-    return genre_map
+    """Genre index over podcast_genres.csv (shared, parsed once per process)."""
+    return get_classification_lookup().table(
+        "podcast_genres.csv", label_col="genre", key_col="show_name", key_normalizer=normalize_show_name
+    )
 
 def apply_genres_to_platforms():
     """Apply genre mapping to all platform datasets."""
 
     # Load genre mapping
-    genre_map = load_genre_mapping()
+    genre_index = load_genre_mapping()
     data_dir = Path("data")
 
     # Load and process Spotify
@@ -43,14 +30,14 @@ def apply_genres_to_platforms():
     spotify.columns = ["show_name", "spotify_plays", "category"]
     spotify = spotify.dropna()
     spotify['normalized'] = spotify['show_name'].apply(normalize_show_name)
-    spotify['genre'] = spotify['normalized'].map(genre_map)
+    spotify['genre'] = genre_index.lookup(spotify['normalized'])
 
     # Load and process YouTube
     youtube = pd.read_csv(data_dir / "youtube.csv")
     youtube = youtube.rename(columns={"playlist_name": "show_name"})
     youtube = youtube[(youtube["FeatureCountry"] == "US") | (youtube["FeatureCountry"].isna())]
     youtube['normalized'] = youtube['show_name'].apply(normalize_show_name)
-    youtube['genre'] = youtube['normalized'].map(genre_map)
+    youtube['genre'] = genre_index.lookup(youtube['normalized'])
 
     # Load and process Amazon (already has genres, but normalize them)
     amazon = pd.read_csv(data_dir / "amazon.csv", skiprows=2)
@@ -61,14 +48,14 @@ def apply_genres_to_platforms():
     })
     amazon['normalized'] = amazon['show_name'].apply(normalize_show_name)
     # Use existing Amazon genres, supplemented by our mapping
-    amazon['genre'] = amazon['genre'].fillna(amazon['normalized'].map(genre_map))
+    amazon['genre'] = amazon['genre'].fillna(pd.Series(genre_index.lookup(amazon['normalized']), index=amazon.index))
 
     # Load and process iHeart
     iheart = pd.read_csv(data_dir / "iheart_platform_nominations.csv", skiprows=2)
     iheart.columns = ["rank", "show_name", "iheart_listeners", "iheart_streams", "iheart_completion", "iheart_followers"]
     iheart = iheart.dropna(subset=["show_name"])
     iheart['normalized'] = iheart['show_name'].apply(normalize_show_name)
-    iheart['genre'] = iheart['normalized'].map(genre_map)
+    iheart['genre'] = genre_index.lookup(iheart['normalized'])
 
     return spotify, youtube, amazon, iheart
 
@@ -6,11 +6,7 @@ Apply Tavily-researched genres to the ranking system
 import pandas as pd
 from pathlib import Path
 
-def normalize_show_name(name):
-    """Normalize show name for matching."""
-    if pd.isna(name):
-        return ""
-    return str(name).lower().strip().replace("'", "'").replace(""", '"').replace(""", '"')
+from show_name_normalization import normalize_show_name
 
 def create_tavily_normalized_mapping():
     """Create normalized mapping from Tavily research."""
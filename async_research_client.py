@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Asynchronous research client with token-bucket rate limiting
+
+Runs many search queries concurrently against an HTTP search API (Tavily's
+JSON API by default) while a token bucket keeps the request rate under a
+configurable limit. Each request has its own timeout and is retried with
+exponential backoff on timeouts, connection errors, 429 and 5xx responses.
+HTTP calls use urllib in worker threads, so no extra dependency is needed.
+
+FakeResearchServer serves the local research index over HTTP with injected
+latency and failures, for exercising the client without network access.
+"""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from research_backends import LocalCorpusBackend, ResearchBackend
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+DEFAULT_RATE = 5.0          # requests per second
+DEFAULT_BURST = 10          # bucket capacity
+DEFAULT_CONCURRENCY = 20    # requests in flight
+DEFAULT_TIMEOUT = 10.0      # seconds per attempt
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5       # seconds, doubled per retry
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, at most `capacity` stored."""
+
+    def __init__(self, rate=DEFAULT_RATE, capacity=DEFAULT_BURST):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("Token bucket needs rate > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self.updated is not None:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class RetryableError(Exception):
+    """A failed attempt that is worth retrying (timeout, 429, 5xx, connection)."""
+
+
+class AsyncResearchClient:
+    """Concurrent, rate-limited, retrying client for a JSON search endpoint."""
+
+    def __init__(self, endpoint=TAVILY_SEARCH_URL, api_key=None, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+                 concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, seed=None):
+        self.endpoint = endpoint
+        self.api_key = api_key if api_key is not None else os.environ.get("TAVILY_API_KEY", "")
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._random = random.Random(seed)
+        self._executor = None
+        self.stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    def _post(self, payload):
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            if e.code in RETRY_STATUS:
+                raise RetryableError(f"HTTP {e.code}") from e
+            raise
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            raise RetryableError(str(e)) from e
+
+    async def search(self, query, max_results=3, bucket=None):
+        """One query with rate limiting, a timeout per attempt and retries."""
+
+        bucket = bucket or TokenBucket(self.rate, self.burst)
+        payload = {
+            "api_key": self.api_key,
+            "query": query,
+            "max_results": max_results,
+            "include_answer": True,
+            "search_depth": "basic",
+        }
+
+        for attempt in range(self.retries + 1):
+            await bucket.acquire()
+            self.stats["requests"] += 1
+            try:
+                call = asyncio.get_running_loop().run_in_executor(self._executor, self._post, payload)
+                return await asyncio.wait_for(call, self.timeout)
+            except (RetryableError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    self.stats["failures"] += 1
+                    return {"query": query, "answer": None, "results": [], "error": str(e) or "timeout"}
+                self.stats["retries"] += 1
+                # Exponential backoff with jitter so retries do not arrive in lockstep
+                await asyncio.sleep(self.backoff * 2 ** attempt * (0.5 + self._random.random()))
+            except Exception as e:
+                self.stats["failures"] += 1
+                return {"query": query, "answer": None, "results": [], "error": str(e)}
+
+    async def search_many(self, queries, max_results=3):
+        """Responses for all queries (in order), at most `concurrency` in flight."""
+
+        bucket = TokenBucket(self.rate, self.burst)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(query):
+            async with semaphore:
+                return await self.search(query, max_results, bucket)
+
+        # One worker thread per in-flight request (the default pool may be smaller)
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            self._executor = executor
+            try:
+                return await asyncio.gather(*(run(query) for query in queries))
+            finally:
+                self._executor = None
+
+
+class AsyncHTTPBackend(ResearchBackend):
+    """Research backend that sends batches through the async client."""
+
+    name = "tavily_http"
+    remote = True
+
+    def __init__(self, client=None):
+        self.client = client or AsyncResearchClient()
+
+    def available(self):
+        return bool(self.client.api_key) or self.client.endpoint != TAVILY_SEARCH_URL
+
+    def search(self, query, max_results=3):
+        return self.search_many([query], max_results)[0]
+
+    def search_many(self, queries, max_results=3):
+        return asyncio.run(self.client.search_many(list(queries), max_results))
+
+
+class FakeResearchServer:
+    """Local HTTP search server for tests: answers from the local index with
+    injected latency, failure rate (HTTP 503) and optional stalls (timeouts)."""
+
+    def __init__(self, backend=None, latency=0.05, failure_rate=0.0, stall_rate=0.0, seed=0):
+        self.backend = backend or LocalCorpusBackend()
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.stall_rate = stall_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with fake._lock:
+                    fake.requests += 1
+                    roll = fake._random.random()
+                    body = json.dumps(fake.backend.search(payload["query"], payload.get("max_results", 3)))
+
+                if roll < fake.stall_rate:
+                    time.sleep(30)
+                time.sleep(fake.latency)
+
+                if roll < fake.stall_rate + fake.failure_rate:
+                    self.send_error(503, "Injected failure")
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(body.encode("utf-8"))
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    shows = pd.read_csv("final_5platform_podcast_rankings.csv", keep_default_na=False)["show_name"]
+    queries = [f'"{show}" podcast host country origin where created' for show in shows if show]
+
+    print("ASYNC RESEARCH CLIENT (against a local fake server)")
+    print("=" * 55)
+
+    local = LocalCorpusBackend()
+    local.search("warm up")  # build the index outside the timing
+    local.close()
+
+    with FakeResearchServer(latency=0.1, failure_rate=0.05) as server:
+        client = AsyncResearchClient(server.url, rate=100, burst=20, concurrency=20,
+                                     timeout=2.0, backoff=0.05, seed=0)
+        start = time.perf_counter()
+        responses = asyncio.run(client.search_many(queries))
+        elapsed = time.perf_counter() - start
+
+    answered = sum(1 for response in responses if response["results"])
+    sequential = len(queries) * (0.1 + 0.5)
+    print(f"Queries: {len(queries)} | with results: {answered}")
+    print(f"Requests: {client.stats['requests']} | retries: {client.stats['retries']} | "
+          f"failures: {client.stats['failures']}")
+    print(f"Elapsed: {elapsed:.1f} s (sequential with 0.5 s sleeps: ~{sequential:.0f} s)")
@@ -4,22 +4,10 @@ Check which Spotify and iHeart shows are missing genre mappings
 """
 
 import pandas as pd
-import re
 from pathlib import Path
 
-def normalize_show_name(name):
-    """Normalize show name for matching - consistent with ranking system."""
-    if pd.isna(name):
-        return ""
-
-    # Apply same normalization as ranking system
-    normalized = str(name).strip().lower()
-    # Remove all non-word/space characters
-    normalized = re.sub(r"[^\w\s]", "", normalized)
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    return normalized.strip()
+from classification_lookup import get_classification_lookup
+from show_name_normalization import normalize_show_name
 
 def check_genre_coverage():
     """Check genre coverage for Spotify and iHeart shows."""
@@ -52,9 +40,9 @@ def check_genre_coverage():
 
     print(f"iHeart shows: {len(iheart_shows)}")
 
-    # Load current genre mapping
-    union_df = pd.read_csv("union_genre_mapping.csv")
-    mapped_shows = set(union_df["normalized_name"])
+    # Load current genre mapping (shared, parsed once per process)
+    union_index = get_classification_lookup().table("union_genre_mapping.csv", label_col="final_genre")
+    mapped_shows = set(union_index.index)
 
     print(f"Shows with genre mapping: {len(mapped_shows)}")
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Curated classification facts loaded on demand from data_classification_facts/
+
+The hand-researched key -> label facts (country and genre classifications,
+Tavily research results) live in fact_labels.csv; the evidence text behind
+them lives in fact_evidence.csv and is only read when asked for. Each
+collection is indexed into a dict on first use and cached, so importing a
+script no longer rebuilds hundreds of literal entries.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+FACTS_DIR = Path("data_classification_facts")
+LABELS_FILE = FACTS_DIR / "fact_labels.csv"
+EVIDENCE_FILE = FACTS_DIR / "fact_evidence.csv"
+
+
+def _read_facts(path):
+    # Keys such as "2020" or "sex" must stay literal strings
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+@lru_cache(maxsize=1)
+def _label_index():
+    labels = _read_facts(LABELS_FILE)
+    return {
+        collection: dict(zip(group["key"], group["label"]))
+        for collection, group in labels.groupby("collection", sort=False)
+    }
+
+
+@lru_cache(maxsize=1)
+def _evidence_index():
+    evidence = _read_facts(EVIDENCE_FILE)
+    return {
+        collection: dict(zip(group["key"], group["evidence"]))
+        for collection, group in evidence.groupby("collection", sort=False)
+    }
+
+
+def list_collections():
+    """Names of all fact collections."""
+
+    return list(_label_index())
+
+
+def load_fact_labels(collection):
+    """Key -> label dict of a collection, in curation order."""
+
+    try:
+        return dict(_label_index()[collection])
+    except KeyError:
+        raise KeyError(f"Unknown fact collection: {collection}") from None
+
+
+def load_fact_evidence(collection):
+    """Key -> evidence text of a collection (only keys with evidence)."""
+
+    return dict(_evidence_index().get(collection, {}))
+
+
+def load_facts_with_evidence(collection):
+    """Key -> (label, evidence) for a collection; evidence is "" when absent."""
+
+    labels = load_fact_labels(collection)
+    evidence = load_fact_evidence(collection)
+    return {key: (label, evidence.get(key, "")) for key, label in labels.items()}
+
+
+def query_facts(collection=None, label=None, contains=None, with_evidence=False):
+    """Filter facts by collection, exact label and/or key substring."""
+
+    facts = _read_facts(LABELS_FILE)
+
+    if collection is not None:
+        facts = facts[facts["collection"] == collection]
+    if label is not None:
+        facts = facts[facts["label"] == label]
+    if contains is not None:
+        facts = facts[facts["key"].str.contains(contains.lower(), case=False, regex=False)]
+
+    if with_evidence:
+        facts = facts.merge(_read_facts(EVIDENCE_FILE), on=["collection", "key"], how="left")
+        facts["evidence"] = facts["evidence"].fillna("")
+
+    return facts.reset_index(drop=True)
+
+
+def save_fact_collection(collection, labels, evidence=None):
+    """Replace a collection's facts (key -> label, optional key -> evidence) in the store.
+
+    Each file is written to a temporary file and then swapped in, so a crash
+    mid-write leaves the previous store intact.
+    """
+
+    written = []
+    for path, values, column in [(LABELS_FILE, labels, "label"), (EVIDENCE_FILE, evidence or {}, "evidence")]:
+        facts = _read_facts(path)
+        facts = facts[facts["collection"] != collection]
+        new = pd.DataFrame({"collection": collection, "key": list(values), column: list(values.values())})
+        facts = pd.concat([facts, new], ignore_index=True)
+
+        temporary = path.with_name(f"{path.name}.tmp")
+        with open(temporary, "w", encoding="utf-8", newline="") as f:
+            facts.to_csv(f, index=False, lineterminator="\r\n")
+            f.flush()
+            os.fsync(f.fileno())
+        written.append((temporary, path))
+
+    for temporary, path in written:
+        os.replace(temporary, path)
+
+    _label_index.cache_clear()
+    _evidence_index.cache_clear()
+    return len(labels)
+
+
+if __name__ == "__main__":
+    # python classification_facts.py [key substring]
+    if len(sys.argv) > 1:
+        matches = query_facts(contains=sys.argv[1], with_evidence=True)
+        print(matches.to_string(index=False))
+    else:
+        print("CLASSIFICATION FACT COLLECTIONS")
+        print("=" * 40)
+        for collection in list_collections():
+            labels = load_fact_labels(collection)
+            print(f"  {collection}: {len(labels)} facts, {len(set(labels.values()))} labels")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Shared in-process classification lookup service
+
+Mappings are read and parsed once per process and kept as hash indexes
+(pandas Index over the keys plus an aligned label array). Pipeline stages
+that run back-to-back share the same service via get_classification_lookup()
+and resolve whole arrays of show ids with one batch lookup.
+"""
+
+import numpy as np
+import pandas as pd
+
+GENRE_DEFAULT = "Other"
+COUNTRY_DEFAULT = "Unknown"
+
+
+class LabelIndex:
+    """Hash index from normalized show name to label."""
+
+    def __init__(self, keys, labels):
+        table = pd.DataFrame({"key": list(keys), "label": list(labels)})
+        # Same rule as dict(zip(keys, labels)): the last row for a key wins
+        table = table.drop_duplicates("key", keep="last")
+
+        self.index = pd.Index(table["key"].to_numpy(dtype=object))
+        self.labels = table["label"].to_numpy(dtype=object)
+
+    @classmethod
+    def from_dict(cls, mapping):
+        return cls(mapping.keys(), mapping.values())
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def positions(self, ids):
+        """Row positions of ids in the index, -1 where missing."""
+
+        return self.index.get_indexer(pd.Index(np.asarray(ids, dtype=object)))
+
+    def lookup(self, ids, default=None):
+        """Labels for an array of ids, default where the id is not mapped."""
+
+        positions = self.positions(ids)
+        found = positions >= 0
+
+        result = np.full(len(positions), default, dtype=object)
+        result[found] = self.labels[positions[found]]
+
+        # Mapped-but-empty labels fall back to the default too
+        if default is not None:
+            result[pd.isna(result)] = default
+
+        return result
+
+    def contains(self, ids):
+        """Boolean array: which ids have an entry."""
+
+        return self.positions(ids) >= 0
+
+    def to_dict(self):
+        return dict(zip(self.index, self.labels))
+
+
+class ClassificationLookup:
+    """Country and genre lookups shared by every stage of the pipeline."""
+
+    def __init__(self, country_map=None, genre_map=None):
+        self._country = LabelIndex.from_dict(country_map) if country_map is not None else None
+        self._genre = LabelIndex.from_dict(genre_map) if genre_map is not None else None
+        self._tables = {}
+
+    @classmethod
+    def from_maps(cls, country_map, genre_map):
+        """Service over explicit maps, e.g. from a mapping snapshot."""
+
+        return cls(country_map, genre_map)
+
+    def _load_ranking_maps(self):
+        from complete_5platform_ranking_system import (
+            create_comprehensive_classification_updates,
+            load_updated_mappings,
+        )
+
+        country_map, genre_map = load_updated_mappings()
+        country_updates, genre_updates = create_comprehensive_classification_updates()
+        country_map.update(country_updates)
+        genre_map.update(genre_updates)
+
+        self._country = LabelIndex.from_dict(country_map)
+        self._genre = LabelIndex.from_dict(genre_map)
+
+    @property
+    def country_index(self):
+        if self._country is None:
+            self._load_ranking_maps()
+        return self._country
+
+    @property
+    def genre_index(self):
+        if self._genre is None:
+            self._load_ranking_maps()
+        return self._genre
+
+    def lookup_country(self, ids, default=COUNTRY_DEFAULT):
+        """Country code per show id, "Unknown" where unmapped."""
+
+        return self.country_index.lookup(ids, default)
+
+    def lookup_genre(self, ids, default=GENRE_DEFAULT):
+        """Standardized genre per show id, "Other" where unmapped."""
+
+        return self.genre_index.lookup(ids, default)
+
+    def country_map(self):
+        return self.country_index.to_dict()
+
+    def genre_map(self):
+        return self.genre_index.to_dict()
+
+    def table(self, path, label_col, key_col="normalized_name", key_normalizer=None):
+        """Any other mapping file, parsed on first use and cached by path and columns.
+
+        key_normalizer, when given, is applied to the key column first (for
+        files keyed by raw show names).
+        """
+
+        cache_key = (str(path), key_col, label_col, key_normalizer)
+        if cache_key not in self._tables:
+            mapping_df = pd.read_csv(path)
+            keys = mapping_df[key_col]
+            if key_normalizer is not None:
+                keys = keys.map(key_normalizer)
+            self._tables[cache_key] = LabelIndex(keys, mapping_df[label_col])
+
+        return self._tables[cache_key]
+
+
+_shared_lookup = None
+
+
+def get_classification_lookup():
+    """The process-wide lookup service, created on first use."""
+
+    global _shared_lookup
+    if _shared_lookup is None:
+        _shared_lookup = ClassificationLookup()
+    return _shared_lookup
+
+
+def reset_classification_lookup():
+    """Drop the shared service so the next stage re-reads the mapping files."""
+
+    global _shared_lookup
+    _shared_lookup = None
+
+
+if __name__ == "__main__":
+    import time
+
+    lookup = get_classification_lookup()
+
+    start = time.perf_counter()
+    lookup.lookup_genre(["the daily"])
+    first_ms = (time.perf_counter() - start) * 1000
+
+    ids = np.array(list(lookup.genre_index.index) * 1000, dtype=object)
+    start = time.perf_counter()
+    genres = lookup.lookup_genre(ids)
+    countries = lookup.lookup_country(ids)
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    print("\nCLASSIFICATION LOOKUP SERVICE")
+    print("=" * 40)
+    print(f"Genre keys: {len(lookup.genre_index)} | Country keys: {len(lookup.country_index)}")
+    print(f"First lookup (loads mappings): {first_ms:.1f} ms")
+    print(f"Batch lookup of {len(ids):,} ids (genre + country): {batch_ms:.1f} ms")
+    print(f"Other genres / Unknown countries in batch: "
+          f"{(genres == GENRE_DEFAULT).sum():,} / {(countries == COUNTRY_DEFAULT).sum():,}")
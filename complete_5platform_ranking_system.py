@@ -5,38 +5,18 @@ Includes: Spotify, YouTube, Amazon, Apple, iHeart
 """
 
 import pandas as pd
-import numpy as np
-import re
 from pathlib import Path
 
-def normalize_show_name(name):
-    """Normalize show name for matching across platforms."""
-    if pd.isna(name):
-        return ""
-
-    # Convert to string and lowercase
-    normalized = str(name).strip().lower()
-
-    # Remove common podcast suffixes and qualifiers
-    patterns_to_remove = [
-        r'\bpodcast\b',
-        r'\bshow\b',
-        r'\bthe podcast\b',
-        r'\bthe show\b',
-        r'\bwith\s+[^,]+$',  # "with [host name]" at end
-        r'\bw/\s+[^,]+$',    # "w/ [host name]" at end
-    ]
-
-    for pattern in patterns_to_remove:
-        normalized = re.sub(pattern, '', normalized)
-
-    # Remove all non-word/space characters
-    normalized = re.sub(r"[^\w\s]", "", normalized)
+from genre_taxonomy import get_genre_taxonomy, standardize_genres
+from scoring_engine import DEFAULT_PROFILE, GEOGRAPHIC_FACTORS, WEIGHT_PROFILES, composite_scores
+from show_name_normalization import normalize_show_name
 
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
+# Standardize genre names to our target categories (standard level of the genre taxonomy)
+GENRE_STANDARDIZATION = get_genre_taxonomy().mapping("standard")
 
-    return normalized.strip()
+# Composite score component weights: 65% consumption, 20% platform reach,
+# 5% platform count, 10% within-genre popularity (scoring_engine.WEIGHT_PROFILES)
+COMPOSITE_WEIGHTS = WEIGHT_PROFILES[DEFAULT_PROFILE]
 
 def load_all_platform_data():
     """Load and normalize data from all 5 platforms."""
@@ -133,34 +113,13 @@ def load_updated_mappings():
     try:
         genre_mapping = pd.read_csv("final_genre_mapping_complete_all.csv")
 
-        # Standardize genre names to our target categories
-        genre_standardization = {
-            "True Crime": "True Crime",
-            "Comedy": "Comedy",
-            "News": "News & Politics",
-            "News & Politics": "News & Politics",
-            "Society & Culture": "Society & Culture",
-            "Education": "Education",
-            "History": "Education",  # Merge History into Education
-            "Interview & Talk": "Interview & Talk",
-            "Kids & Family": "Education",  # Merge Kids into Education
-            "Leisure": "Entertainment",  # Merge Leisure into Entertainment
-            "Fiction": "Entertainment",  # Merge Fiction into Entertainment
-            "Entertainment": "Entertainment",
-            "Sports": "Sports",
-            "Business": "Business",
-            "Religion & Spirituality": "Society & Culture",  # Merge into Society & Culture
-            "TV & Film": "Entertainment",  # Merge into Entertainment
-            "Arts": "Entertainment"  # Merge into Entertainment
-        }
-
-        genre_mapping["standardized_genre"] = genre_mapping["genre"].map(genre_standardization).fillna("Other")
+        genre_mapping["standardized_genre"], _ = standardize_genres(genre_mapping["genre"], "standard", "Other")
         genre_map = dict(zip(genre_mapping["normalized_name"], genre_mapping["standardized_genre"]))
         print(f"   ✓ Loaded comprehensive genre mapping: {len(genre_map)} shows")
     except FileNotFoundError:
         try:
             genre_mapping = pd.read_csv("final_genre_mapping.csv")
-            genre_mapping["standardized_genre"] = genre_mapping["genre"].map(genre_standardization).fillna("Other")
+            genre_mapping["standardized_genre"], _ = standardize_genres(genre_mapping["genre"], "standard", "Other")
             genre_map = dict(zip(genre_mapping["normalized_name"], genre_mapping["standardized_genre"]))
             print(f"   ✓ Loaded final genre mapping: {len(genre_map)} shows")
         except FileNotFoundError:
@@ -242,22 +201,37 @@ def create_comprehensive_classification_updates():
 
     return country_updates, genre_updates
 
-def create_unified_5platform_ranking():
-    """Create unified ranking across all 5 platforms with advanced scoring."""
+def create_unified_5platform_ranking(mappings=None, multi_label_genres=False, top_k=None):
+    """Create unified ranking across all 5 platforms with advanced scoring.
+
+    mappings: optional (country_map, genre_map) pair, e.g. from a mapping
+    snapshot, used instead of the current mapping files.
+    multi_label_genres: score within-genre popularity over weighted genre
+    membership from compound source labels (e.g. "Comedy & Sports").
+    top_k: return only the top k shows (e.g. 25 for the eligibility list);
+    shows that cannot reach the top k are not fully scored or sorted.
+    """
 
     print("\nCREATING UNIFIED 5-PLATFORM RANKING")
     print("=" * 50)
 
     # Load data
     spotify, youtube, amazon, apple, iheart = load_all_platform_data()
-    country_map, genre_map = load_updated_mappings()
 
-    # Get classification updates
-    country_updates, genre_updates = create_comprehensive_classification_updates()
+    # Mappings are parsed once per process by the shared lookup service
+    from classification_lookup import ClassificationLookup, get_classification_lookup
 
-    # Apply updates to mappings
-    country_map.update(country_updates)
-    genre_map.update(genre_updates)
+    if mappings is None:
+        lookup = get_classification_lookup()
+    else:
+        country_map, genre_map = (dict(m) for m in mappings)
+
+        # Apply classification updates to the given mappings
+        country_updates, genre_updates = create_comprehensive_classification_updates()
+        country_map.update(country_updates)
+        genre_map.update(genre_updates)
+
+        lookup = ClassificationLookup.from_maps(country_map, genre_map)
 
     # Get all unique shows across all platforms
     all_shows = set()
@@ -332,8 +306,8 @@ def create_unified_5platform_ranking():
             ranking_df[col] = 0
 
     # Add country and genre information
-    ranking_df["country"] = ranking_df["show_name"].map(country_map).fillna("Unknown")
-    ranking_df["genre"] = ranking_df["show_name"].map(genre_map).fillna("Other")
+    ranking_df["country"] = lookup.lookup_country(ranking_df["show_name"])
+    ranking_df["genre"] = lookup.lookup_genre(ranking_df["show_name"])
 
     # Calculate platform presence
     ranking_df["platforms_present"] = (
@@ -352,8 +326,8 @@ def create_unified_5platform_ranking():
     # YouTube: 7.5% factor (global -> US estimate, additional 50% discount applied)
     # Amazon: 65% factor (global -> US estimate)
     # Spotify, Apple, iHeart: 100% (already US-only data)
-    ranking_df["youtube_views_us"] = ranking_df["youtube_views"] * 0.075
-    ranking_df["amazon_plays_us"] = ranking_df["amazon_plays"] * 0.65
+    ranking_df["youtube_views_us"] = ranking_df["youtube_views"] * GEOGRAPHIC_FACTORS["youtube_views"]
+    ranking_df["amazon_plays_us"] = ranking_df["amazon_plays"] * GEOGRAPHIC_FACTORS["amazon_plays"]
 
     # Calculate total consumption (normalized to US market)
     ranking_df["total_consumption"] = (
@@ -364,101 +338,78 @@ def create_unified_5platform_ranking():
         ranking_df["iheart_streams"]
     )
 
-    # 1. Total Consumption Score (65% weight)
-    max_consumption = ranking_df["total_consumption"].max()
-    ranking_df["consumption_score"] = (ranking_df["total_consumption"] / max_consumption * 100)
-
-    # 2. Platform Reach Score (20% weight) - Best single platform performance
-    # Use US-adjusted values for YouTube and Amazon
-    platform_scores = []
-    for _, row in ranking_df.iterrows():
-        scores = []
-        if row["spotify_plays"] > 0:
-            scores.append(row["spotify_plays"] / ranking_df["spotify_plays"].max() * 100)
-        if row["youtube_views_us"] > 0:
-            scores.append(row["youtube_views_us"] / ranking_df["youtube_views_us"].max() * 100)
-        if row["amazon_plays_us"] > 0:
-            scores.append(row["amazon_plays_us"] / ranking_df["amazon_plays_us"].max() * 100)
-        if row["apple_plays"] > 0:
-            scores.append(row["apple_plays"] / ranking_df["apple_plays"].max() * 100)
-        if row["iheart_streams"] > 0:
-            scores.append(row["iheart_streams"] / ranking_df["iheart_streams"].max() * 100)
-
-        platform_scores.append(max(scores) if scores else 0)
-
-    ranking_df["platform_reach_score"] = platform_scores
-
-    # 3. Platform Count Score (5% weight)
-    max_platforms = ranking_df["platforms_present"].max()
-    ranking_df["platform_count_score"] = (ranking_df["platforms_present"] / max_platforms * 100)
-
-    # 4. Within-Genre Popularity Score (10% weight) - Consumption-based
-    genre_scores = []
-    for _, row in ranking_df.iterrows():
-        genre = row["genre"]
-        genre_shows = ranking_df[ranking_df["genre"] == genre]
-
-        if len(genre_shows) > 1:
-            # Consumption-based percentile within genre
-            genre_rank = (genre_shows["total_consumption"] <= row["total_consumption"]).mean() * 100
-        else:
-            # Single show in genre gets full score
-            genre_rank = 100.0
-
-        genre_scores.append(genre_rank)
-
-    ranking_df["genre_rank_score"] = genre_scores
+    # Component scores, vectorized (scoring_engine.py):
+    # 1. Total Consumption Score - total consumption as a share of the maximum
+    # 2. Platform Reach Score - best single platform performance, using the
+    #    US-adjusted values for YouTube and Amazon
+    # 3. Platform Count Score - platforms present as a share of the maximum
+    # 4. Within-Genre Popularity Score - percentile of total consumption within
+    #    the show's genre(s); a genre with a single show gets full score
+    from genre_membership import load_source_genre_labels
+    from scoring_engine import COMPONENT_COLUMNS, component_scores, top_k_ranking
+
+    source_labels = load_source_genre_labels() if multi_label_genres else None
+
+    if top_k is not None:
+        # Partial ranking: bounded scores, only the candidates that can reach the top k are scored
+        shows_scored = len(ranking_df)
+        ranking_df, candidates = top_k_ranking(ranking_df, top_k, COMPOSITE_WEIGHTS, source_labels)
+        print(f"Top-{top_k} mode: {candidates} of {shows_scored} shows can reach the top {top_k} "
+              f"(within-genre percentiles computed for those only)")
+        print(f"Final 5-platform top {top_k}: {len(ranking_df)} shows")
+    else:
+        scores = component_scores(ranking_df, source_labels)
+        for column in COMPONENT_COLUMNS:
+            ranking_df[column] = scores[column]
 
-    # Final Composite Score: Weighted sum of four components
-    ranking_df["composite_score"] = (
-        ranking_df["consumption_score"] * 0.65 +     # 65% total consumption
-        ranking_df["platform_reach_score"] * 0.2 +   # 20% platform reach
-        ranking_df["platform_count_score"] * 0.05 +  # 5% platform count
-        ranking_df["genre_rank_score"] * 0.1         # 10% within-genre popularity
-    )
+        # Final Composite Score: Weighted sum of four components
+        ranking_df["composite_score"] = composite_scores(ranking_df, {DEFAULT_PROFILE: COMPOSITE_WEIGHTS})[DEFAULT_PROFILE]
 
-    # Final ranking
-    ranking_df = ranking_df.sort_values("composite_score", ascending=False)
-    ranking_df["rank"] = range(1, len(ranking_df) + 1)
+        # Final ranking
+        ranking_df = ranking_df.sort_values("composite_score", ascending=False)
+        ranking_df["rank"] = range(1, len(ranking_df) + 1)
 
-    print(f"Final 5-platform rankings: {len(ranking_df)} shows")
+        print(f"Final 5-platform rankings: {len(ranking_df)} shows")
 
     # Display top rankings
-    print(f"\nTOP 15 US-NORMALIZED 5-PLATFORM PODCAST RANKINGS:")
+    top = ranking_df.head(15)
+    print(f"\nTOP {len(top)} US-NORMALIZED 5-PLATFORM PODCAST RANKINGS:")
     print("=" * 75)
 
-    top_15 = ranking_df.head(15)
-    for _, row in top_15.iterrows():
-        platforms = []
-        metrics = []
-
-        if row["spotify_plays"] > 0:
-            platforms.append("Spotify")
-            metrics.append(f"Spotify: {row['spotify_plays']:,.0f} plays")
-        if row["youtube_views"] > 0:
-            platforms.append("YouTube")
-            metrics.append(f"YouTube: {row['youtube_views_us']:,.0f} US est. ({row['youtube_views']:,.0f} global)")
-        if row["amazon_plays"] > 0:
-            platforms.append("Amazon")
-            metrics.append(f"Amazon: {row['amazon_plays_us']:,.0f} US est. ({row['amazon_plays']:,.0f} global)")
-        if row["apple_plays"] > 0:
-            platforms.append("Apple")
-            metrics.append(f"Apple: {row['apple_plays']:,.0f} plays")
-        if row["iheart_streams"] > 0:
-            platforms.append("iHeart")
-            metrics.append(f"iHeart: {row['iheart_streams']:,.0f} streams")
-
-        print(f"{row['rank']:2d}. {row['show_name'].title()}")
-        print(f"    Score: {row['composite_score']:.1f} | Genre: {row['genre']} | Country: {row['country']}")
+    # Platform presence and metric text per platform, as columns over the shown rows
+    platform_metrics = {
+        "Spotify": (top["spotify_plays"] > 0,
+                    [f"Spotify: {plays:,.0f} plays" for plays in top["spotify_plays"]]),
+        "YouTube": (top["youtube_views"] > 0,
+                    [f"YouTube: {us:,.0f} US est. ({views:,.0f} global)"
+                     for us, views in zip(top["youtube_views_us"], top["youtube_views"])]),
+        "Amazon": (top["amazon_plays"] > 0,
+                   [f"Amazon: {us:,.0f} US est. ({plays:,.0f} global)"
+                    for us, plays in zip(top["amazon_plays_us"], top["amazon_plays"])]),
+        "Apple": (top["apple_plays"] > 0,
+                  [f"Apple: {plays:,.0f} plays" for plays in top["apple_plays"]]),
+        "iHeart": (top["iheart_streams"] > 0,
+                   [f"iHeart: {streams:,.0f} streams" for streams in top["iheart_streams"]]),
+    }
+    present = {platform: mask.to_numpy() for platform, (mask, _) in platform_metrics.items()}
+
+    rows = zip(top["rank"], top["show_name"], top["composite_score"], top["genre"],
+               top["country"], top["total_consumption"])
+    for i, (rank, show_name, score, genre, country, consumption) in enumerate(rows):
+        platforms = [platform for platform in platform_metrics if present[platform][i]]
+        metrics = [platform_metrics[platform][1][i] for platform in platforms]
+
+        print(f"{rank:2d}. {show_name.title()}")
+        print(f"    Score: {score:.1f} | Genre: {genre} | Country: {country}")
         print(f"    Platforms: {len(platforms)} ({', '.join(platforms)})")
-        print(f"    Total Consumption: {row['total_consumption']:,.0f}")
+        print(f"    Total Consumption: {consumption:,.0f}")
         if metrics:
             print(f"    Top Metrics: {' | '.join(metrics[:3])}")  # Show top 3 metrics
         print()
 
     return ranking_df
 
-def save_final_5platform_ranking(ranking_df):
+def save_final_5platform_ranking(ranking_df, path="final_5platform_podcast_rankings.csv"):
     """Save the final comprehensive 5-platform ranking."""
 
     print("SAVING FINAL 5-PLATFORM RANKING")
@@ -474,9 +425,9 @@ def save_final_5platform_ranking(ranking_df):
 
     # Save to CSV
     final_ranking = ranking_df[output_columns]
-    final_ranking.to_csv("final_5platform_podcast_rankings.csv", index=False)
+    final_ranking.to_csv(path, index=False)
 
-    print(f"✅ Saved final ranking: final_5platform_podcast_rankings.csv")
+    print(f"✅ Saved final ranking: {path}")
     print(f"   Total shows ranked: {len(final_ranking)}")
 
     # Show comprehensive statistics
@@ -505,13 +456,22 @@ def save_final_5platform_ranking(ranking_df):
     return final_ranking
 
 if __name__ == "__main__":
+    # python complete_5platform_ranking_system.py [--top K]
+    import sys
+
+    top_k = int(sys.argv[sys.argv.index("--top") + 1]) if "--top" in sys.argv else None
+    if top_k is not None and top_k < 1:
+        print(f"--top needs a positive number of shows, got {top_k}")
+        sys.exit(1)
+    output_file = f"top{top_k}_5platform_podcast_rankings.csv" if top_k else "final_5platform_podcast_rankings.csv"
+
     # Create comprehensive 5-platform ranking
-    ranking_df = create_unified_5platform_ranking()
+    ranking_df = create_unified_5platform_ranking(top_k=top_k)
 
     # Save final results
-    final_ranking = save_final_5platform_ranking(ranking_df)
+    final_ranking = save_final_5platform_ranking(ranking_df, output_file)
 
     print(f"\n🎯 COMPLETE 5-PLATFORM PODCAST RANKING SYSTEM FINISHED!")
-    print(f"   📋 Final CSV: final_5platform_podcast_rankings.csv")
+    print(f"   📋 Final CSV: {output_file}")
     print(f"   🌟 {len(final_ranking)} globally ranked podcasts across 5 platforms")
     print(f"   🚀 Ready for comprehensive cross-platform analysis!")
\ No newline at end of file
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Compiled word-boundary country extractor for research text
+
+All country terms are compiled into one trie-shaped regular expression with
+word boundaries, longer terms preferred, so a single scan finds every mention
+("south korea" before "korea", "uk" never inside "ukraine" or "duke").
+Hits are counted per country and the most-mentioned country wins, ties going
+to the earliest mention. Batches of documents go through pandas' str.findall.
+Region phrases ("latin american", "south america") are matched as terms of
+their own so they never count for a country, and extract_country() removes
+the show's own title from the text first ("United States of Kennedy").
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# Country terms as they appear in English research text. "african" is not a
+# country indicator ("African American" is not ZA) and is left out.
+COUNTRY_TERMS = {
+    "united states": "US", "u.s.": "US", "usa": "US", "america": "US", "american": "US",
+    "united kingdom": "GB", "u.k.": "GB", "uk": "GB", "britain": "GB", "british": "GB", "england": "GB",
+    "canada": "CA", "canadian": "CA",
+    "australia": "AU", "australian": "AU",
+    "germany": "DE", "german": "DE",
+    "france": "FR", "french": "FR",
+    "spain": "ES", "spanish": "ES",
+    "italy": "IT", "italian": "IT",
+    "japan": "JP", "japanese": "JP",
+    "south korea": "KR", "korea": "KR", "korean": "KR",
+    "india": "IN", "indian": "IN",
+    "china": "CN", "chinese": "CN",
+    "russia": "RU", "russian": "RU",
+    "brazil": "BR", "brazilian": "BR",
+    "mexico": "MX", "mexican": "MX",
+    "argentina": "AR", "argentine": "AR",
+    "colombia": "CO", "colombian": "CO",
+    "chile": "CL", "chilean": "CL",
+    "peru": "PE", "peruvian": "PE",
+    "netherlands": "NL", "dutch": "NL",
+    "sweden": "SE", "swedish": "SE",
+    "norway": "NO", "norwegian": "NO",
+    "denmark": "DK", "danish": "DK",
+    "finland": "FI", "finnish": "FI",
+    "poland": "PL", "polish": "PL",
+    "ukraine": "UA", "ukrainian": "UA",
+    "indonesia": "ID", "indonesian": "ID",
+    "thailand": "TH", "thai": "TH",
+    "singapore": "SG",
+    "malaysia": "MY", "malaysian": "MY",
+    "philippines": "PH", "filipino": "PH",
+    "vietnam": "VN", "vietnamese": "VN",
+    "turkey": "TR", "turkish": "TR",
+    "israel": "IL", "israeli": "IL",
+    "egypt": "EG", "egyptian": "EG",
+    "south africa": "ZA", "south african": "ZA",
+    "new zealand": "NZ", "zealand": "NZ",
+    "ireland": "IE", "irish": "IE",
+    "portugal": "PT", "portuguese": "PT",
+    "belgium": "BE", "belgian": "BE",
+    "austria": "AT", "austrian": "AT",
+    "switzerland": "CH", "swiss": "CH",
+    "czech": "CZ", "slovakia": "SK", "hungary": "HU",
+    "romania": "RO", "bulgaria": "BG", "croatia": "HR",
+    "greece": "GR", "greek": "GR",
+}
+
+# Regions that contain a country term. They are compiled with the country
+# terms so the longer phrase wins, but count for no country.
+REGION_TERMS = {
+    f"{region} {term}": None
+    for region in ["latin", "south", "central", "north"]
+    for term in ["america", "american", "americans"]
+}
+
+# Country code -> readable name (the first term listed for each code)
+COUNTRY_NAMES = {code: term.title() for term, code in reversed(list(COUNTRY_TERMS.items()))}
+
+# Hosts, networks and formats in a show name that give away its country
+SHOW_NAME_INDICATORS = {
+    "conan obrien": "US",
+    "howard stern": "US",
+    "joe rogan": "US",
+    "marc maron": "US",
+    "bill maher": "US",
+    "snl": "US",
+    "saturday night live": "US",
+    "late night": "US",
+    "tonight show": "US",
+    "daily show": "US",
+    "npr": "US",
+    "pbs": "US",
+    "cbc": "CA",
+    "bbc": "GB",
+    "abc": "US",
+    "nbc": "US",
+    "cbs": "US",
+    "fox": "US",
+    "cnn": "US",
+    "espn": "US",
+}
+
+
+def _normalize_term(term):
+    return re.sub(r"\s+", " ", term.lower())
+
+
+def _trie_pattern(node):
+    """Regex for a character trie: shared prefixes are matched once, longer terms first."""
+
+    branches = [(r"\s+" if char == " " else re.escape(char)) + _trie_pattern(child)
+                for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # A term ending here is optional-greedy: the longer continuation is tried first
+    return f"(?:{body})?" if "" in node else body
+
+
+class CountryExtractor:
+    """One compiled pattern over all terms; term -> country lookup on each hit."""
+
+    def __init__(self, terms=COUNTRY_TERMS):
+        self.term_codes = {_normalize_term(term): code for term, code in terms.items()}
+
+        # Terms are compiled as a trie so the scan tests each prefix once and
+        # prefers "south korea" over "korea"; (?!\w) instead of a trailing \b
+        # so terms ending in "." ("u.s.") still match. Texts are lowercased first.
+        trie = {}
+        for term in self.term_codes:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self.pattern = re.compile(rf"\b(?:{_trie_pattern(trie)})(?!\w)")
+
+    def _code(self, match):
+        return self.term_codes[_normalize_term(match)]
+
+    def counts(self, text):
+        """Country -> number of mentions in one text, in order of first mention."""
+
+        hits = {}
+        for match in self.pattern.findall((text or "").lower()):
+            code = self._code(match)
+            if code is not None:
+                hits[code] = hits.get(code, 0) + 1
+        return hits
+
+    def extract(self, text):
+        """Most-mentioned country in one text (earliest wins ties), None if none."""
+
+        hits = self.counts(text)
+        return max(hits, key=hits.get) if hits else None
+
+    def count_batch(self, texts):
+        """Long table of (doc, country, hits) for a batch of texts, in first-mention order."""
+
+        texts = pd.Series(texts, dtype=object).reset_index(drop=True).fillna("").astype(str)
+        matches = texts.str.lower().str.findall(self.pattern).explode().dropna()
+
+        codes = matches.map(self._code).dropna()
+        hits = codes.groupby([codes.index, codes.to_numpy()], sort=False).size()
+        hits.index.names = ["doc", "country"]
+        return hits.rename("hits").reset_index()
+
+    def extract_batch(self, texts):
+        """Most-mentioned country per text (None where no country is mentioned)."""
+
+        texts = pd.Series(texts, dtype=object)
+        hits = self.count_batch(texts)
+
+        result = pd.Series(np.full(len(texts), None, dtype=object))
+        if not hits.empty:
+            best = hits.loc[hits.groupby("doc", sort=False)["hits"].idxmax()]
+            result[best["doc"].to_numpy()] = best["country"].to_numpy()
+
+        result.index = texts.index
+        return result
+
+
+COUNTRY_EXTRACTOR = CountryExtractor({**COUNTRY_TERMS, **REGION_TERMS})
+SHOW_NAME_EXTRACTOR = CountryExtractor(SHOW_NAME_INDICATORS)
+
+
+def strip_show_name(text, show_name):
+    """Text with every mention of the show's title removed.
+
+    Punctuation the normalized name lost may appear between its letters
+    ("allin" matches "All-In"), and any run of non-word characters between
+    its words.
+    """
+
+    words = re.findall(r"\w+", str(show_name).lower())
+    if not text or not words:
+        return text
+
+    letters = r"[^\w\s]*".join
+    pattern = r"\W+".join(letters(re.escape(char) for char in word) for word in words)
+    return re.sub(rf"\b{pattern}(?!\w)", " ", text, flags=re.IGNORECASE)
+
+
+def extract_country(text, show_name=None):
+    """Country from research text, falling back to indicators in the show name.
+
+    The show's own title is removed from the text first, so a title alone
+    ("United States of Kennedy") is not evidence of a country.
+    """
+
+    if show_name:
+        text = strip_show_name(text, show_name)
+    return COUNTRY_EXTRACTOR.extract(text) or (
+        SHOW_NAME_EXTRACTOR.extract(show_name) if show_name else None)
+
+
+if __name__ == "__main__":
+    import time
+
+    samples = pd.Series([
+        "An American podcast hosted by a former UK journalist, recorded in the United States.",
+        "The Duke of Ukraine: a Ukrainian history show",
+        "African American culture podcast from Atlanta",
+        "A Latin American true crime podcast, popular across South America",
+        "Produced in South Korea by a Korean broadcaster",
+        "A U.S. comedy podcast",
+        "No location here",
+    ])
+
+    print("COUNTRY EXTRACTOR")
+    print("=" * 50)
+    for text, country in zip(samples, COUNTRY_EXTRACTOR.extract_batch(samples)):
+        print(f"  {country or '-':<4} {text}")
+
+    corpus = pd.concat([samples] * 20_000, ignore_index=True)
+    start = time.perf_counter()
+    COUNTRY_EXTRACTOR.extract_batch(corpus)
+    elapsed = time.perf_counter() - start
+    size_mb = corpus.str.len().sum() / 1e6
+    print(f"\nExtracted {len(corpus):,} documents ({size_mb:.1f} MB) in {elapsed:.2f} s")
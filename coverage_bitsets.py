@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Bitset coverage analytics across shows, mappings and platforms
+
+Keeps the show universe as a sorted array of normalized names (the position
+in the array is the show_id) and every attribute's presence as a packed
+bitset over show_id. Coverage and gap questions become vectorized bit
+operations instead of Python set rebuilds and iterrows loops.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from classification_lookup import get_classification_lookup
+from complete_5platform_ranking_system import load_all_platform_data
+
+PLATFORM_NAMES = ["spotify", "youtube", "amazon", "apple", "iheart"]
+
+
+def build_show_universe(*name_collections):
+    """Build the sorted show universe; a show's position is its show_id."""
+
+    names = [pd.Series(collection, dtype=object) for collection in name_collections]
+    all_names = pd.concat(names, ignore_index=True).dropna()
+    all_names = all_names[all_names != ""]
+
+    return np.sort(all_names.unique().astype(str))
+
+
+def presence_bitset(universe, names):
+    """Packed bitset marking which shows in the universe appear in names."""
+
+    names = pd.Series(names, dtype=object).dropna().unique().astype(str)
+    return np.packbits(np.isin(universe, names))
+
+
+def mask_bitset(universe, mask_by_name):
+    """Packed bitset from a boolean Series indexed by normalized name."""
+
+    flags = mask_by_name[mask_by_name].index.unique()
+    return presence_bitset(universe, flags)
+
+
+def popcount(bits):
+    """Number of set bits in a packed bitset."""
+
+    return int(np.bitwise_count(bits).sum())
+
+
+def bits_to_names(universe, bits):
+    """Normalized names of the shows whose bit is set."""
+
+    flags = np.unpackbits(bits, count=len(universe)).astype(bool)
+    return universe[flags].tolist()
+
+
+def build_coverage_bitsets(platform_data=None, mappings=None):
+    """Build the show universe and one packed bitset per attribute."""
+
+    if platform_data is None:
+        platform_data = load_all_platform_data()
+
+    if mappings is None:
+        lookup = get_classification_lookup()
+        country_map, genre_map = lookup.country_map(), lookup.genre_map()
+    else:
+        country_map, genre_map = mappings
+
+    platform_names = {
+        platform: (df["normalized_name"] if not df.empty else pd.Series(dtype=object))
+        for platform, df in zip(PLATFORM_NAMES, platform_data)
+    }
+
+    universe = build_show_universe(
+        *platform_names.values(), list(country_map.keys()), list(genre_map.keys())
+    )
+
+    bitsets = {}
+    for platform, names in platform_names.items():
+        bitsets[f"on_{platform}"] = presence_bitset(universe, names)
+
+    bitsets["in_platform_data"] = np.bitwise_or.reduce(
+        [bitsets[f"on_{platform}"] for platform in PLATFORM_NAMES]
+    )
+
+    genre_series = pd.Series(genre_map, dtype=object)
+    country_series = pd.Series(country_map, dtype=object)
+
+    bitsets["has_genre"] = mask_bitset(universe, genre_series.notna() & (genre_series != "Other"))
+    bitsets["has_country"] = mask_bitset(universe, country_series.notna() & (country_series != "Unknown"))
+    bitsets["in_genre_mapping"] = presence_bitset(universe, genre_series.index)
+    bitsets["in_country_mapping"] = presence_bitset(universe, country_series.index)
+
+    # Ranked shows without a usable label end up as "Other" / "Unknown".
+    # Complements are always ANDed with a real bitset so padding bits stay 0.
+    bitsets["genre_other"] = bitsets["in_platform_data"] & ~bitsets["has_genre"]
+    bitsets["country_unknown"] = bitsets["in_platform_data"] & ~bitsets["has_country"]
+
+    return universe, bitsets
+
+
+def coverage_report(universe, bitsets):
+    """Summarize attribute coverage and per-platform gaps with bit operations."""
+
+    ranked = bitsets["in_platform_data"]
+    total = popcount(ranked)
+
+    rows = []
+    for platform in ["in_platform_data"] + [f"on_{p}" for p in PLATFORM_NAMES]:
+        shows = bitsets[platform]
+        n_shows = popcount(shows)
+        missing_genre = popcount(shows & ~bitsets["has_genre"])
+        missing_country = popcount(shows & ~bitsets["has_country"])
+
+        rows.append({
+            "scope": platform,
+            "shows": n_shows,
+            "missing_genre": missing_genre,
+            "missing_country": missing_country,
+            "missing_both": popcount(shows & ~bitsets["has_genre"] & ~bitsets["has_country"]),
+            "genre_coverage_pct": (n_shows - missing_genre) / n_shows * 100 if n_shows else 0.0,
+            "country_coverage_pct": (n_shows - missing_country) / n_shows * 100 if n_shows else 0.0,
+        })
+
+    report = pd.DataFrame(rows)
+
+    summary = {
+        "universe": len(universe),
+        "platform_shows": total,
+        "genre_mapping_only": popcount(bitsets["in_genre_mapping"] & ~ranked),
+        "country_mapping_only": popcount(bitsets["in_country_mapping"] & ~ranked),
+        "multi_platform_gaps": popcount(
+            multi_platform_bitset(bitsets) & ~(bitsets["has_genre"] & bitsets["has_country"])
+        ),
+    }
+
+    return report, summary
+
+
+def multi_platform_bitset(bitsets, min_platforms=2):
+    """Bitset of shows present on at least min_platforms platforms."""
+
+    platform_bits = np.stack([bitsets[f"on_{p}"] for p in PLATFORM_NAMES])
+    counts = np.unpackbits(platform_bits, axis=1).sum(axis=0)
+    return np.packbits(counts >= min_platforms)
+
+
+if __name__ == "__main__":
+    universe, bitsets = build_coverage_bitsets()
+
+    start = time.perf_counter()
+    report, summary = coverage_report(universe, bitsets)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print("\nBITSET COVERAGE REPORT")
+    print("=" * 40)
+    print(f"Show universe: {summary['universe']} shows")
+    print(f"Shows in platform data: {summary['platform_shows']}")
+    print(f"Genre mapping keys outside platform data: {summary['genre_mapping_only']}")
+    print(f"Country mapping keys outside platform data: {summary['country_mapping_only']}")
+    print(f"Multi-platform shows with a gap: {summary['multi_platform_gaps']}")
+    print()
+    print(report.to_string(index=False, float_format=lambda x: f"{x:.1f}"))
+
+    gaps = bits_to_names(universe, bitsets["genre_other"])
+    print(f"\nPlatform shows classified as 'Other' genre: {len(gaps)}")
+    for i, show in enumerate(gaps[:10], 1):
+        print(f"  {i:2d}. {show}")
+    if len(gaps) > 10:
+        print(f"  ... and {len(gaps) - 10} more")
+
+    print(f"\nCoverage report computed in {elapsed_ms:.2f} ms")
@@ -4,22 +4,9 @@ Create comprehensive country mapping from explicit data + Wikipedia research
 """
 
 import pandas as pd
-import re
 from pathlib import Path
 
-def normalize_show_name(name):
-    """Normalize show name for matching - consistent with ranking system."""
-    if pd.isna(name):
-        return ""
-
-    # Apply same normalization as ranking system
-    normalized = str(name).strip().lower()
-    # Remove all non-word/space characters
-    normalized = re.sub(r"[^\w\s]", "", normalized)
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    return normalized.strip()
+from show_name_normalization import normalize_show_name
 
 def create_comprehensive_country_mapping():
     """Create comprehensive country mapping from explicit data + Wikipedia research."""
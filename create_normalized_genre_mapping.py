@@ -4,16 +4,8 @@ Create normalized genre mapping for the ranking system
 """
 
 import pandas as pd
-import re
-
-def normalize_show_name(name):
-    """Normalize show name for matching."""
-    if pd.isna(name):
-        return ""
-    normalized = str(name).lower().strip()
-    normalized = re.sub(r'[^\w\s]', '', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized)
-    return normalized
+
+from show_name_normalization import normalize_show_name
 
 # Load refined genre data
 genre_df = pd.read_csv('data_refined_genres/refined_genre_master.csv')
@@ -6,20 +6,8 @@ Create unified genre mapping from platform data + Tavily research
 import pandas as pd
 from pathlib import Path
 
-def normalize_show_name(name):
-    """Normalize show name for matching - consistent with ranking system."""
-    if pd.isna(name):
-        return ""
-
-    # Apply same normalization as ranking system
-    normalized = str(name).strip().lower()
-    # Remove all non-word/space characters (same as ranking system regex)
-    import re
-    normalized = re.sub(r"[^\w\s]", "", normalized)
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    return normalized.strip()
+from genre_rule_engine import classify_genre_text, classify_genre_texts
+from show_name_normalization import normalize_show_name
 
 def is_valid_genre(genre_text):
     """Check if a platform category is actually a genre (not ranking/status)."""
@@ -122,44 +110,8 @@ def load_existing_research():
 def map_to_standard_genres(genre_text):
     """Map any genre text to our 8 standard categories."""
 
-    if pd.isna(genre_text) or not genre_text:
-        return "Other"
-
-    genre_lower = str(genre_text).lower()
-
-    # True Crime
-    if any(term in genre_lower for term in ['true crime', 'crime', 'murder', 'mystery']):
-        return "True Crime"
-
-    # News & Politics
-    if any(term in genre_lower for term in ['news', 'politics', 'political', 'current events']):
-        return "News & Politics"
-
-    # Comedy
-    if any(term in genre_lower for term in ['comedy', 'humor', 'funny', 'comedic']):
-        return "Comedy"
-
-    # Interview & Talk
-    if any(term in genre_lower for term in ['interview', 'talk', 'conversation', 'chat']):
-        return "Interview & Talk"
-
-    # Sports
-    if any(term in genre_lower for term in ['sports', 'football', 'basketball', 'baseball', 'athletic']):
-        return "Sports"
-
-    # Business
-    if any(term in genre_lower for term in ['business', 'finance', 'financial', 'investing', 'money', 'entrepreneurship']):
-        return "Business"
-
-    # Education
-    if any(term in genre_lower for term in ['education', 'science', 'learning', 'academic', 'history', 'psychology']):
-        return "Education"
-
-    # Entertainment
-    if any(term in genre_lower for term in ['entertainment', 'pop culture', 'celebrity', 'lifestyle', 'variety']):
-        return "Entertainment"
-
-    return "Other"
+    # Keyword rules run as one Aho-Corasick pass (see genre_rule_engine)
+    return classify_genre_text(genre_text)
 
 def create_union_mapping():
     """Create comprehensive union of all genre sources."""
@@ -182,6 +134,12 @@ def create_union_mapping():
 
     print(f"\nTotal unique shows across all sources: {len(all_shows)}")
 
+    # Map all platform genre texts to standard genres in one batch
+    platform_standard = dict(zip(
+        platform_genres.keys(),
+        classify_genre_texts([data["platform_genre"] for data in platform_genres.values()]),
+    ))
+
     # Create comprehensive mapping for each show
     for show in all_shows:
         show_data = {
@@ -210,7 +168,7 @@ def create_union_mapping():
 
         # Determine final genre (priority: Platform > Tavily > Research)
         if show_data["platform_genre"]:
-            show_data["final_genre"] = map_to_standard_genres(show_data["platform_genre"])
+            show_data["final_genre"] = platform_standard[show]
         elif show_data["tavily_genre"]:
             show_data["final_genre"] = show_data["tavily_genre"]
         elif show_data["research_genre"]:
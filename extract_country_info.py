@@ -4,22 +4,9 @@ Extract country information from all platforms and create unified country mappin
 """
 
 import pandas as pd
-import re
 from pathlib import Path
 
-def normalize_show_name(name):
-    """Normalize show name for matching - consistent with ranking system."""
-    if pd.isna(name):
-        return ""
-
-    # Apply same normalization as ranking system
-    normalized = str(name).strip().lower()
-    # Remove all non-word/space characters
-    normalized = re.sub(r"[^\w\s]", "", normalized)
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    return normalized.strip()
+from show_name_normalization import normalize_show_name
 
 def extract_country_data():
     """Extract country information from all platforms."""
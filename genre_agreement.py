@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Genre agreement between platform, research and Tavily sources
+
+union_genre_mapping.csv keeps every source's genre side by side. All source
+columns are standardized, factorized over one shared vocabulary, and the
+confusion matrices of every source pair come out of a single bincount.
+Shows where sources disagree are listed with the number of distinct genres
+they were given, so re-research can start with the most contested shows.
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from genre_rule_engine import classify_genre_texts
+from genre_taxonomy import rollup_genres
+
+SOURCE_COLUMNS = ["platform_genre", "research_genre", "tavily_genre"]
+UNION_MAPPING_FILE = "union_genre_mapping.csv"
+DISAGREEMENTS_FILE = "genre_source_disagreements.csv"
+
+
+def standardize_source_genres(values):
+    """Standard genre per source label: taxonomy rollup, keyword rules for other text."""
+
+    values = pd.Series(values, dtype=object)
+    standard = rollup_genres(values, "standard")
+
+    needs_rules = standard.isna() & values.notna() & (values != "")
+    standard[needs_rules] = classify_genre_texts(values[needs_rules])
+    return standard
+
+
+def factorize_sources(df, columns=SOURCE_COLUMNS):
+    """Codes matrix (shows x sources, -1 = no label) over one shared genre vocabulary."""
+
+    standardized = pd.concat([standardize_source_genres(df[col]) for col in columns], ignore_index=True)
+    codes, vocabulary = pd.factorize(standardized, sort=True)
+    return codes.reshape(len(columns), len(df)).T, pd.Index(vocabulary)
+
+
+def pair_confusion_matrices(codes, n_labels):
+    """Confusion counts for every source pair, shape (pairs, labels, labels), in one bincount."""
+
+    pairs = list(combinations(range(codes.shape[1]), 2))
+    if not pairs:
+        return pairs, np.zeros((0, n_labels, n_labels), dtype=np.int64)
+
+    left = codes[:, [a for a, _ in pairs]]
+    right = codes[:, [b for _, b in pairs]]
+    both = (left >= 0) & (right >= 0)
+
+    pair_ids = np.broadcast_to(np.arange(len(pairs)), left.shape)
+    flat = (pair_ids * n_labels + left) * n_labels + right
+
+    counts = np.bincount(flat[both], minlength=len(pairs) * n_labels * n_labels)
+    return pairs, counts.reshape(len(pairs), n_labels, n_labels)
+
+
+def agreement_summary(confusions, pairs, columns=SOURCE_COLUMNS):
+    """Overlap, agreement rate and Cohen's kappa per source pair."""
+
+    rows = []
+    for (a, b), confusion in zip(pairs, confusions):
+        overlap = confusion.sum()
+        agreed = np.trace(confusion)
+
+        if overlap:
+            observed = agreed / overlap
+            expected = (confusion.sum(axis=1) @ confusion.sum(axis=0)) / overlap ** 2
+            kappa = (observed - expected) / (1 - expected) if expected < 1 else 1.0
+        else:
+            observed = kappa = np.nan
+
+        rows.append({
+            "source_a": columns[a],
+            "source_b": columns[b],
+            "overlap": int(overlap),
+            "agreements": int(agreed),
+            "disagreements": int(overlap - agreed),
+            "agreement_rate": observed,
+            "kappa": kappa,
+        })
+
+    return pd.DataFrame(rows)
+
+
+def find_disagreements(df, codes, vocabulary, columns=SOURCE_COLUMNS):
+    """Shows whose sources give different standard genres, most contested first."""
+
+    labeled = codes >= 0
+    n_sources = labeled.sum(axis=1)
+
+    # Distinct genres per show: sort each row's codes (missing = -1 sorts
+    # first) and count the positions where a new genre starts
+    sorted_codes = np.sort(codes, axis=1)
+    starts = (np.diff(sorted_codes, axis=1) != 0) & (sorted_codes[:, 1:] >= 0)
+    n_genres = starts.sum(axis=1) + (sorted_codes[:, 0] >= 0)
+
+    contested = n_genres > 1
+    labels = np.append(vocabulary.to_numpy(dtype=object), np.nan)
+
+    result = pd.DataFrame({"normalized_name": df["normalized_name"].to_numpy()[contested]})
+    for position, col in enumerate(columns):
+        result[col] = labels[codes[contested, position]]
+    if "final_genre" in df.columns:
+        result["final_genre"] = df["final_genre"].to_numpy()[contested]
+    result["sources"] = n_sources[contested]
+    result["distinct_genres"] = n_genres[contested]
+
+    return result.sort_values(["distinct_genres", "sources", "normalized_name"],
+                              ascending=[False, False, True]).reset_index(drop=True)
+
+
+def analyze_genre_agreement(df=None, columns=SOURCE_COLUMNS):
+    """Confusion matrices, pair summary and disagreement list for a union mapping."""
+
+    if df is None:
+        df = pd.read_csv(UNION_MAPPING_FILE)
+
+    codes, vocabulary = factorize_sources(df, columns)
+    pairs, confusions = pair_confusion_matrices(codes, len(vocabulary))
+
+    matrices = {
+        (columns[a], columns[b]): pd.DataFrame(confusion, index=vocabulary, columns=vocabulary)
+        for (a, b), confusion in zip(pairs, confusions)
+    }
+    summary = agreement_summary(confusions, pairs, columns)
+    disagreements = find_disagreements(df, codes, vocabulary, columns)
+
+    return matrices, summary, disagreements
+
+
+if __name__ == "__main__":
+    print("GENRE SOURCE AGREEMENT")
+    print("=" * 50)
+
+    matrices, summary, disagreements = analyze_genre_agreement()
+
+    print(summary.to_string(index=False, float_format=lambda x: f"{x:.2f}"))
+
+    for (a, b), matrix in matrices.items():
+        matrix = matrix.loc[matrix.sum(axis=1) > 0, matrix.sum(axis=0) > 0]
+        if matrix.empty:
+            continue
+        print(f"\n{a} (rows) vs {b} (columns):")
+        print(matrix.to_string())
+
+    print(f"\nShows with disagreeing sources: {len(disagreements)}")
+    for _, row in disagreements.head(15).iterrows():
+        labels = " | ".join(f"{col}: {row[col]}" for col in SOURCE_COLUMNS if pd.notna(row[col]))
+        print(f"  ⚠ {row['normalized_name']:<40} {labels}")
+
+    disagreements.to_csv(DISAGREEMENTS_FILE, index=False)
+    print(f"\n✓ Disagreement list saved to {DISAGREEMENTS_FILE}")
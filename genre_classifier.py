@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Offline genre classifier trained on existing research evidence
+
+A multinomial naive Bayes model over hashed word unigrams and bigrams of
+show title, publisher and research evidence. Training data comes from the
+curated genre facts (with their evidence text), union_genre_mapping.csv and
+the final genre mapping; labels are rolled up to the standard genre level.
+Documents are kept as sparse (doc, feature, count) arrays, so training and
+batched inference are a handful of NumPy operations and run fully offline.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from classification_facts import load_facts_with_evidence
+from genre_taxonomy import rollup_genres
+from show_name_normalization import normalize_names
+
+N_FEATURES = 2 ** 18
+DEFAULT_ALPHA = 0.5
+DEFAULT_MIN_CONFIDENCE = 0.6
+
+GENRE_FACT_COLLECTIONS = [
+    "remaining_genre",
+    "tavily_genre_research",
+    "tavily_genre_additional",
+    "tavily_missing_genre",
+]
+
+# (mapping file, label column) with normalized_name keys
+GENRE_MAPPING_FILES = [
+    ("union_genre_mapping.csv", "final_genre"),
+    ("final_genre_mapping_complete_all.csv", "genre"),
+]
+
+PREDICTIONS_FILE = "genre_classifier_predictions.csv"
+
+
+def load_publishers(data_dir=Path("data")):
+    """Normalized show name -> publisher/network text from Amazon and iHeart."""
+
+    parts = []
+    for file_name, name_col, publisher_col in [
+        ("amazon.csv", "Show Title", "Publisher"),
+        ("iheart_platform_nominations.csv", "Show title", "Network"),
+    ]:
+        try:
+            df = pd.read_csv(Path(data_dir) / file_name)
+        except FileNotFoundError:
+            continue
+        parts.append(pd.DataFrame({
+            "normalized_name": normalize_names(df[name_col]),
+            "publisher": df[publisher_col].fillna("").astype(str),
+        }))
+
+    if not parts:
+        return pd.Series(dtype=object)
+
+    publishers = pd.concat(parts, ignore_index=True)
+    publishers = publishers[publishers["normalized_name"] != ""]
+    return publishers.groupby("normalized_name", sort=False)["publisher"].agg(" ".join)
+
+
+def build_training_set(publishers=None):
+    """Labeled documents: normalized_name, text (title + publisher + evidence), genre."""
+
+    if publishers is None:
+        publishers = load_publishers()
+
+    parts = []
+
+    for collection in GENRE_FACT_COLLECTIONS:
+        facts = load_facts_with_evidence(collection)
+        parts.append(pd.DataFrame({
+            "normalized_name": normalize_names(list(facts)),
+            "evidence": [evidence for _, evidence in facts.values()],
+            "label": [label for label, _ in facts.values()],
+        }))
+
+    for path, label_col in GENRE_MAPPING_FILES:
+        try:
+            mapping = pd.read_csv(path)
+        except FileNotFoundError:
+            print(f"  ⚠ Missing {path}, skipped")
+            continue
+        parts.append(pd.DataFrame({
+            "normalized_name": normalize_names(mapping["normalized_name"]),
+            "evidence": "",
+            "label": mapping[label_col],
+        }))
+
+    docs = pd.concat(parts, ignore_index=True)
+    docs["genre"] = rollup_genres(docs["label"], "standard", "Other")
+    docs = docs[(docs["normalized_name"] != "") & (docs["genre"] != "Other")]
+
+    docs["text"] = (docs["normalized_name"] + " " +
+                    docs["normalized_name"].map(publishers).fillna("") + " " +
+                    docs["evidence"].fillna(""))
+    docs = docs.drop_duplicates(["text", "genre"])
+
+    return docs[["normalized_name", "text", "genre"]].reset_index(drop=True)
+
+
+def hash_features(texts, n_features=N_FEATURES):
+    """Sparse bag of hashed word unigrams + bigrams: (doc ids, feature ids, counts)."""
+
+    words = pd.Series(texts, dtype=object).fillna("").astype(str).str.lower() \
+        .str.replace(r"[^\w\s]", " ", regex=True).str.split()
+
+    tokens = words.explode().dropna()
+    doc_ids = tokens.index.to_numpy()
+    tokens = tokens.to_numpy(dtype=object)
+
+    # Bigrams pair each token with the next token of the same document
+    same_doc = doc_ids[1:] == doc_ids[:-1]
+    bigrams = (tokens[:-1] + " " + tokens[1:])[same_doc] if len(tokens) > 1 else tokens[:0]
+
+    all_tokens = np.concatenate([tokens, bigrams])
+    all_docs = np.concatenate([doc_ids, doc_ids[:-1][same_doc]]).astype(np.int64)
+
+    # Stable hashes (unlike hash()) so the model is identical across processes
+    features = (pd.util.hash_array(all_tokens) % np.uint64(n_features)).astype(np.int64)
+
+    pairs, counts = np.unique(all_docs * n_features + features, return_counts=True)
+    return pairs // n_features, pairs % n_features, counts.astype(np.float64)
+
+
+class NaiveBayesGenreClassifier:
+    """Multinomial naive Bayes over hashed n-gram counts."""
+
+    def __init__(self, n_features=N_FEATURES, alpha=DEFAULT_ALPHA):
+        self.n_features = n_features
+        self.alpha = alpha
+        self.classes = None
+        self.class_log_prior = None
+        self.feature_log_prob = None
+
+    def fit(self, texts, genres):
+        texts = pd.Series(texts, dtype=object).reset_index(drop=True)
+        class_codes, self.classes = pd.factorize(pd.Series(genres, dtype=object), sort=True)
+
+        doc_ids, features, counts = hash_features(texts, self.n_features)
+
+        feature_counts = np.zeros((len(self.classes), self.n_features))
+        np.add.at(feature_counts, (class_codes[doc_ids], features), counts)
+
+        smoothed = feature_counts + self.alpha
+        self.feature_log_prob = np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))
+
+        class_counts = np.bincount(class_codes, minlength=len(self.classes))
+        self.class_log_prior = np.log(class_counts) - np.log(class_counts.sum())
+
+        return self
+
+    def predict_proba(self, texts):
+        """Class probabilities, one row per text, columns in self.classes order."""
+
+        texts = pd.Series(texts, dtype=object).reset_index(drop=True)
+        doc_ids, features, counts = hash_features(texts, self.n_features)
+
+        log_joint = np.tile(self.class_log_prior, (len(texts), 1))
+        np.add.at(log_joint, doc_ids, (self.feature_log_prob[:, features] * counts).T)
+
+        log_joint -= log_joint.max(axis=1, keepdims=True)
+        proba = np.exp(log_joint)
+        return proba / proba.sum(axis=1, keepdims=True)
+
+    def predict(self, texts):
+        """Most likely genre and its probability for every text."""
+
+        proba = self.predict_proba(texts)
+        best = proba.argmax(axis=1)
+        return self.classes.to_numpy()[best], proba[np.arange(len(best)), best]
+
+
+def evaluate_holdout(docs, holdout_share=0.2, seed=42):
+    """Accuracy on a random holdout of shows (split by show, not by document)."""
+
+    shows = docs["normalized_name"].unique()
+    rng = np.random.default_rng(seed)
+    holdout = set(rng.choice(shows, int(len(shows) * holdout_share), replace=False))
+    is_test = docs["normalized_name"].isin(holdout)
+
+    model = NaiveBayesGenreClassifier().fit(docs.loc[~is_test, "text"], docs.loc[~is_test, "genre"])
+    predicted, _ = model.predict(docs.loc[is_test, "text"])
+    return float((predicted == docs.loc[is_test, "genre"].to_numpy()).mean()), int(is_test.sum())
+
+
+def classify_other_shows(rankings_path="final_5platform_podcast_rankings.csv",
+                         min_confidence=DEFAULT_MIN_CONFIDENCE):
+    """Predict a genre for every ranked show whose genre is still "Other"."""
+
+    publishers = load_publishers()
+    docs = build_training_set(publishers)
+    model = NaiveBayesGenreClassifier().fit(docs["text"], docs["genre"])
+
+    # Titles that normalize to "" (e.g. non-Latin scripts) stay empty strings
+    rankings = pd.read_csv(rankings_path, dtype={"show_name": str}, keep_default_na=False)
+    other = rankings[rankings["genre"] == "Other"].copy()
+
+    texts = other["show_name"] + " " + other["show_name"].map(publishers).fillna("")
+    other["predicted_genre"], other["confidence"] = model.predict(texts)
+    other["accepted"] = other["confidence"] >= min_confidence
+
+    return other[["rank", "show_name", "predicted_genre", "confidence", "accepted"]], docs
+
+
+if __name__ == "__main__":
+    print("OFFLINE GENRE CLASSIFIER")
+    print("=" * 50)
+
+    predictions, docs = classify_other_shows()
+    accuracy, n_test = evaluate_holdout(docs)
+
+    print(f"Training documents: {len(docs)} ({docs['normalized_name'].nunique()} shows)")
+    print(f"Holdout accuracy: {accuracy:.1%} on {n_test} documents")
+    print(f"\nShows with genre 'Other': {len(predictions)}")
+
+    for _, row in predictions.iterrows():
+        marker = "✓" if row["accepted"] else "⚠"
+        print(f"  {marker} #{row['rank']:<4} {row['show_name']:<45} -> "
+              f"{row['predicted_genre']} ({row['confidence']:.0%})")
+
+    predictions.to_csv(PREDICTIONS_FILE, index=False)
+    print(f"\n✓ Predictions saved to {PREDICTIONS_FILE}")
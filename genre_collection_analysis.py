@@ -9,18 +9,8 @@ genre data for YouTube and iHeart shows.
 
 import pandas as pd
 from pathlib import Path
-import re
-
-def normalize_show_name(name):
-    """Normalize show name for matching across platforms."""
-    if pd.isna(name):
-        return ""
-
-    # Convert to lowercase and remove special characters
-    normalized = str(name).lower().strip()
-    normalized = re.sub(r'[^\w\s]', '', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized)
-    return normalized
+
+from show_name_normalization import normalize_show_name
 
 def load_data():
     """Load all platform data."""
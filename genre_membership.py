@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Weighted multi-label genre membership for within-genre scoring
+
+Compound source genres such as "True Crime & Comedy" or "Business & Politics"
+are split into their parts and every show gets a sparse genre-weight vector
+(weights sum to 1). Memberships are kept as COO arrays (show, genre, weight),
+and the within-genre popularity percentile is computed over all of them with
+one sort, one cumulative sum and a few bincounts - the single-label case is
+just a membership with one weight of 1 per show.
+"""
+
+import numpy as np
+import pandas as pd
+
+from genre_rule_engine import classify_genre_texts
+from genre_taxonomy import LEVEL_CATEGORIES, rollup_genres
+from show_name_normalization import normalize_names
+
+GENRE_SEPARATOR = " & "
+SOURCE_GENRES_FILE = "data_comprehensive_genres/comprehensive_genre_mapping.csv"
+
+
+def load_source_genre_labels(path=SOURCE_GENRES_FILE):
+    """Normalized show name -> original (possibly compound) genre label."""
+
+    try:
+        source = pd.read_csv(path)
+    except FileNotFoundError:
+        print(f"   ⚠ No source genre labels found ({path})")
+        return pd.Series(dtype=object)
+
+    source["normalized_name"] = normalize_names(source["show_name"])
+    source = source.drop_duplicates("normalized_name", keep="last")
+    return source.set_index("normalized_name")["genre"]
+
+
+def resolve_genre_parts(labels, separator=GENRE_SEPARATOR):
+    """Standard genre weights for each distinct label: DataFrame of label, genre, weight.
+
+    Each part is rolled up through the genre taxonomy when it is a known leaf,
+    otherwise through the keyword rules. Labels whose parts all resolve to
+    "Other" (e.g. "Society & Culture") fall back to the whole-label rollup.
+    """
+
+    labels = pd.Series(pd.unique(pd.Series(labels, dtype=object).dropna()), dtype=object)
+
+    parts = labels.str.split(separator, regex=False).explode()
+    taxonomy_genres = rollup_genres(parts, "standard").to_numpy(dtype=object)
+    rule_genres = classify_genre_texts(parts).to_numpy(dtype=object)
+    part_genres = np.where(pd.isna(taxonomy_genres), rule_genres, taxonomy_genres)
+
+    resolved = pd.DataFrame({"label": labels[parts.index].to_numpy(), "genre": part_genres})
+    resolved = resolved[resolved["genre"] != "Other"].drop_duplicates()
+
+    whole = pd.DataFrame({"label": labels, "genre": rollup_genres(labels, "standard", "Other")})
+    whole = whole[~whole["label"].isin(resolved["label"])]
+
+    resolved = pd.concat([resolved, whole], ignore_index=True)
+    resolved["weight"] = 1.0 / resolved.groupby("label")["genre"].transform("size")
+    return resolved.reset_index(drop=True)
+
+
+def build_genre_membership(show_names, primary_genres, source_labels=None, categories=None):
+    """COO genre membership (show positions, genre codes, weights) plus the genre categories.
+
+    Every show is a member of its primary genre. A show whose source label
+    has parts in other genres is also a member of those, with equal weights
+    (e.g. primary Education, label "True Crime & Comedy": 1/3 each).
+    """
+
+    show_names = pd.Series(show_names, dtype=object).reset_index(drop=True)
+    primary_genres = pd.Series(primary_genres, dtype=object).reset_index(drop=True)
+
+    if categories is None:
+        categories = pd.Index(LEVEL_CATEGORIES["standard"]).append(
+            pd.Index(pd.unique(primary_genres.dropna()))).unique()
+
+    shows = np.arange(len(show_names))
+    genres = primary_genres.to_numpy()
+    weights = np.ones(len(show_names))
+
+    if source_labels is not None and len(source_labels):
+        labels = show_names.map(source_labels)
+        has_label = labels.notna().to_numpy()
+
+        parts = resolve_genre_parts(labels[has_label])
+        multi = pd.DataFrame({"show": shows[has_label], "label": labels[has_label].to_numpy()}) \
+            .merge(parts, on="label", how="inner")
+
+        # The curated primary genre always keeps a membership; the label's
+        # other parts share the show's weight equally with it
+        extra = multi[multi["genre"].to_numpy() != genres[multi["show"].to_numpy()]]
+        extra_shows = extra["show"].to_numpy()
+        share = 1.0 / (1 + np.bincount(extra_shows, minlength=len(shows)))
+
+        shows = np.concatenate([shows, extra_shows])
+        genres = np.concatenate([genres, extra["genre"].to_numpy()])
+        weights = np.concatenate([share, share[extra_shows]])
+
+    codes = categories.get_indexer(genres)
+    if (codes < 0).any():
+        categories = categories.append(pd.Index(pd.unique(genres[codes < 0])))
+        codes = categories.get_indexer(genres)
+
+    order = np.lexsort((codes, shows))
+    return shows[order], codes[order], weights[order], categories
+
+
+def weighted_genre_percentile(shows, genre_codes, weights, consumption, n_shows=None):
+    """Within-genre consumption percentile (0-100) per show over weighted memberships.
+
+    For a membership (show i, genre g) the percentile is the weighted share of
+    genre g's members whose consumption is <= that of show i; a genre with a
+    single member scores 100. A show's score is the weight-averaged percentile
+    over its genres.
+    """
+
+    consumption = np.asarray(consumption, dtype=np.float64)
+    if n_shows is None:
+        n_shows = len(consumption)
+
+    values = consumption[shows]
+
+    # Sort memberships by (genre, consumption); dense consumption ranks make
+    # one integer key, so ties resolve to the last member with equal value
+    _, value_ranks = np.unique(values, return_inverse=True)
+    keys = genre_codes.astype(np.int64) * (value_ranks.max(initial=0) + 1) + value_ranks
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    cumulative = np.cumsum(weights[order])
+    n_genres = int(genre_codes.max(initial=-1)) + 1
+    genre_totals = np.bincount(genre_codes, weights=weights, minlength=n_genres)
+    genre_members = np.bincount(genre_codes, minlength=n_genres)
+    genre_offsets = np.concatenate([[0.0], np.cumsum(genre_totals)])[:n_genres]
+
+    last_tied = np.searchsorted(sorted_keys, keys, side="right") - 1
+    weight_at_or_below = cumulative[last_tied] - genre_offsets[genre_codes]
+
+    percentile = np.where(
+        genre_members[genre_codes] > 1,
+        weight_at_or_below / genre_totals[genre_codes] * 100,
+        100.0,
+    )
+
+    return np.bincount(shows, weights=weights * percentile, minlength=n_shows)
+
+
+def genre_rank_scores(ranking_df, source_labels=None):
+    """genre_rank_score for a ranking frame (show_name, genre, total_consumption)."""
+
+    shows, codes, weights, _ = build_genre_membership(
+        ranking_df["show_name"], ranking_df["genre"], source_labels)
+    return weighted_genre_percentile(shows, codes, weights, ranking_df["total_consumption"], len(ranking_df))
+
+
+if __name__ == "__main__":
+    import time
+
+    print("WEIGHTED GENRE MEMBERSHIP")
+    print("=" * 50)
+
+    source_labels = load_source_genre_labels()
+    parts = resolve_genre_parts(source_labels)
+    compound = parts[parts.groupby("label")["genre"].transform("size") > 1]
+    print(f"Source labels: {source_labels.nunique()} | split into multiple genres: {compound['label'].nunique()}")
+    for label, group in compound.groupby("label", sort=False):
+        weights = ", ".join(f"{genre} {weight:.2f}" for genre, weight in zip(group["genre"], group["weight"]))
+        print(f"  {label:<28} -> {weights}")
+
+    # Scaling check on synthetic shows: single-label vs multi-label path
+    n = 300_000
+    rng = np.random.default_rng(0)
+    categories = np.array(LEVEL_CATEGORIES["standard"], dtype=object)
+    synthetic = pd.DataFrame({
+        "show_name": [f"show {i}" for i in range(n)],
+        "genre": rng.choice(categories, n),
+        "total_consumption": rng.lognormal(12, 2, n).round(),
+    })
+    synthetic_labels = pd.Series(
+        rng.choice(source_labels.unique(), n // 4),
+        index=synthetic["show_name"].sample(n // 4, random_state=0).to_numpy(),
+    )
+
+    for name, labels in [("single-label", None), ("multi-label", synthetic_labels)]:
+        start = time.perf_counter()
+        genre_rank_scores(synthetic, labels)
+        print(f"\n{name:<12}: {n:,} shows scored in {time.perf_counter() - start:.2f} s", end="")
+    print()
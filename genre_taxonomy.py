@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Genre taxonomy: one leaf table, three category levels, integer-coded rollups
+
+Every source genre label (platform categories and the compound labels from
+comprehensive research) is a leaf. Each leaf carries its category at three
+levels:
+
+    refined   - the 8 refined categories (refined_genre_system.py)
+    unified   - the 12 unified categories (unified_genre_classification.py)
+    standard  - the 9 + Other ranking categories (GENRE_STANDARDIZATION)
+
+The levels are independent mappings of the leaves, not a hierarchy: they
+reproduce three existing classification systems, and a category at one
+level can split across several at another (refined "Education" covers
+standard "Education" and "Society & Culture"). A rollup always goes from
+leaf to level, never from one level to another.
+
+The table is compiled once into dense integer code arrays, so rolling a
+genre column up to any level is a leaf-code lookup plus one np.take.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+LEVELS = ["refined", "unified", "standard"]
+UNMAPPED_POLICIES = ("ignore", "warn", "error")
+
+# Category order per level (reports and define_*_genres() list them in this order)
+LEVEL_CATEGORIES = {
+    "refined": [
+        "True Crime", "News & Politics", "Comedy", "Interview & Talk",
+        "Sports", "Business", "Entertainment", "Education",
+    ],
+    "unified": [
+        "True Crime", "News & Politics", "Comedy", "Interview & Talk",
+        "Sports", "Business & Finance", "Pop Culture & Entertainment",
+        "Health & Wellness", "Education & Learning", "Religion & Spirituality",
+        "Mystery & Paranormal", "Other",
+    ],
+    "standard": [
+        "True Crime", "News & Politics", "Comedy", "Interview & Talk",
+        "Sports", "Business", "Education", "Entertainment",
+        "Society & Culture", "Other",
+    ],
+}
+
+# leaf -> (refined, unified, standard); None where a leaf is not part of a level.
+# Each column is its own mapping of the leaf; the columns need not nest.
+GENRE_TAXONOMY = [
+    # Compound labels from comprehensive genre research
+    ("True Crime", "True Crime", "True Crime", "True Crime"),
+    ("True Crime & Beauty", "True Crime", "True Crime", "True Crime"),
+    ("True Crime & Comedy", "True Crime", "True Crime", "True Crime"),
+    ("News & Politics", "News & Politics", "News & Politics", "News & Politics"),
+    ("News", "News & Politics", "News & Politics", "News & Politics"),
+    ("News & Commentary", "News & Politics", "News & Politics", "News & Politics"),
+    ("News & Law", "News & Politics", "News & Politics", "News & Politics"),
+    ("Comedy", "Comedy", "Comedy", "Comedy"),
+    ("Comedy & Entertainment", "Comedy", "Comedy", "Comedy"),
+    ("Comedy & Interview", "Comedy", "Comedy", "Comedy"),
+    ("Comedy & Lifestyle", "Comedy", "Comedy", "Comedy"),
+    ("Comedy & Live Show", "Comedy", "Comedy", "Comedy"),
+    ("Comedy & News", "Comedy", "Comedy", "Comedy"),
+    ("Comedy & Pop Culture", "Comedy", "Comedy", "Comedy"),
+    ("Comedy & Sports", "Comedy", "Comedy", "Comedy"),
+    ("Comedy & Commentary", "Comedy", "Comedy", "Comedy"),
+    ("Gaming & Comedy", "Comedy", "Comedy", "Comedy"),
+    ("Interview & Talk", "Interview & Talk", "Interview & Talk", "Interview & Talk"),
+    ("Interview & Military", "Interview & Talk", "Interview & Talk", "Interview & Talk"),
+    ("Sports", "Sports", "Sports", "Sports"),
+    ("Sports & Commentary", "Sports", "Sports", "Sports"),
+    ("Sports & Entertainment", "Sports", "Sports", "Sports"),
+    ("Sports & Interview", "Sports", "Sports", "Sports"),
+    ("Sports & Lifestyle", "Sports", "Sports", "Sports"),
+    ("Business & Finance", "Business", "Business & Finance", "Business"),
+    ("Business & Interview", "Business", "Interview & Talk", "Business"),
+    ("Business & Politics", "Business", "Business & Finance", "Business"),
+    ("Pop Culture & Entertainment", "Entertainment", "Pop Culture & Entertainment", "Entertainment"),
+    ("Entertainment & Lifestyle", "Entertainment", "Pop Culture & Entertainment", "Entertainment"),
+    ("Anime & Pop Culture", "Entertainment", "Pop Culture & Entertainment", "Entertainment"),
+    ("Relationships & Pop Culture", "Entertainment", "Pop Culture & Entertainment", "Entertainment"),
+    ("Hip-Hop & Culture", "Entertainment", "Pop Culture & Entertainment", "Entertainment"),
+    ("Country Music & Radio", "Entertainment", "Pop Culture & Entertainment", "Entertainment"),
+    ("Radio & Entertainment", "Entertainment", "Pop Culture & Entertainment", "Entertainment"),
+    ("Educational", "Education", "Education & Learning", "Education"),
+    ("Education & Law", "Education", "Education & Learning", "Education"),
+    ("Science & Psychology", "Education", "Education & Learning", "Education"),
+    ("Science & Technology", "Education", "Education & Learning", "Education"),
+    ("Self-Help & Wellness", "Education", "Health & Wellness", "Education"),
+    ("Relationships & Lifestyle", "Entertainment", "Health & Wellness", "Entertainment"),
+    ("Religion & Spirituality", "Education", "Religion & Spirituality", "Society & Culture"),
+    ("Mystery & Conspiracy", "Education", "Mystery & Paranormal", "Education"),
+    ("Miscellaneous", "Education", "Other", "Education"),
+    # Platform categories (Apple/Spotify style) and the ranking categories themselves
+    ("Society & Culture", None, None, "Society & Culture"),
+    ("Education", None, None, "Education"),
+    ("History", None, None, "Education"),
+    ("Kids & Family", None, None, "Education"),
+    ("Leisure", None, None, "Entertainment"),
+    ("Fiction", None, None, "Entertainment"),
+    ("Entertainment", None, None, "Entertainment"),
+    ("Business", None, None, "Business"),
+    ("TV & Film", None, None, "Entertainment"),
+    ("Arts", None, None, "Entertainment"),
+]
+
+
+class GenreTaxonomy:
+    """Compiled taxonomy: leaf index plus one leaf -> category code array per level."""
+
+    def __init__(self, table=GENRE_TAXONOMY, level_categories=LEVEL_CATEGORIES):
+        self.leaves = pd.Index([row[0] for row in table])
+        if not self.leaves.is_unique:
+            raise ValueError("Genre taxonomy leaves must be unique")
+
+        self.categories = {}
+        self.level_codes = {}
+
+        for position, level in enumerate(LEVELS, start=1):
+            categories = pd.Index(level_categories[level])
+            parents = [row[position] for row in table]
+
+            codes = categories.get_indexer(parents)
+            unknown = [parent for parent, code in zip(parents, codes) if parent is not None and code < 0]
+            if unknown:
+                raise ValueError(f"Unknown {level} categories in taxonomy: {unknown}")
+
+            # Trailing -1 so that unknown leaves (leaf code -1) stay unmapped
+            self.categories[level] = categories
+            self.level_codes[level] = np.append(codes, -1)
+
+    def leaf_codes(self, genres):
+        """Leaf code per genre label, -1 for labels not in the taxonomy."""
+
+        return self.leaves.get_indexer(pd.Index(np.asarray(genres, dtype=object)))
+
+    def rollup_codes(self, leaf_codes, level):
+        """Category codes at a level for an array of leaf codes (-1 = unmapped)."""
+
+        return np.take(self.level_codes[level], leaf_codes)
+
+    def rollup(self, genres, level, default=np.nan):
+        """Leaf genre labels rolled up to a level, default where a label has no category there.
+
+        genres are leaf labels; category labels of another level are only
+        mapped where they are also leaves (the levels do not nest).
+        """
+
+        index = genres.index if isinstance(genres, pd.Series) else None
+        codes = self.rollup_codes(self.leaf_codes(genres), level)
+
+        labels = np.append(self.categories[level].to_numpy(dtype=object), default)
+        return pd.Series(labels[codes], index=index)
+
+    def rollup_categorical(self, genres, level):
+        """Rollup as a Categorical in the level's category order (NaN when unmapped)."""
+
+        codes = self.rollup_codes(self.leaf_codes(genres), level)
+        return pd.Categorical.from_codes(codes, categories=self.categories[level])
+
+    def mapping(self, level):
+        """Leaf -> category dict for every leaf that belongs to the level."""
+
+        codes = self.level_codes[level][:-1]
+        categories = self.categories[level]
+        return {leaf: categories[code] for leaf, code in zip(self.leaves, codes) if code >= 0}
+
+    def groups(self, level):
+        """Category -> [leaves] in category order, e.g. define_refined_genres()."""
+
+        groups = {category: [] for category in self.categories[level]}
+        for leaf, category in self.mapping(level).items():
+            groups[category].append(leaf)
+        return {category: leaves for category, leaves in groups.items() if leaves}
+
+
+@lru_cache(maxsize=1)
+def get_genre_taxonomy():
+    """The compiled GENRE_TAXONOMY, built once per process."""
+
+    return GenreTaxonomy()
+
+
+def rollup_genres(genres, level, default=np.nan):
+    """Roll a genre column up to "refined", "unified" or "standard"."""
+
+    return get_genre_taxonomy().rollup(genres, level, default)
+
+
+def standardize_genres(genres, level="standard", default="Other", policy="warn"):
+    """Map a genre column to a level and report labels the taxonomy does not know.
+
+    Runs as a categorical code remap: distinct labels are rolled up once and
+    the per-row codes are remapped with one take. Unmapped labels (other than
+    the default itself) get the default and are counted in the same pass.
+    policy: "ignore", "warn" (print the unmapped labels) or "error" (raise).
+
+    Returns (standardized Series, unmapped label -> row count Series).
+    """
+
+    if policy not in UNMAPPED_POLICIES:
+        raise ValueError(f"Unknown unmapped-genre policy: {policy} (use one of {UNMAPPED_POLICIES})")
+
+    index = genres.index if isinstance(genres, pd.Series) else None
+    categorical = pd.Categorical(np.asarray(genres, dtype=object))
+    taxonomy = get_genre_taxonomy()
+
+    # One rollup per distinct label, then remap the row codes (-1 = missing)
+    label_codes = taxonomy.rollup_codes(taxonomy.leaf_codes(categorical.categories), level)
+    row_codes = np.append(label_codes, -1)[categorical.codes]
+
+    labels = np.append(taxonomy.categories[level].to_numpy(dtype=object), default)
+    standardized = pd.Series(labels[row_codes], index=index)
+
+    label_counts = np.bincount(categorical.codes[categorical.codes >= 0], minlength=len(categorical.categories))
+    is_unmapped = (label_codes < 0) & (categorical.categories != default)
+    unmapped = pd.Series(label_counts[is_unmapped], index=categorical.categories[is_unmapped], name="rows")
+    unmapped = unmapped.sort_values(ascending=False, kind="stable")
+
+    if len(unmapped) and policy != "ignore":
+        details = ", ".join(f"{label} ({count})" for label, count in unmapped.items())
+        message = (f"{len(unmapped)} genre labels not in the {level} taxonomy "
+                   f"({int(unmapped.sum())} rows -> {default!r}): {details}")
+        if policy == "error":
+            raise ValueError(message)
+        print(f"   ⚠ {message}")
+
+    return standardized, unmapped
+
+
+if __name__ == "__main__":
+    taxonomy = get_genre_taxonomy()
+
+    print("GENRE TAXONOMY")
+    print("=" * 50)
+    print(f"Leaves: {len(taxonomy.leaves)}")
+    for level in LEVELS:
+        print(f"  {level:<9}: {len(taxonomy.categories[level])} categories, "
+              f"{len(taxonomy.mapping(level))} leaves mapped")
+
+    try:
+        genres = pd.read_csv("data_comprehensive_genres/comprehensive_genre_mapping.csv")["genre"]
+    except FileNotFoundError:
+        genres = pd.Series(taxonomy.leaves)
+
+    print(f"\nRollups of {len(genres)} show genres:")
+    for level in LEVELS:
+        counts = taxonomy.rollup_categorical(genres, level).value_counts()
+        print(f"\n{level.title()}:")
+        for category, count in counts[counts > 0].items():
+            print(f"  {category:<28} {count:3d}")
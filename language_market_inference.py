@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Local language and market inference for show titles
+
+Proposes a country for shows without one before any remote research:
+
+    1. Unicode script detection - Hangul, Kana, Cyrillic, Devanagari, ...
+       identify the language of non-Latin titles outright
+    2. Character n-gram language ID for Latin-script titles ("la cotorrisa",
+       "äffchen mit käffchen"), trained on data_language_seeds/
+    3. YouTube FeatureCountry - the country of the show's own playlist, and a
+       language -> country prior estimated from all YouTube playlists
+
+Everything runs over the whole batch of titles at once. Each proposal has a
+confidence; shows below CONFIDENCE_THRESHOLD need remote research, and so do
+English titles without a YouTube playlist: English alone does not single
+out a market.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from show_name_normalization import normalize_names
+
+SEEDS_FILE = Path("data_language_seeds/language_seeds.csv")
+YOUTUBE_FILE = Path("data/youtube.csv")
+
+CONFIDENCE_THRESHOLD = 0.6
+YOUTUBE_FEATURE_CONFIDENCE = 0.9  # the show's own playlist country
+UNDISTINCTIVE_LANGUAGES = ("en",) # languages that never resolve a show on their own
+EVALUATION_FOLDS = 5
+PRIOR_STRENGTH = 2.0              # pseudo-counts for each language's home market
+PRIOR_MIN_CONFIDENCE = 0.8        # playlists counted in the prior need a clear language
+
+# Scripts as regex character classes and the language they imply (Latin: n-gram model)
+SCRIPTS = {
+    "Latin": ("a-zA-ZÀ-ɏ", None),
+    "Hangul": ("ᄀ-ᇿ㄰-㆏가-힯", "ko"),
+    "Kana": ("぀-ヿ", "ja"),
+    "Han": ("㐀-䶿一-鿿", "zh"),
+    "Cyrillic": ("Ѐ-ӿ", "ru"),
+    "Greek": ("Ͱ-Ͽ", "el"),
+    "Hebrew": ("֐-׿", "he"),
+    "Arabic": ("؀-ۿ", "ar"),
+    "Devanagari": ("ऀ-ॿ", "hi"),
+    "Bengali": ("ঀ-৿", "bn"),
+    "Tamil": ("஀-௿", "ta"),
+    "Telugu": ("ఀ-౿", "te"),
+    "Thai": ("฀-๿", "th"),
+}
+
+# Letters that single out a language within its script
+LANGUAGE_MARKERS = [
+    ("ru", "uk", "[іїєґІЇЄҐ]"),
+    ("ar", "fa", "[پچژگ]"),
+    ("zh", "ja", "[぀-ヿ]"),
+]
+
+# Home market per language (the prior's default country)
+LANGUAGE_MARKETS = {
+    "en": "US", "es": "MX", "de": "DE", "pt": "BR", "fr": "FR", "it": "IT",
+    "id": "ID", "nl": "NL", "tr": "TR",
+    "ko": "KR", "ja": "JP", "zh": "CN", "ru": "RU", "uk": "UA", "el": "GR",
+    "he": "IL", "ar": "SA", "fa": "IR", "hi": "IN", "bn": "BD", "ta": "IN",
+    "te": "IN", "th": "TH",
+}
+
+NGRAM_ORDERS = (1, 2, 3)
+N_BUCKETS = 2 ** 16
+NGRAM_ALPHA = 0.1
+# Posterior sharpness: mean n-gram log-likelihood is scaled by this many n-grams,
+# so long and short titles get comparable confidence
+EFFECTIVE_NGRAMS = 6
+
+
+def _ngrams(text):
+    padded = f" {' '.join(text.split())} "
+    return [padded[i:i + n] for n in NGRAM_ORDERS for i in range(len(padded) - n + 1)]
+
+
+def ngram_buckets(texts):
+    """(doc index, hashed bucket) for every character n-gram in a batch of texts."""
+
+    grams = [_ngrams(text) for text in texts]
+    doc_ids = np.repeat(np.arange(len(grams)), [len(g) for g in grams])
+    flat = np.array([gram for g in grams for gram in g], dtype=object)
+    buckets = (pd.util.hash_array(flat) % N_BUCKETS).astype(np.int64) if len(flat) else np.zeros(0, dtype=np.int64)
+    return doc_ids, buckets
+
+
+def _latin_text(texts):
+    # Letters only (case-folded), so digits and punctuation are not n-grams
+    return pd.Series(texts, dtype=object).fillna("").astype(str).str.lower().str.replace(
+        r"[^a-zÀ-ɏ]+", " ", regex=True).str.strip()
+
+
+class CharNgramLanguageModel:
+    """Naive Bayes language ID over hashed character 1-3 grams."""
+
+    def __init__(self, alpha=NGRAM_ALPHA):
+        self.alpha = alpha
+        self.languages = None
+        self.log_probs = None
+
+    def fit(self, texts, languages):
+        texts = _latin_text(texts)
+        codes, self.languages = pd.factorize(pd.Series(languages), sort=True)
+
+        doc_ids, buckets = ngram_buckets(texts)
+        counts = np.zeros((len(self.languages), N_BUCKETS))
+        np.add.at(counts, (codes[doc_ids], buckets), 1)
+
+        smoothed = counts + self.alpha
+        self.log_probs = np.log(smoothed / smoothed.sum(axis=1, keepdims=True))
+        return self
+
+    def predict_proba(self, texts):
+        """Language probabilities (docs x languages); uniform where a text has no letters."""
+
+        texts = _latin_text(texts)
+        doc_ids, buckets = ngram_buckets(texts)
+
+        log_likelihood = np.zeros((len(texts), len(self.languages)))
+        np.add.at(log_likelihood, doc_ids, self.log_probs[:, buckets].T)
+
+        n_grams = np.bincount(doc_ids, minlength=len(texts))
+        scaled = log_likelihood / np.maximum(n_grams, 1)[:, None] * EFFECTIVE_NGRAMS
+        scaled -= scaled.max(axis=1, keepdims=True)
+        proba = np.exp(scaled)
+        return pd.DataFrame(proba / proba.sum(axis=1, keepdims=True), columns=self.languages)
+
+
+@lru_cache(maxsize=1)
+def get_language_model():
+    """Language model trained on the seed texts, built once per process."""
+
+    seeds = pd.read_csv(SEEDS_FILE)
+    return CharNgramLanguageModel().fit(seeds["text"], seeds["language"])
+
+
+def detect_scripts(texts):
+    """Letter counts per script (docs x scripts)."""
+
+    texts = pd.Series(texts, dtype=object).fillna("").astype(str).reset_index(drop=True)
+    return pd.DataFrame({script: texts.str.count(f"[{chars}]") for script, (chars, _) in SCRIPTS.items()})
+
+
+def language_probabilities(texts):
+    """Language probabilities per text (docs x languages), blending script and n-gram evidence.
+
+    Each non-Latin script contributes its language with its share of the
+    letters; the Latin share is spread by the n-gram model.
+    """
+
+    texts = pd.Series(texts, dtype=object).fillna("").astype(str).reset_index(drop=True)
+    scripts = detect_scripts(texts)
+    letters = scripts.to_numpy().sum(axis=1)
+    share = scripts.to_numpy() / np.maximum(letters, 1)[:, None]
+
+    model = get_language_model()
+    languages = pd.Index(list(model.languages) + sorted(
+        {language for _, language in SCRIPTS.values() if language} | {marked for _, marked, _ in LANGUAGE_MARKERS}
+    )).unique()
+
+    proba = np.zeros((len(texts), len(languages)))
+    proba[:, languages.get_indexer(model.languages)] = model.predict_proba(texts).to_numpy() * share[:, [0]]
+
+    # Non-Latin scripts: the script's language (or a marked variant) gets the script's share
+    script_languages = pd.Series([language for _, language in SCRIPTS.values()], index=list(SCRIPTS))
+    row_languages = pd.DataFrame(np.broadcast_to(script_languages.to_numpy(), scripts.shape), columns=scripts.columns)
+    for base, marked, pattern in LANGUAGE_MARKERS:
+        has_marker = texts.str.contains(pattern, regex=True).to_numpy()
+        for script in script_languages.index[script_languages == base]:
+            row_languages.loc[has_marker, script] = marked
+
+    for position, script in enumerate(scripts.columns[1:], start=1):
+        codes = languages.get_indexer(row_languages[script])
+        np.add.at(proba, (np.arange(len(texts)), codes), share[:, position])
+
+    return pd.DataFrame(proba, columns=languages), scripts
+
+
+def load_youtube_countries(youtube_file=YOUTUBE_FILE):
+    """Normalized playlist name -> FeatureCountry, plus the raw playlist table."""
+
+    try:
+        youtube = pd.read_csv(youtube_file).dropna(subset=["playlist_name", "FeatureCountry"])
+    except FileNotFoundError:
+        return {}, pd.DataFrame(columns=["playlist_name", "FeatureCountry"])
+
+    names = normalize_names(youtube["playlist_name"])
+    return dict(zip(names, youtube["FeatureCountry"])), youtube
+
+
+def market_prior(languages, youtube):
+    """P(country | language) matrix: YouTube playlist counts plus home-market pseudo-counts."""
+
+    countries = pd.Index(sorted(set(LANGUAGE_MARKETS.values()) | set(youtube["FeatureCountry"])))
+    counts = np.zeros((len(languages), len(countries)))
+
+    homes = [LANGUAGE_MARKETS.get(language) for language in languages]
+    has_home = np.array([home is not None for home in homes])
+    counts[np.flatnonzero(has_home), countries.get_indexer([h for h in homes if h is not None])] = PRIOR_STRENGTH
+
+    if len(youtube):
+        # Each playlist with a clearly identified language counts once for its country
+        playlist_languages, _ = language_probabilities(youtube["playlist_name"])
+        playlist_languages = playlist_languages.reindex(columns=languages, fill_value=0.0).to_numpy()
+        clear = playlist_languages.max(axis=1) >= PRIOR_MIN_CONFIDENCE
+        np.add.at(counts, (playlist_languages[clear].argmax(axis=1),
+                           countries.get_indexer(youtube["FeatureCountry"][clear])), 1.0)
+
+    totals = counts.sum(axis=1, keepdims=True)
+    return pd.DataFrame(np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0),
+                        index=languages, columns=countries)
+
+
+def infer_markets(show_names, threshold=CONFIDENCE_THRESHOLD, youtube_file=YOUTUBE_FILE, use_playlists=True,
+                  playlists=None):
+    """Proposed country with confidence for each show name.
+
+    use_playlists=False ignores the shows' own YouTube playlist countries
+    (the language prior still uses them), e.g. to evaluate on YouTube titles.
+    playlists: YouTube playlist table (playlist_name, FeatureCountry) to use
+    instead of youtube_file, e.g. the training folds of an evaluation.
+
+    Columns: show_name, script, language, language_confidence, country,
+    confidence, evidence ("youtube" or "language"), needs_research.
+    """
+
+    show_names = pd.Series(show_names, dtype=object).reset_index(drop=True)
+    texts = show_names.fillna("").astype(str)
+
+    language_proba, scripts = language_probabilities(texts)
+    if playlists is None:
+        youtube_countries, youtube = load_youtube_countries(youtube_file)
+    else:
+        youtube = playlists
+        youtube_countries = dict(zip(normalize_names(youtube["playlist_name"]), youtube["FeatureCountry"]))
+    prior = market_prior(language_proba.columns, youtube)
+
+    # P(country) = sum over languages of P(language) * P(country | language)
+    country_proba = language_proba.to_numpy() @ prior.to_numpy()
+    best_country = country_proba.argmax(axis=1)
+    letters = scripts.to_numpy().sum(axis=1)
+
+    result = pd.DataFrame({
+        "show_name": show_names,
+        "script": np.where(letters > 0, scripts.columns[scripts.to_numpy().argmax(axis=1)], None),
+        "language": language_proba.columns[language_proba.to_numpy().argmax(axis=1)],
+        "language_confidence": language_proba.to_numpy().max(axis=1),
+        "country": prior.columns[best_country],
+        "confidence": country_proba[np.arange(len(texts)), best_country],
+        "evidence": "language",
+    })
+    result.loc[letters == 0, ["language", "country"]] = None
+
+    # The show's own YouTube playlist country outweighs the language prior
+    playlist_country = normalize_names(texts).map(youtube_countries)
+    on_youtube = (playlist_country.notna().to_numpy() & use_playlists
+                  & (result["confidence"] < YOUTUBE_FEATURE_CONFIDENCE).to_numpy())
+    result.loc[on_youtube, "country"] = playlist_country[on_youtube]
+    result.loc[on_youtube, "confidence"] = YOUTUBE_FEATURE_CONFIDENCE
+    result.loc[on_youtube, "evidence"] = "youtube"
+
+    # A language guess resolves a show only when the language is distinctive
+    undistinctive = (result["evidence"] == "language") & (
+        result["language"].isna() | result["language"].isin(UNDISTINCTIVE_LANGUAGES))
+    result["needs_research"] = (result["confidence"] < threshold) | undistinctive
+    return result
+
+
+def evaluate_on_playlists(youtube_file=YOUTUBE_FILE, folds=EVALUATION_FOLDS, seed=0):
+    """Title-only predictions for YouTube playlists, each fold scored with a prior built from the others.
+
+    Returns the infer_markets() columns plus "actual" (the FeatureCountry).
+    """
+
+    youtube = pd.read_csv(youtube_file).dropna(subset=["playlist_name", "FeatureCountry"]).reset_index(drop=True)
+    fold = np.random.default_rng(seed).permutation(len(youtube)) % folds
+
+    checks = []
+    for k in range(folds):
+        held_out = youtube[fold == k]
+        check = infer_markets(held_out["playlist_name"], use_playlists=False, playlists=youtube[fold != k])
+        check["actual"] = held_out["FeatureCountry"].to_numpy()
+        checks.append(check)
+    return pd.concat(checks, ignore_index=True)
+
+
+if __name__ == "__main__":
+    print("LANGUAGE AND MARKET INFERENCE")
+    print("=" * 50)
+
+    rankings = pd.read_csv("final_5platform_podcast_rankings.csv", keep_default_na=False)
+    unknown = rankings.loc[(rankings["country"] == "Unknown") & (rankings["show_name"] != ""), "show_name"]
+
+    inferred = infer_markets(unknown)
+    print(f"Unknown-country shows: {len(inferred)} | confident: {int((~inferred['needs_research']).sum())} | "
+          f"need research: {int(inferred['needs_research'].sum())}")
+    for _, row in inferred.iterrows():
+        marker = "✓" if not row["needs_research"] else "⚠"
+        print(f"  {marker} {str(row['country']):<5} {row['confidence']:.2f} "
+              f"{str(row['language']):<3} {str(row['script']):<9} {row['show_name']}")
+
+    # Title-only accuracy on YouTube playlists, the prior built without the evaluated fold
+    check = evaluate_on_playlists()
+    correct = check["country"] == check["actual"]
+    confident = ~check["needs_research"]
+    print(f"\nYouTube titles ({EVALUATION_FOLDS}-fold held out): {len(check)} | confident: {int(confident.sum())} | "
+          f"accuracy when confident: {correct[confident].mean():.0%} | overall: {correct.mean():.0%}")
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Versioned mapping snapshots with copy-on-write row sharing
+
+Every distinct (normalized_name, label, source) row is stored once in an
+append-only row table per mapping kind. A snapshot is just an ordered array
+of row ids (a small .npy manifest), so unchanged rows are shared between
+versions and an old classification state is restored with a single take.
+
+Layout of the store directory:
+    <kind>_rows.csv        row_id, normalized_name, label, source (append-only)
+    <kind>_versions.csv    version, created_at, note, parent, rows, new_rows
+    <kind>_v0001.npy       row ids of version 1, in original row order
+"""
+
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from genre_taxonomy import standardize_genres
+
+SNAPSHOT_DIR = Path("mapping_snapshots")
+
+ROW_COLUMNS = ["normalized_name", "label", "source"]
+VERSION_COLUMNS = ["version", "created_at", "note", "parent", "rows", "new_rows"]
+
+# Mapping files in the order they were produced, oldest first.
+LEGACY_HISTORY = {
+    "country": [
+        "country_mapping.csv",
+        "explicit_country_mapping.csv",
+        "comprehensive_country_mapping.csv",
+        "updated_country_mapping.csv",
+        "final_country_mapping.csv",
+        "comprehensive_country_mapping_updated.csv",
+        "final_country_mapping_updated.csv",
+        "comprehensive_country_mapping_complete.csv",
+    ],
+    "genre": [
+        "updated_genre_mapping.csv",
+        "final_genre_mapping.csv",
+        "comprehensive_genre_mapping_updated.csv",
+        "final_genre_mapping_updated.csv",
+        "final_genre_mapping_comprehensive.csv",
+        "final_genre_mapping_complete_all.csv",
+    ],
+}
+
+LABEL_COLUMNS = ["country", "genre", "final_genre", "tavily_genre"]
+
+
+def _rows_path(kind, store_dir):
+    return Path(store_dir) / f"{kind}_rows.csv"
+
+
+def _versions_path(kind, store_dir):
+    return Path(store_dir) / f"{kind}_versions.csv"
+
+
+def _manifest_path(kind, version, store_dir):
+    return Path(store_dir) / f"{kind}_v{version:04d}.npy"
+
+
+def to_snapshot_rows(mapping_df):
+    """Reduce a mapping file to the normalized_name / label / source columns."""
+
+    label_col = next((col for col in LABEL_COLUMNS if col in mapping_df.columns), None)
+    if label_col is None or "normalized_name" not in mapping_df.columns:
+        raise ValueError(f"Not a mapping table: columns {list(mapping_df.columns)}")
+
+    rows = pd.DataFrame({
+        "normalized_name": mapping_df["normalized_name"],
+        "label": mapping_df[label_col],
+        "source": mapping_df["source"] if "source" in mapping_df.columns else "",
+    })
+
+    return rows.fillna("").astype(str)
+
+
+def _row_hashes(rows):
+    return pd.util.hash_pandas_object(rows[ROW_COLUMNS], index=False).to_numpy()
+
+
+@lru_cache(maxsize=8)
+def _load_rows_cached(path, mtime_ns, size):
+    rows = pd.read_csv(path, dtype=str, keep_default_na=False)
+    rows["row_id"] = rows["row_id"].astype(np.int64)
+    return rows
+
+
+def load_row_table(kind, store_dir=SNAPSHOT_DIR):
+    """Load the shared row table of a mapping kind (cached until it changes).
+
+    The cache key is the file's mtime and size, and commit_snapshot() clears
+    it after appending, so appends within one timestamp tick are not missed.
+    Callers get their own copy of the cached table.
+    """
+
+    path = _rows_path(kind, store_dir)
+    if not path.exists():
+        return pd.DataFrame({"row_id": pd.Series(dtype=np.int64),
+                             **{col: pd.Series(dtype=str) for col in ROW_COLUMNS}})
+
+    stat = path.stat()
+    return _load_rows_cached(str(path), stat.st_mtime_ns, stat.st_size).copy()
+
+
+def list_snapshots(kind, store_dir=SNAPSHOT_DIR):
+    """Version history of a mapping kind."""
+
+    path = _versions_path(kind, store_dir)
+    if not path.exists():
+        return pd.DataFrame(columns=VERSION_COLUMNS)
+
+    return pd.read_csv(path, keep_default_na=False)
+
+
+def commit_snapshot(kind, mapping_df, note="", store_dir=SNAPSHOT_DIR):
+    """Store a mapping table as a new version, writing only rows not seen before."""
+
+    store_dir = Path(store_dir)
+    store_dir.mkdir(exist_ok=True)
+
+    rows = to_snapshot_rows(mapping_df)
+    existing = load_row_table(kind, store_dir)
+
+    # Rows already in the table are shared; only new ones are appended.
+    # Row ids are assigned sequentially, so a row's id is its table position.
+    known = pd.Index(_row_hashes(existing)) if len(existing) else pd.Index([], dtype=np.uint64)
+    hashes = _row_hashes(rows)
+    row_ids = known.get_indexer(hashes)
+
+    new_mask = row_ids < 0
+    new_hashes, first_pos, inverse = np.unique(hashes[new_mask], return_index=True, return_inverse=True)
+    new_ids = len(existing) + np.arange(len(new_hashes))
+    row_ids[new_mask] = new_ids[inverse.ravel()]
+
+    new_rows = rows[new_mask].iloc[first_pos].copy()
+    new_rows.insert(0, "row_id", new_ids)
+    new_rows = new_rows.sort_values("row_id")
+
+    rows_path = _rows_path(kind, store_dir)
+    new_rows.to_csv(rows_path, mode="a", header=not rows_path.exists(), index=False)
+    _load_rows_cached.cache_clear()
+
+    history = list_snapshots(kind, store_dir)
+    version = len(history) + 1
+    np.save(_manifest_path(kind, version, store_dir), row_ids.astype(np.int32))
+
+    entry = pd.DataFrame([{
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "note": note,
+        "parent": version - 1 if version > 1 else "",
+        "rows": len(rows),
+        "new_rows": len(new_rows),
+    }])
+    versions_path = _versions_path(kind, store_dir)
+    entry.to_csv(versions_path, mode="a", header=not versions_path.exists(), index=False)
+
+    return version
+
+
+def load_snapshot(kind, version=None, store_dir=SNAPSHOT_DIR):
+    """Restore the mapping rows of a version (latest when version is None)."""
+
+    history = list_snapshots(kind, store_dir)
+    if history.empty:
+        raise FileNotFoundError(f"No {kind} snapshots in {store_dir}")
+
+    if version is None:
+        version = int(history["version"].max())
+
+    manifest = _manifest_path(kind, version, store_dir)
+    if not manifest.exists():
+        raise FileNotFoundError(f"No {kind} snapshot version {version} in {store_dir}")
+
+    row_ids = np.load(manifest)
+    table = load_row_table(kind, store_dir)
+
+    # Empty fields come back as NaN, exactly as pd.read_csv gave them originally
+    rows = table.iloc[row_ids][ROW_COLUMNS].reset_index(drop=True)
+    return rows.replace("", np.nan)
+
+
+def snapshot_map(kind, version=None, store_dir=SNAPSHOT_DIR):
+    """Key -> label dict of a version, with the same last-row-wins rule as the pipeline."""
+
+    rows = load_snapshot(kind, version, store_dir)
+    return dict(zip(rows["normalized_name"], rows["label"]))
+
+
+def load_snapshot_mappings(country_version=None, genre_version=None, store_dir=SNAPSHOT_DIR):
+    """Country and standardized genre maps as the ranking system expects them."""
+
+    country_map = snapshot_map("country", country_version, store_dir)
+
+    genre_rows = load_snapshot("genre", genre_version, store_dir)
+    standardized, _ = standardize_genres(genre_rows["label"], "standard", "Other")
+    genre_map = dict(zip(genre_rows["normalized_name"], standardized))
+
+    return country_map, genre_map
+
+
+def import_legacy_history(store_dir=SNAPSHOT_DIR):
+    """Commit the historical mapping files as consecutive versions."""
+
+    print("IMPORTING LEGACY MAPPING HISTORY")
+    print("=" * 40)
+
+    for kind, files in LEGACY_HISTORY.items():
+        for filename in files:
+            try:
+                mapping_df = pd.read_csv(filename)
+            except FileNotFoundError:
+                print(f"  ⚠ Missing {filename}, skipped")
+                continue
+
+            version = commit_snapshot(kind, mapping_df, note=filename, store_dir=store_dir)
+            print(f"  ✓ {kind} v{version}: {filename} ({len(mapping_df)} rows)")
+
+    for kind in LEGACY_HISTORY:
+        history = list_snapshots(kind, store_dir)
+        total_rows = int(history["rows"].sum())
+        stored_rows = len(load_row_table(kind, store_dir))
+        print(f"\n{kind}: {len(history)} versions, {total_rows} rows referenced, {stored_rows} rows stored")
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "list"
+
+    if command == "import":
+        import_legacy_history()
+    elif command == "rank":
+        # python mapping_snapshots.py rank <country_version> <genre_version>
+        from complete_5platform_ranking_system import create_unified_5platform_ranking
+
+        country_version = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        genre_version = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        mappings = load_snapshot_mappings(country_version, genre_version)
+        create_unified_5platform_ranking(mappings=mappings)
+    else:
+        for kind in LEGACY_HISTORY:
+            print(f"\n{kind.upper()} SNAPSHOTS")
+            print(list_snapshots(kind).to_string(index=False))
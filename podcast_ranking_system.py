@@ -7,9 +7,10 @@ platforms by normalizing engagement metrics and calculating composite scores.
 """
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 
+from scoring_engine import composite_scores
+
 
 def load_and_clean_data():
     """Load all platform datasets and clean them."""
@@ -260,7 +261,7 @@ def create_unified_ranking(spotify, youtube, amazon, apple, iheart):
     # Fill missing country with 'Unknown'
     ranking_df["country"] = ranking_df["country"].fillna("Unknown")
 
-    # Component 1: Total Consumption Score (50% weight)
+    # Component 1: Total Consumption Score
     # Sum all raw consumption metrics across platforms with normalization
     ranking_df["total_consumption"] = (
         ranking_df["spotify_plays"] +
@@ -272,7 +273,7 @@ def create_unified_ranking(spotify, youtube, amazon, apple, iheart):
     max_consumption = ranking_df["total_consumption"].max()
     ranking_df["consumption_score"] = (ranking_df["total_consumption"] / max_consumption) * 100
 
-    # Component 2: Platform Reach Score (30% weight)
+    # Component 2: Platform Reach Score
     # Average of platform-specific reach scores (already calculated as spotify_score etc.)
     score_cols = ["spotify_score", "youtube_score", "amazon_score", "apple_score", "iheart_score"]
     ranking_df["platforms_count"] = (ranking_df[score_cols] > 0).sum(axis=1)
@@ -280,12 +281,12 @@ def create_unified_ranking(spotify, youtube, amazon, apple, iheart):
     # Calculate average platform reach for shows that appear on platforms
     ranking_df["platform_reach_score"] = ranking_df[score_cols].sum(axis=1) / ranking_df["platforms_count"].replace(0, 1)
 
-    # Component 3: Platform Count Score (10% weight)
+    # Component 3: Platform Count Score
     # Normalize platform count to 0-100 scale
     max_platforms = ranking_df["platforms_count"].max()
     ranking_df["platform_count_score"] = (ranking_df["platforms_count"] / max_platforms) * 100
 
-    # Component 4: Within-Genre Popularity Score (20% weight)
+    # Component 4: Within-Genre Popularity Score
     # Score shows within their genre based on consumption (normalized 0-100)
     ranking_df["genre_rank_score"] = 0.0
 
@@ -310,12 +311,9 @@ def create_unified_ranking(spotify, youtube, amazon, apple, iheart):
                 ranking_df.loc[genre_mask, "genre_rank_score"] = 100.0
 
     # Final Composite Score: Weighted sum of four components
-    ranking_df["composite_score"] = (
-        ranking_df["consumption_score"] * 0.5 +      # 50% total consumption
-        ranking_df["platform_reach_score"] * 0.2 +   # 20% platform reach
-        ranking_df["platform_count_score"] * 0.2 +   # 20% platform count
-        ranking_df["genre_rank_score"] * 0.1         # 10% within-genre popularity
-    )
+    # (legacy weight profile: 50% consumption, 20% platform reach, 20% platform
+    # count, 10% within-genre popularity)
+    ranking_df["composite_score"] = composite_scores(ranking_df, ["legacy"])["legacy"]
 
     # Include shows from all countries (no filtering)
     print(f"Total shows across all countries: {len(ranking_df)} shows")
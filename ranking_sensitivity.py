@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo sensitivity of the ranking to its constants
+
+The composite ranking depends on the component weights and on the US
+adjustment factors for YouTube (0.075) and Amazon (0.65). This samples
+thousands of weight/factor combinations and scores all of them at once:
+
+    - factors only change total consumption, i.e. the consumption score and
+      the within-genre percentile; platform reach (each platform normalized
+      by its own maximum) and platform count do not depend on them
+    - consumption for every sample is one (samples x shows) array, and the
+      within-genre percentiles come from one sort per genre over all samples
+    - composite scores and chart ranks for all samples follow from a few
+      broadcast operations and one argsort
+
+The result is a rank-stability interval per show and the probability that
+it makes the top-25 chart, computed in seconds rather than by re-running the
+ranking script once per combination.
+
+    python ranking_sensitivity.py [samples]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from research_scheduler import ELIGIBLE_COUNTRIES, RANKINGS_FILE, TOP_N
+from scoring_engine import COMPONENT_COLUMNS, DEFAULT_PROFILE, GEOGRAPHIC_FACTORS, WEIGHT_PROFILES
+
+US_PLATFORMS = ["spotify_plays", "apple_plays", "iheart_streams"]
+SENSITIVITY_FILE = "ranking_sensitivity.csv"
+
+DEFAULT_SAMPLES = 5_000
+WEIGHT_CONCENTRATION = 100  # Dirichlet concentration around the profile weights
+FACTOR_SPREAD = 2.0         # factors vary log-uniformly between /spread and *spread
+SAMPLE_BATCH = 1_000        # samples scored together (bounds memory on large catalogs)
+
+
+def sample_parameters(n_samples, profile=DEFAULT_PROFILE, concentration=WEIGHT_CONCENTRATION,
+                      factor_spread=FACTOR_SPREAD, seed=0):
+    """Random component weights (samples x components) and geographic factors (samples x platforms).
+
+    Weights are Dirichlet-distributed around the profile (they still sum to
+    1); components the profile leaves at 0 stay at 0. Factors are
+    log-uniform around GEOGRAPHIC_FACTORS, capped at 1 (US share of global).
+    """
+
+    rng = np.random.default_rng(seed)
+
+    base = np.array([WEIGHT_PROFILES[profile].get(column, 0.0) for column in COMPONENT_COLUMNS])
+    weights = np.zeros((n_samples, len(base)))
+    weights[:, base > 0] = rng.dirichlet(base[base > 0] * concentration, n_samples)
+
+    base_factors = np.array(list(GEOGRAPHIC_FACTORS.values()))
+    spread = rng.uniform(-1.0, 1.0, (n_samples, len(base_factors))) * np.log(factor_spread)
+    factors = np.minimum(base_factors * np.exp(spread), 1.0)
+
+    return pd.DataFrame(weights, columns=COMPONENT_COLUMNS), pd.DataFrame(factors, columns=list(GEOGRAPHIC_FACTORS))
+
+
+def within_genre_percentiles(values, genre_codes):
+    """Within-genre percentile (0-100) of every sample's values (samples x shows).
+
+    Same definition as genre_membership: the share of the genre's shows with
+    a value <= the show's; a genre with a single show scores 100.
+    """
+
+    percentiles = np.empty_like(values)
+    for code in np.unique(genre_codes):
+        members = np.flatnonzero(genre_codes == code)
+        if len(members) == 1:
+            percentiles[:, members] = 100.0
+            continue
+
+        cohort = values[:, members]
+        order = np.argsort(cohort, axis=1, kind="stable")
+        ordered = np.take_along_axis(cohort, order, axis=1)
+
+        # Position of the last tied value at or after each sorted position
+        m = len(members)
+        is_last = np.ones(ordered.shape, dtype=bool)
+        is_last[:, :-1] = ordered[:, 1:] != ordered[:, :-1]
+        tie_end = np.where(is_last, np.arange(m), m)
+        tie_end = np.minimum.accumulate(tie_end[:, ::-1], axis=1)[:, ::-1]
+
+        at_or_below = np.empty_like(tie_end)
+        np.put_along_axis(at_or_below, order, tie_end + 1, axis=1)
+        percentiles[:, members] = at_or_below / m * 100
+    return percentiles
+
+
+def simulate_composite(ranking_df, weights, factors):
+    """Composite score of every show under every sampled weight/factor combination (samples x shows)."""
+
+    us_consumption = ranking_df[US_PLATFORMS].to_numpy(dtype=np.float64).sum(axis=1)
+    global_consumption = ranking_df[list(GEOGRAPHIC_FACTORS)].to_numpy(dtype=np.float64)
+    genre_codes = pd.factorize(ranking_df["genre"])[0]
+
+    # Factor-independent components, fixed per show
+    fixed = {column: ranking_df[column].to_numpy(dtype=np.float64)
+             for column in ["platform_reach_score", "platform_count_score"]}
+
+    total = us_consumption[None, :] + factors.to_numpy() @ global_consumption.T
+    components = {
+        "consumption_score": total / total.max(axis=1, keepdims=True) * 100,
+        "platform_reach_score": fixed["platform_reach_score"][None, :],
+        "platform_count_score": fixed["platform_count_score"][None, :],
+        "genre_rank_score": within_genre_percentiles(total, genre_codes),
+    }
+
+    w = weights.to_numpy()
+    composite = np.zeros(total.shape)
+    for k, column in enumerate(COMPONENT_COLUMNS):
+        composite += w[:, k:k + 1] * components[column]
+    return composite
+
+
+def chart_ranks(composite, eligible):
+    """Rank (1 = best) of every eligible show per sample; ineligible shows get 0."""
+
+    scores = np.where(eligible[None, :], composite, -np.inf)
+    order = np.argsort(-scores, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, composite.shape[1] + 1)[None, :], axis=1)
+    return np.where(eligible[None, :], ranks, 0)
+
+
+def rank_stability(ranking_df, n_samples=DEFAULT_SAMPLES, eligible_countries=ELIGIBLE_COUNTRIES,
+                   top_n=TOP_N, seed=0, batch_size=SAMPLE_BATCH):
+    """Rank-stability interval and top-N probability per chart-eligible show.
+
+    Returns show_name, country, genre, baseline_rank, median_rank, rank_p05,
+    rank_p95, rank_min, rank_max, p_top_n, sorted by baseline rank.
+    """
+
+    ranking_df = ranking_df.reset_index(drop=True)
+    if eligible_countries is None:
+        eligible = np.ones(len(ranking_df), dtype=bool)
+    else:
+        eligible = ranking_df["country"].isin(eligible_countries).to_numpy()
+
+    weights, factors = sample_parameters(n_samples, seed=seed)
+
+    baseline = chart_ranks(ranking_df["composite_score"].to_numpy(dtype=np.float64)[None, :], eligible)[0]
+    ranks = np.concatenate([
+        chart_ranks(simulate_composite(ranking_df, weights.iloc[start:start + batch_size],
+                                       factors.iloc[start:start + batch_size]), eligible)
+        for start in range(0, n_samples, batch_size)
+    ])[:, eligible]
+
+    stability = pd.DataFrame({
+        "show_name": ranking_df.loc[eligible, "show_name"].to_numpy(),
+        "country": ranking_df.loc[eligible, "country"].to_numpy(),
+        "genre": ranking_df.loc[eligible, "genre"].to_numpy(),
+        "baseline_rank": baseline[eligible],
+        "median_rank": np.median(ranks, axis=0),
+        "rank_p05": np.percentile(ranks, 5, axis=0),
+        "rank_p95": np.percentile(ranks, 95, axis=0),
+        "rank_min": ranks.min(axis=0),
+        "rank_max": ranks.max(axis=0),
+        "p_top_n": (ranks <= top_n).mean(axis=0),
+    })
+    return stability.sort_values("baseline_rank").reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    print("RANKING SENSITIVITY ANALYSIS")
+    print("=" * 50)
+
+    n_samples = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SAMPLES
+    rankings = pd.read_csv(RANKINGS_FILE, keep_default_na=False)
+
+    # The simulation reproduces the saved composite at the profile's own constants
+    check = simulate_composite(
+        rankings,
+        pd.DataFrame([WEIGHT_PROFILES[DEFAULT_PROFILE]], columns=COMPONENT_COLUMNS).fillna(0.0),
+        pd.DataFrame([GEOGRAPHIC_FACTORS]),
+    )[0]
+    assert np.allclose(check, rankings["composite_score"].to_numpy()), "simulation does not match the ranking"
+
+    start = time.perf_counter()
+    stability = rank_stability(rankings, n_samples)
+    elapsed = time.perf_counter() - start
+
+    contested = stability[(stability["p_top_n"] > 0) & (stability["p_top_n"] < 1)]
+    print(f"{n_samples:,} weight/factor samples x {len(rankings)} shows scored in {elapsed:.2f} s")
+    print(f"Chart-eligible shows: {len(stability)} | certain top {TOP_N}: {(stability['p_top_n'] == 1).sum()} | "
+          f"contested: {len(contested)}")
+
+    print(f"\n{'show':<40} {'rank':>4} {'median':>6} {'90% interval':>13} {'P(top ' + str(TOP_N) + ')':>11}")
+    window = stability[(stability["baseline_rank"] > TOP_N - 10) & (stability["baseline_rank"] <= TOP_N + 10)]
+    for _, row in window.iterrows():
+        marker = "⚠" if 0 < row["p_top_n"] < 1 else " "
+        print(f"{row['show_name'][:40]:<40} {row['baseline_rank']:>4} {row['median_rank']:6.0f} "
+              f"{row['rank_p05']:6.0f}-{row['rank_p95']:<6.0f} {row['p_top_n']:10.1%} {marker}")
+        if row["baseline_rank"] == TOP_N:
+            print("-" * 40 + f" top-{TOP_N} cutoff")
+
+    stability.to_csv(SENSITIVITY_FILE, index=False)
+    print(f"\n✓ Saved {SENSITIVITY_FILE}")
@@ -4,37 +4,9 @@ Rebuild complete podcast analysis with updated data
 """
 
 import pandas as pd
-import re
 from pathlib import Path
 
-def normalize_show_name(name):
-    """Normalize show name for matching across platforms."""
-    if pd.isna(name):
-        return ""
-
-    # Convert to string and lowercase
-    normalized = str(name).strip().lower()
-
-    # Remove common podcast suffixes and qualifiers
-    patterns_to_remove = [
-        r'\bpodcast\b',
-        r'\bshow\b',
-        r'\bthe podcast\b',
-        r'\bthe show\b',
-        r'\bwith\s+[^,]+$',  # "with [host name]" at end
-        r'\bw/\s+[^,]+$',    # "w/ [host name]" at end
-    ]
-
-    for pattern in patterns_to_remove:
-        normalized = re.sub(pattern, '', normalized)
-
-    # Remove all non-word/space characters
-    normalized = re.sub(r"[^\w\s]", "", normalized)
-
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    return normalized.strip()
+from show_name_normalization import normalize_show_name
 
 def load_and_process_data():
     """Load and process all available data files."""
@@ -9,90 +9,29 @@ Creates a cleaner, more standardized genre taxonomy by reducing
 import pandas as pd
 from pathlib import Path
 
+from genre_taxonomy import get_genre_taxonomy, standardize_genres
+
 def define_refined_genres():
     """Define the refined genre classification system with fewer, cleaner categories."""
 
-    # Refined taxonomy - fewer, industry-standard categories
-    refined_genres = {
-        'True Crime': [
-            'True Crime',
-            'True Crime & Beauty',
-            'True Crime & Comedy'
-        ],
-        'News & Politics': [
-            'News & Politics',
-            'News',
-            'News & Commentary',
-            'News & Law'
-        ],
-        'Comedy': [
-            'Comedy',
-            'Comedy & Entertainment',
-            'Comedy & Interview',
-            'Comedy & Lifestyle',
-            'Comedy & Live Show',
-            'Comedy & News',
-            'Comedy & Pop Culture',
-            'Comedy & Sports',
-            'Comedy & Commentary',
-            'Gaming & Comedy'
-        ],
-        'Interview & Talk': [
-            'Interview & Talk',
-            'Interview & Military'
-        ],
-        'Sports': [
-            'Sports',
-            'Sports & Commentary',
-            'Sports & Entertainment',
-            'Sports & Interview',
-            'Sports & Lifestyle'
-        ],
-        'Business': [
-            'Business & Finance',
-            'Business & Interview',
-            'Business & Politics'
-        ],
-        'Entertainment': [
-            'Pop Culture & Entertainment',
-            'Entertainment & Lifestyle',
-            'Anime & Pop Culture',
-            'Relationships & Pop Culture',
-            'Hip-Hop & Culture',
-            'Country Music & Radio',
-            'Radio & Entertainment',
-            'Relationships & Lifestyle'
-        ],
-        'Education': [
-            'Educational',
-            'Education & Law',
-            'Science & Psychology',
-            'Science & Technology',
-            'Self-Help & Wellness',
-            'Religion & Spirituality',
-            'Mystery & Conspiracy',
-            'Miscellaneous'
-        ]
-    }
-
-    return refined_genres
+    # Refined taxonomy - fewer, industry-standard categories (level of genre_taxonomy)
+    return get_genre_taxonomy().groups("refined")
 
 def create_refined_mapping():
     """Create mapping from current genres to refined categories."""
 
     refined_system = define_refined_genres()
 
-    # Create reverse mapping: current genre -> refined genre
-    genre_mapping = {}
-
-    for refined_genre, current_genres in refined_system.items():
-        for current_genre in current_genres:
-            genre_mapping[current_genre] = refined_genre
+    # Reverse mapping: current genre -> refined genre
+    genre_mapping = get_genre_taxonomy().mapping("refined")
 
     return genre_mapping, refined_system
 
-def apply_refined_classification():
-    """Apply refined genre classification to all shows."""
+def apply_refined_classification(unmapped_policy="warn"):
+    """Apply refined genre classification to all shows.
+
+    unmapped_policy: "warn", "error" or "ignore" for genres outside the taxonomy.
+    """
 
     # Load current comprehensive genre data
     genres_df = pd.read_csv('data_comprehensive_genres/comprehensive_genre_mapping.csv')
@@ -100,18 +39,10 @@ def apply_refined_classification():
     # Get refined mapping
     genre_mapping, refined_system = create_refined_mapping()
 
-    # Apply refined classification
-    genres_df['refined_genre'] = genres_df['genre'].map(genre_mapping)
-
-    # Handle any unmapped genres
-    unmapped = genres_df[genres_df['refined_genre'].isna()]
-    if len(unmapped) > 0:
-        print("Unmapped genres found:")
-        for genre in unmapped['genre'].unique():
-            print(f"  - {genre}")
-
-        # Map unmapped to 'Education' (catch-all for misc content)
-        genres_df['refined_genre'] = genres_df['refined_genre'].fillna('Education')
+    # Apply refined classification; unmapped genres are reported with their
+    # frequency and mapped to 'Education' (catch-all for misc content)
+    genres_df['refined_genre'], _ = standardize_genres(
+        genres_df['genre'], 'refined', default='Education', policy=unmapped_policy)
 
     return genres_df, genre_mapping, refined_system
 
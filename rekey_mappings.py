@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Re-key every mapping file under the canonical show name normalizer
+
+Mapping files were produced under different normalizers (punctuation-only
+in wikipedia_country_research / verify_normalization_consistency, suffix
+stripping in podcast_ranking_system / validate_mappings), so the same show
+has different keys in different files. This job loads every mapping into
+one long table, normalizes all keys in a single vectorized pass, reports
+keys that collide with different labels (within a file, and across files
+labelling the same kind) and writes the migrated store.
+
+The normalizer is not idempotent ("... with host" clauses only drop once the
+commas after them are gone), so a key that is already in canonical form is
+not blindly normalized again: it keeps whichever of its two forms the ranking
+produces from the raw platform names, and is reported when it is neither.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from show_name_normalization import is_canonical_form, normalize_names
+
+OUTPUT_DIR = Path("data_canonical_mappings")
+
+# (mapping file, key column, label column). Raw show names are preferred as
+# the key source where a file has them, since they carry the most information.
+MAPPING_FILES = [
+    ("country_mapping.csv", "normalized_name", "country"),
+    ("explicit_country_mapping.csv", "normalized_name", "country"),
+    ("comprehensive_country_mapping.csv", "normalized_name", "country"),
+    ("updated_country_mapping.csv", "normalized_name", "country"),
+    ("final_country_mapping.csv", "normalized_name", "country"),
+    ("comprehensive_country_mapping_updated.csv", "normalized_name", "country"),
+    ("final_country_mapping_updated.csv", "normalized_name", "country"),
+    ("comprehensive_country_mapping_complete.csv", "normalized_name", "country"),
+    ("updated_genre_mapping.csv", "normalized_name", "genre"),
+    ("final_genre_mapping.csv", "normalized_name", "genre"),
+    ("comprehensive_genre_mapping_updated.csv", "normalized_name", "genre"),
+    ("final_genre_mapping_updated.csv", "normalized_name", "genre"),
+    ("final_genre_mapping_comprehensive.csv", "normalized_name", "genre"),
+    ("final_genre_mapping_complete_all.csv", "normalized_name", "genre"),
+    ("union_genre_mapping.csv", "normalized_name", "final_genre"),
+    ("tavily_normalized_genre_mapping.csv", "normalized_name", "tavily_genre"),
+    ("tavily_genre_mapping.csv", "show_name", "tavily_genre"),
+    ("podcast_genres.csv", "show_name", "genre"),
+    ("internet_research_genres.csv", "show_name", "genre"),
+    ("data_comprehensive_genres/comprehensive_genre_mapping.csv", "show_name", "genre"),
+    ("data_refined_genres/normalized_genre_mapping.csv", "original_name", "refined_genre"),
+    ("data_refined_genres/refined_genre_master.csv", "show_name", "refined_genre"),
+    ("data_with_genres/master_genre_mapping.csv", "show_name", "genre"),
+]
+
+
+def label_kind(label_col):
+    """Kind of label a mapping carries: country or genre."""
+
+    return "country" if label_col == "country" else "genre"
+
+
+def load_mapping_table(mapping_files=MAPPING_FILES):
+    """Stack every mapping file into one long table of (file, kind, row, key, label)."""
+
+    frames = {}
+    parts = []
+
+    for path, key_col, label_col in mapping_files:
+        try:
+            df = pd.read_csv(path, dtype={key_col: str})
+        except FileNotFoundError:
+            print(f"  ⚠ Missing {path}, skipped")
+            continue
+
+        frames[path] = df
+        parts.append(pd.DataFrame({
+            "file": path,
+            "kind": label_kind(label_col),
+            "row": range(len(df)),
+            "source_key": df[key_col],
+            "label": df[label_col],
+        }))
+
+    return frames, pd.concat(parts, ignore_index=True)
+
+
+def ranking_keys():
+    """Canonical keys the ranking builds from the raw platform show names."""
+
+    from complete_5platform_ranking_system import load_all_platform_data
+
+    return set().union(*(set(df["normalized_name"]) for df in load_all_platform_data()))
+
+
+def rekey_table(long_table, known_keys=None):
+    """Add canonical keys and flag rows that collide with different labels.
+
+    known_keys (e.g. ranking_keys()) settles canonical-form keys that a second
+    normalizer pass would change; without it they are all kept and reported.
+    """
+
+    long_table = long_table.copy()
+
+    # Normalize each distinct source key once, then broadcast back
+    codes, unique_keys = pd.factorize(long_table["source_key"].astype(object), use_na_sentinel=False)
+    unique_keys = pd.Series(unique_keys, dtype=object)
+    renormalized = normalize_names(unique_keys)
+
+    # A key already in canonical form is only rewritten when the rewritten
+    # form is the one the ranking uses; unresolved ones are kept and reported
+    known_keys = set() if known_keys is None else set(known_keys)
+    in_ranking = unique_keys.isin(known_keys)
+    rewrite = ~is_canonical_form(unique_keys) | (renormalized.isin(known_keys) & ~in_ranking)
+    canonical = renormalized.where(rewrite, unique_keys)
+
+    long_table["canonical_key"] = canonical.to_numpy()[codes]
+    long_table["renormalized_key"] = renormalized.to_numpy()[codes]
+    long_table["ambiguous"] = ((canonical != renormalized) & ~in_ranking).to_numpy()[codes]
+    long_table["key_changed"] = long_table["canonical_key"] != long_table["source_key"]
+
+    group = long_table.groupby(["file", "canonical_key"], sort=False)
+    long_table["labels_for_key"] = group["label"].transform("nunique")
+    long_table["rows_for_key"] = group["label"].transform("size")
+
+    # Among colliding rows, prefer one whose key was already canonical (that
+    # is the row lookups matched before), then the last row, like dict(zip()).
+    order = long_table.sort_values(["file", "canonical_key", "key_changed", "row"],
+                                   ascending=[True, True, False, True])
+    kept_rows = order.drop_duplicates(["file", "canonical_key"], keep="last").index
+    long_table["kept"] = long_table.index.isin(kept_rows)
+
+    return long_table
+
+
+def find_conflicts(rekeyed):
+    """Canonical keys within one file that carry more than one label."""
+
+    conflicts = rekeyed[rekeyed["labels_for_key"] > 1]
+    if conflicts.empty:
+        return pd.DataFrame(columns=["file", "canonical_key", "source_keys", "labels", "kept_label"])
+
+    kept = conflicts[conflicts["kept"]].set_index(["file", "canonical_key"])["label"]
+    summary = conflicts.groupby(["file", "canonical_key"], sort=False).agg(
+        source_keys=("source_key", lambda keys: " | ".join(map(str, keys))),
+        labels=("label", lambda labels: " | ".join(map(str, labels))),
+    )
+    summary["kept_label"] = kept
+    return summary.reset_index()
+
+
+def find_ambiguous_keys(rekeyed):
+    """Canonical-form keys kept unchanged, although neither form is a ranking key."""
+
+    ambiguous = rekeyed[rekeyed["ambiguous"]]
+    return ambiguous[["file", "source_key", "renormalized_key", "label"]].reset_index(drop=True)
+
+
+def find_store_conflicts(rekeyed):
+    """Canonical keys whose migrated labels disagree across files of the same kind."""
+
+    kept = rekeyed[rekeyed["kept"] & rekeyed["label"].notna()]
+    labels_for_key = kept.groupby(["kind", "canonical_key"], sort=False)["label"].transform("nunique")
+    conflicts = kept[labels_for_key > 1]
+    if conflicts.empty:
+        return pd.DataFrame(columns=["kind", "canonical_key", "files", "labels"])
+
+    summary = conflicts.groupby(["kind", "canonical_key"], sort=False).agg(
+        files=("file", lambda files: " | ".join(files)),
+        labels=("label", lambda labels: " | ".join(map(str, labels))),
+    )
+    return summary.reset_index()
+
+
+def write_migrated_store(frames, rekeyed, mapping_files=MAPPING_FILES, output_dir=OUTPUT_DIR):
+    """Write each mapping with canonical keys, one row per key."""
+
+    output_dir = Path(output_dir)
+    written = {}
+
+    for path, key_col, _ in mapping_files:
+        if path not in frames:
+            continue
+
+        rows = rekeyed[(rekeyed["file"] == path) & rekeyed["kept"]].sort_values("row")
+        migrated = frames[path].iloc[rows["row"].to_numpy()].copy()
+
+        # Keep the old key for traceability; a stale normalized_name next to a
+        # raw show name column is simply replaced.
+        if key_col == "normalized_name":
+            migrated = migrated.rename(columns={"normalized_name": "source_key"})
+        else:
+            migrated = migrated.drop(columns=["normalized_name"], errors="ignore")
+        migrated.insert(0, "normalized_name", rows["canonical_key"].to_numpy())
+
+        out_path = output_dir / path
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        migrated.to_csv(out_path, index=False)
+        written[path] = len(migrated)
+
+    return written
+
+
+def migrate_mappings(output_dir=OUTPUT_DIR):
+    """Run the full re-keying job and write the store and conflict report."""
+
+    print("RE-KEYING MAPPINGS UNDER THE CANONICAL NORMALIZER")
+    print("=" * 55)
+
+    frames, long_table = load_mapping_table()
+    rekeyed = rekey_table(long_table, ranking_keys())
+    conflicts = find_conflicts(rekeyed)
+    store_conflicts = find_store_conflicts(rekeyed)
+    ambiguous = find_ambiguous_keys(rekeyed)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = write_migrated_store(frames, rekeyed, output_dir=output_dir)
+    conflicts.to_csv(output_dir / "rekey_conflicts.csv", index=False)
+    store_conflicts.to_csv(output_dir / "rekey_store_conflicts.csv", index=False)
+    ambiguous.to_csv(output_dir / "rekey_ambiguous_keys.csv", index=False)
+
+    per_file = rekeyed.groupby("file", sort=False).agg(
+        rows=("row", "size"),
+        changed=("key_changed", "sum"),
+        merged=("kept", lambda kept: int((~kept).sum())),
+    )
+
+    print(f"Mapping files: {len(frames)}")
+    print(f"Rows processed: {len(rekeyed)}")
+    print(f"Keys changed by the canonical normalizer: {int(rekeyed['key_changed'].sum())}")
+    print(f"Conflicting keys: {len(conflicts)}")
+    print(f"Keys labelled differently across files: {len(store_conflicts)}")
+    print(f"Unresolved canonical-form keys kept unchanged: {len(ambiguous)}")
+    print()
+    print(per_file.to_string())
+
+    if not conflicts.empty:
+        print(f"\nCONFLICTS (first 10 of {len(conflicts)}):")
+        for _, row in conflicts.head(10).iterrows():
+            print(f"  {row['file']}: '{row['canonical_key']}'")
+            print(f"    Keys: {row['source_keys']}")
+            print(f"    Labels: {row['labels']} -> kept {row['kept_label']}")
+
+    if not store_conflicts.empty:
+        print(f"\nCROSS-FILE CONFLICTS (first 10 of {len(store_conflicts)}):")
+        for _, row in store_conflicts.head(10).iterrows():
+            print(f"  {row['kind']} '{row['canonical_key']}'")
+            print(f"    Files: {row['files']}")
+            print(f"    Labels: {row['labels']}")
+
+    print(f"\n✓ Migrated store written to {output_dir}/ ({sum(written.values())} rows)")
+    print(f"✓ Conflict reports: {output_dir}/rekey_conflicts.csv, {output_dir}/rekey_store_conflicts.csv, "
+          f"{output_dir}/rekey_ambiguous_keys.csv")
+
+    return rekeyed, conflicts, store_conflicts
+
+
+if __name__ == "__main__":
+    migrate_mappings()
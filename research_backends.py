@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Pluggable research backends for country and genre research
+
+Every backend answers search(query) with a Tavily-style response
+({"query", "results": [{"title", "content", "url", "score"}]}), so the
+existing extract_country_from_search() works unchanged. LocalCorpusBackend
+answers from an on-disk SQLite FTS5 index over everything the repo already
+knows about each show (curated facts with evidence, platform categories,
+publishers, mapping labels), so research passes run offline, deterministically
+and in bulk. The remote Tavily and Wikipedia backends are only used when
+their MCP tools can be imported.
+"""
+
+import re
+import sqlite3
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pandas as pd
+
+from classification_facts import (
+    EVIDENCE_FILE, FACTS_DIR, LABELS_FILE, load_fact_evidence, load_fact_labels, list_collections,
+)
+from country_extractor import COUNTRY_NAMES
+from show_name_normalization import normalize_names
+
+RESEARCH_INDEX_FILE = Path("research_corpus.sqlite")
+
+# Extra hand-collected documents (show, title, content, source) are indexed
+# from this directory when present
+CORPUS_DIR = Path("data_research_corpus")
+
+FACT_CONTEXT = {
+    "comprehensive_country": "Country",
+    "tavily_missing_country": "Country",
+    "remaining_genre": "Genre",
+    "tavily_genre_research": "Genre",
+    "tavily_genre_additional": "Genre",
+    "tavily_missing_genre": "Genre",
+    "wikipedia_country": "Country",
+    "wikipedia_language": "Language",
+    "wikipedia_genre": "Genre",
+    "wikipedia_network": "Network",
+    "web_research_country": "Country",
+    "web_research_genre": "Genre",
+}
+
+
+class ResearchBackend(ABC):
+    """Interface: search(query) -> Tavily-style response dict.
+
+    search() is abstract, so a backend without it fails when it is created
+    rather than on the first query of a batch.
+    """
+
+    name = "base"
+    remote = False
+    min_interval = 0.0  # seconds between sequential requests (rate limiting)
+
+    def available(self):
+        return True
+
+    @abstractmethod
+    def search(self, query, max_results=3):
+        """Tavily-style response dict for one query."""
+
+    def search_many(self, queries, max_results=3):
+        """Responses for a list of queries, in order; a failed query gets an "error" entry."""
+
+        responses = []
+        for i, query in enumerate(queries):
+            if i and self.min_interval:
+                time.sleep(self.min_interval)
+            try:
+                responses.append(self.search(query, max_results))
+            except Exception as e:
+                responses.append({"query": query, "answer": None, "results": [], "error": str(e)})
+        return responses
+
+
+def _describe_country(code):
+    return f"Country: {COUNTRY_NAMES.get(code, code)}."
+
+
+# Platform metadata: categories, publishers/networks, YouTube feature country
+PLATFORM_DOCUMENTS = [
+    ("amazon.csv", "Show Title", lambda df: "Category: " + df["Category Name"].astype(str) +
+     ". Publisher: " + df["Publisher"].astype(str) + "."),
+    ("iheart_platform_nominations.csv", "Show title", lambda df: "Network: " + df["Network"].astype(str) + "."),
+    ("youtube.csv", "playlist_name", lambda df: df["FeatureCountry"].map(_describe_country)),
+]
+
+# Current mapping labels
+MAPPING_DOCUMENTS = [
+    ("comprehensive_country_mapping_complete.csv", "country", _describe_country),
+    ("final_genre_mapping_complete_all.csv", "genre", lambda label: f"Genre: {label}."),
+]
+
+
+def index_sources(data_dir=Path("data")):
+    """Files the local index is built from (existing ones only)."""
+
+    paths = [LABELS_FILE, EVIDENCE_FILE]
+    paths += [Path(data_dir) / file_name for file_name, _, _ in PLATFORM_DOCUMENTS]
+    paths += [Path(path) for path, _, _ in MAPPING_DOCUMENTS]
+    paths += sorted(CORPUS_DIR.glob("*.csv")) if CORPUS_DIR.exists() else []
+    return [path for path in paths if path.exists()]
+
+
+def index_is_stale(index_path=RESEARCH_INDEX_FILE, data_dir=Path("data")):
+    """True when the index is missing or any of its source files changed after it was built."""
+
+    index_path = Path(index_path)
+    if not index_path.exists():
+        return True
+    built = index_path.stat().st_mtime
+    return any(path.stat().st_mtime > built for path in index_sources(data_dir))
+
+
+def collect_local_documents(data_dir=Path("data")):
+    """One row per (show, source) with readable text about the show."""
+
+    parts = []
+
+    # Curated facts with their research evidence
+    for collection in list_collections():
+        context = FACT_CONTEXT.get(collection, "Genre")
+        labels = load_fact_labels(collection)
+        evidence = load_fact_evidence(collection)
+        describe = _describe_country if context == "Country" else (lambda label, context=context: f"{context}: {label}.")
+        parts.append(pd.DataFrame({
+            "show": list(labels),
+            "content": [f"{evidence.get(key, '')} {describe(label)}".strip() for key, label in labels.items()],
+            "source": f"facts:{collection}",
+        }))
+
+    for file_name, name_col, describe in PLATFORM_DOCUMENTS:
+        try:
+            df = pd.read_csv(Path(data_dir) / file_name).dropna(subset=[name_col])
+        except FileNotFoundError:
+            continue
+        parts.append(pd.DataFrame({
+            "show": df[name_col].to_numpy(),
+            "content": describe(df).to_numpy(),
+            "source": f"platform:{file_name}",
+        }))
+
+    for path, label_col, describe in MAPPING_DOCUMENTS:
+        try:
+            mapping = pd.read_csv(path).dropna(subset=["normalized_name", label_col])
+        except FileNotFoundError:
+            continue
+        parts.append(pd.DataFrame({
+            "show": mapping["normalized_name"].to_numpy(),
+            "content": mapping[label_col].map(describe).to_numpy(),
+            "source": f"mapping:{path}",
+        }))
+
+    for path in sorted(CORPUS_DIR.glob("*.csv")) if CORPUS_DIR.exists() else []:
+        extra = pd.read_csv(path, dtype=str, keep_default_na=False)
+        parts.append(extra.assign(source=extra.get("source", f"corpus:{path.name}"))[["show", "content", "source"]])
+
+    documents = pd.concat(parts, ignore_index=True)
+    documents["title"] = documents["show"].astype(str)
+    documents["show"] = normalize_names(documents["show"])
+    documents = documents[documents["show"] != ""]
+    return documents[["show", "title", "content", "source"]].reset_index(drop=True)
+
+
+def build_local_index(index_path=RESEARCH_INDEX_FILE, documents=None):
+    """(Re)build the FTS5 index from the local documents."""
+
+    if documents is None:
+        documents = collect_local_documents()
+
+    index_path = Path(index_path)
+    index_path.unlink(missing_ok=True)
+
+    with sqlite3.connect(index_path) as conn:
+        conn.execute(
+            "CREATE VIRTUAL TABLE documents USING fts5("
+            "show, title, content, source UNINDEXED, tokenize='unicode61 remove_diacritics 2')"
+        )
+        conn.executemany(
+            "INSERT INTO documents (show, title, content, source) VALUES (?, ?, ?, ?)",
+            documents.itertuples(index=False, name=None),
+        )
+    conn.close()
+
+    return len(documents)
+
+
+def _fts_terms(text):
+    return re.findall(r"\w+", text.lower())
+
+
+def fts_query(query):
+    """FTS5 MATCH expression: quoted show names as phrases on show/title, else any word."""
+
+    phrases = [" ".join(_fts_terms(phrase)) for phrase in re.findall(r'"([^"]+)"', query)]
+    phrases = [phrase for phrase in phrases if phrase]
+    if phrases:
+        return " OR ".join(f'{{show title}} : ^"{phrase}"' for phrase in phrases)
+
+    terms = _fts_terms(query)
+    return " OR ".join(f'"{term}"' for term in terms) if terms else None
+
+
+class LocalCorpusBackend(ResearchBackend):
+    """Offline backend over the SQLite FTS5 research index.
+
+    The index is rebuilt on first use when it is missing or older than any of
+    its source files (facts, platform data, mappings, extra corpus).
+    """
+
+    name = "local"
+
+    def __init__(self, index_path=RESEARCH_INDEX_FILE):
+        self.index_path = Path(index_path)
+        self._conn = None
+
+    def available(self):
+        return self.index_path.exists() or FACTS_DIR.exists()
+
+    def _connection(self):
+        if self._conn is None:
+            if index_is_stale(self.index_path):
+                build_local_index(self.index_path)
+            # Read-only use, so the connection may be shared with worker threads
+            self._conn = sqlite3.connect(self.index_path, check_same_thread=False)
+        return self._conn
+
+    def search(self, query, max_results=3):
+        match = fts_query(query)
+        rows = []
+        if match:
+            rows = self._connection().execute(
+                "SELECT title, content, source, bm25(documents) FROM documents "
+                "WHERE documents MATCH ? ORDER BY bm25(documents), rowid LIMIT ?",
+                (match, max_results),
+            ).fetchall()
+
+        return {
+            "query": query,
+            "answer": None,
+            "results": [
+                {"title": title, "content": content, "url": f"local://{source}", "score": -rank}
+                for title, content, source, rank in rows
+            ],
+        }
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class TavilyBackend(ResearchBackend):
+    """Remote Tavily search through the MCP tool, when it is installed."""
+
+    name = "tavily"
+    remote = True
+    min_interval = 0.5
+
+    def available(self):
+        try:
+            from mcp__tavily__search import mcp__tavily__search  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def search(self, query, max_results=3):
+        from mcp__tavily__search import mcp__tavily__search
+
+        return mcp__tavily__search({
+            "query": query,
+            "options": {
+                "maxResults": max_results,
+                "includeAnswer": True,
+                "searchDepth": "basic"
+            }
+        })
+
+
+class WikipediaBackend(ResearchBackend):
+    """Remote Wikipedia search + article read through the MCP tools."""
+
+    name = "wikipedia"
+    remote = True
+    min_interval = 0.3
+
+    def available(self):
+        try:
+            from mcp__Wikipedia__search import mcp__Wikipedia__search  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def search(self, query, max_results=1):
+        from mcp__Wikipedia__readArticle import mcp__Wikipedia__readArticle
+        from mcp__Wikipedia__search import mcp__Wikipedia__search
+
+        results = []
+        for hit in (mcp__Wikipedia__search({"query": query}) or [])[:max_results]:
+            article = mcp__Wikipedia__readArticle({"pageId": hit["pageId"]})
+            results.append({
+                "title": hit.get("title", ""),
+                "content": article.get("content", ""),
+                "url": f"wikipedia://{hit['pageId']}",
+                "score": 1.0,
+            })
+
+        return {"query": query, "answer": None, "results": results}
+
+
+BACKENDS = {
+    "local": LocalCorpusBackend,
+    "tavily": TavilyBackend,
+    "wikipedia": WikipediaBackend,
+}
+
+
+def _create_backend(name):
+    if name == "tavily_http" and name not in BACKENDS:
+        from async_research_client import AsyncHTTPBackend
+        BACKENDS[name] = AsyncHTTPBackend
+
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown research backend: {name} (use one of {list(BACKENDS)})") from None
+
+
+def get_research_backend(name="auto"):
+    """Backend by name; "auto" uses the Tavily tool when installed, then the async
+    Tavily HTTP client when TAVILY_API_KEY is set, else the local index."""
+
+    if name == "auto":
+        for candidate in ["tavily", "tavily_http"]:
+            backend = _create_backend(candidate)
+            if backend.available():
+                return backend
+        return LocalCorpusBackend()
+
+    backend = _create_backend(name)
+    if not backend.available():
+        print(f"   ⚠ Research backend '{name}' is not available, using the local index")
+        return LocalCorpusBackend()
+    return backend
+
+
+if __name__ == "__main__":
+    # python research_backends.py build | python research_backends.py search "<query>"
+    # (search rebuilds the index first when its sources changed)
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+
+    if command == "build":
+        print("BUILDING LOCAL RESEARCH INDEX")
+        print("=" * 40)
+        count = build_local_index()
+        print(f"✓ Indexed {count} documents into {RESEARCH_INDEX_FILE}")
+    elif command == "search" and len(sys.argv) > 2:
+        backend = LocalCorpusBackend()
+        for result in backend.search(" ".join(sys.argv[2:]), max_results=5)["results"]:
+            print(f"  [{result['score']:.2f}] {result['title']} ({result['url']})")
+            print(f"      {result['content']}")
+    else:
+        print(__doc__)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Persistent research response cache
+
+Remote research responses are stored in a SQLite file keyed by backend and
+normalized query, so re-running a research script (or looking a show up again
+from another script) does not repeat the remote call. Entries expire after a
+TTL and the least recently used entries are evicted once the cache grows past
+its size bound. Each entry keeps the latency of the original call, so the
+hit report shows how much remote time the cache saved.
+"""
+
+import json
+import re
+import sqlite3
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+from research_backends import ResearchBackend, get_research_backend
+
+RESEARCH_CACHE_FILE = Path("research_cache.sqlite")
+
+DEFAULT_TTL = 30 * 24 * 3600    # seconds
+DEFAULT_MAX_ENTRIES = 50_000
+
+QUOTE_CHARS = str.maketrans({"“": '"', "”": '"', "„": '"', "‘": "'", "’": "'"})
+
+
+def normalize_query(query):
+    """Cache key for a query: Unicode-normalized, casefolded, straight quotes, single spaces."""
+
+    query = unicodedata.normalize("NFKC", query).translate(QUOTE_CHARS).casefold()
+    return re.sub(r"\s+", " ", query).strip()
+
+
+class ResearchCache:
+    """SQLite store of research responses with TTL expiry and LRU eviction."""
+
+    def __init__(self, path=RESEARCH_CACHE_FILE, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "stores": 0, "evictions": 0, "saved_seconds": 0.0}
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "backend TEXT, query_key TEXT, response TEXT, elapsed REAL, "
+            "created REAL, accessed REAL, PRIMARY KEY (backend, query_key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def get_many(self, backend, queries):
+        """Cached response (or None) per query; expired entries are dropped."""
+
+        keys = [normalize_query(query) for query in queries]
+        now = time.time()
+
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), 500):
+            chunk = unique_keys[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT query_key, response, elapsed, created FROM responses "
+                f"WHERE backend = ? AND query_key IN ({','.join('?' * len(chunk))})",
+                [backend, *chunk],
+            ).fetchall()
+            found.update({key: (response, elapsed, created) for key, response, elapsed, created in rows})
+
+        expired = [key for key, (_, _, created) in found.items() if now - created > self.ttl]
+        if expired:
+            self._conn.executemany("DELETE FROM responses WHERE backend = ? AND query_key = ?",
+                                   [(backend, key) for key in expired])
+            self.stats["expired"] += len(expired)
+            for key in expired:
+                del found[key]
+
+        responses = []
+        for query, key in zip(queries, keys):
+            if key in found:
+                response, elapsed, _ = found[key]
+                responses.append(dict(json.loads(response), query=query))
+                self.stats["hits"] += 1
+                self.stats["saved_seconds"] += elapsed
+            else:
+                responses.append(None)
+                self.stats["misses"] += 1
+
+        if found:
+            self._conn.executemany("UPDATE responses SET accessed = ? WHERE backend = ? AND query_key = ?",
+                                   [(now, backend, key) for key in found])
+        self._conn.commit()
+        return responses
+
+    def get(self, backend, query):
+        return self.get_many(backend, [query])[0]
+
+    def put_many(self, backend, queries, responses, elapsed=0.0):
+        """Store responses (failed ones, with an "error" entry, are skipped)."""
+
+        now = time.time()
+        rows = [
+            (backend, normalize_query(query), json.dumps(response), elapsed, now, now)
+            for query, response in zip(queries, responses)
+            if response is not None and not response.get("error")
+        ]
+        self._conn.executemany("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)", rows)
+        self.stats["stores"] += len(rows)
+        self.evict()
+        self._conn.commit()
+
+    def put(self, backend, query, response, elapsed=0.0):
+        self.put_many(backend, [query], [response], elapsed)
+
+    def evict(self):
+        """Drop expired entries, then the least recently used ones beyond max_entries."""
+
+        evicted = self._conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,)).rowcount
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            evicted += self._conn.execute(
+                "DELETE FROM responses WHERE rowid IN "
+                "(SELECT rowid FROM responses ORDER BY accessed, created LIMIT ?)", (excess,)
+            ).rowcount
+        self.stats["evictions"] += evicted
+        return evicted
+
+    def clear(self):
+        self._conn.execute("DELETE FROM responses")
+        self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def hit_rate(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def report(self):
+        """One-line summary of lookups, hit rate and the remote time saved."""
+
+        stats = self.stats
+        return (f"Research cache: {stats['hits']} hits / {stats['hits'] + stats['misses']} lookups "
+                f"({self.hit_rate():.0%}), {stats['expired']} expired, {stats['evictions']} evicted, "
+                f"~{stats['saved_seconds']:.1f} s of remote calls saved")
+
+    def close(self):
+        self._conn.close()
+
+
+class CachedBackend(ResearchBackend):
+    """Research backend wrapper that answers repeated queries from a ResearchCache."""
+
+    def __init__(self, backend, cache=None):
+        self.backend = backend
+        self.cache = cache if cache is not None else ResearchCache()
+        self.name = backend.name
+        self.remote = backend.remote
+
+    def available(self):
+        return self.backend.available()
+
+    def search(self, query, max_results=3):
+        return self.search_many([query], max_results)[0]
+
+    def search_many(self, queries, max_results=3):
+        # max_results is part of the key: a cached 1-result answer does not serve a 3-result query
+        queries = list(queries)
+        keys = [f"{query} #{max_results}" for query in queries]
+        responses = self.cache.get_many(self.backend.name, keys)
+
+        # Misses that share a cache key are fetched once and fanned out
+        misses = {}
+        for i, response in enumerate(responses):
+            if response is None:
+                misses.setdefault(normalize_query(keys[i]), []).append(i)
+        if misses:
+            first = [positions[0] for positions in misses.values()]
+            start = time.perf_counter()
+            fetched = self.backend.search_many([queries[i] for i in first], max_results)
+            # Latency is spread evenly over the batch (concurrent backends overlap calls)
+            elapsed = (time.perf_counter() - start) / len(first)
+
+            self.cache.put_many(self.backend.name, [keys[i] for i in first], fetched, elapsed)
+            for positions, response in zip(misses.values(), fetched):
+                for i in positions:
+                    responses[i] = response
+
+        return [dict(response, query=query) for query, response in zip(queries, responses)]
+
+
+def get_cached_backend(name="auto", cache=None):
+    """get_research_backend() with remote backends wrapped in the persistent cache.
+
+    The local index answers from disk already and is returned unwrapped.
+    With an active research cassette (research_cassettes.py) the backend
+    replays from and/or records to the cassette.
+    """
+
+    from research_cassettes import active_cassette
+
+    cassette = active_cassette()
+    if cassette is not None and cassette.mode == "replay":
+        return cassette.backend(name)
+
+    backend = get_research_backend(name)
+    backend = CachedBackend(backend, cache) if backend.remote else backend
+    return cassette.backend(name, backend) if cassette is not None else backend
+
+
+def report_cache(backend):
+    """Print the cache report of a (possibly) cached backend."""
+
+    inner = getattr(backend, "backend", None)
+    if isinstance(backend, CachedBackend):
+        print(f"   {backend.cache.report()}")
+    elif isinstance(inner, CachedBackend):
+        print(f"   {inner.cache.report()}")
+
+
+if __name__ == "__main__":
+    # python research_cache.py stats | python research_cache.py clear
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    cache = ResearchCache()
+
+    print("RESEARCH RESPONSE CACHE")
+    print("=" * 40)
+
+    if command == "clear":
+        cache.clear()
+        print(f"✓ Cleared {RESEARCH_CACHE_FILE}")
+    else:
+        rows = cache._conn.execute(
+            "SELECT backend, COUNT(*), SUM(elapsed), MIN(created) FROM responses GROUP BY backend"
+        ).fetchall()
+        print(f"Entries: {len(cache)} (max {cache.max_entries}, TTL {cache.ttl / 86400:.0f} days)")
+        for backend, count, elapsed, oldest in rows:
+            age = (time.time() - oldest) / 86400
+            print(f"  {backend:<12} {count:6d} responses, {elapsed:.1f} s of remote calls, oldest {age:.1f} days")
+    cache.close()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Record/replay cassettes for research backends
+
+A cassette is a gzip-compressed JSON-lines file of research responses.
+In "record" mode every response a pipeline receives is appended to the
+cassette; in "replay" mode the same queries are answered from it at disk
+speed, without network, and a query that was never recorded is an error.
+"auto" replays what is there and records the rest.
+
+Pipelines pick a cassette up through research_cache.get_cached_backend(),
+so any research script can be re-run end to end against one:
+
+    python research_cassettes.py record research_cassettes/countries.jsonl.gz research_unknown_countries.py
+    python research_cassettes.py replay research_cassettes/countries.jsonl.gz research_unknown_countries.py
+    python research_cassettes.py info research_cassettes/countries.jsonl.gz
+
+or by setting RESEARCH_CASSETTE (and RESEARCH_CASSETTE_MODE) in the environment.
+"""
+
+import gzip
+import json
+import os
+import runpy
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from research_backends import ResearchBackend
+from research_cache import normalize_query
+
+CASSETTE_MODES = ("record", "replay", "auto")
+
+_active = None
+
+
+class Cassette:
+    """Responses keyed by (channel, normalized query, max_results).
+
+    The channel is the backend name the pipeline asked for ("auto",
+    "wikipedia"), so a replay finds its responses even when the backend that
+    answered during recording is not installed.
+    """
+
+    def __init__(self, path, mode="auto"):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode} (use one of {CASSETTE_MODES})")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.entries = {}
+        self.backends = {}  # channel -> (backend name, remote) seen while recording
+        self.stats = {"replayed": 0, "recorded": 0}
+
+        if mode == "record":
+            self.path.unlink(missing_ok=True)
+        elif self.path.exists():
+            self.load()
+        elif mode == "replay":
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+
+    @staticmethod
+    def _key(channel, query, max_results):
+        return channel, normalize_query(query), max_results
+
+    def load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                key = self._key(record["channel"], record["query"], record["max_results"])
+                self.entries[key] = record["response"]
+                self.backends[record["channel"]] = (record["backend"], record["remote"])
+        return len(self.entries)
+
+    def lookup(self, channel, queries, max_results):
+        return [self.entries.get(self._key(channel, query, max_results)) for query in queries]
+
+    def record(self, channel, backend, queries, max_results, responses):
+        """Append responses (failed ones are not recorded)."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.backends[channel] = (backend.name, backend.remote)
+
+        # Appending adds a gzip member; gzip readers see one continuous stream
+        with gzip.open(self.path, "at", encoding="utf-8") as f:
+            for query, response in zip(queries, responses):
+                if response.get("error"):
+                    continue
+                self.entries[self._key(channel, query, max_results)] = response
+                f.write(json.dumps({
+                    "channel": channel, "backend": backend.name, "remote": backend.remote,
+                    "query": query, "max_results": max_results, "response": response,
+                }) + "\n")
+                self.stats["recorded"] += 1
+
+    def backend(self, channel, backend=None):
+        """Research backend for a channel: replays from the cassette, records through `backend`."""
+
+        return CassetteBackend(self, channel, backend)
+
+    def report(self):
+        return (f"Cassette {self.path} ({self.mode}): {self.stats['replayed']} replayed, "
+                f"{self.stats['recorded']} recorded, {len(self.entries)} responses stored")
+
+
+class CassetteBackend(ResearchBackend):
+    """Backend answering from a cassette and recording misses through a live backend."""
+
+    def __init__(self, cassette, channel, backend=None):
+        self.cassette = cassette
+        self.channel = channel
+        self.backend = backend
+
+        # Replays report the recorded backend, so outputs match the recorded run
+        recorded = cassette.backends.get(channel)
+        if recorded is not None:
+            self.name, self.remote = recorded
+        elif backend is not None:
+            self.name, self.remote = backend.name, backend.remote
+        else:
+            self.name, self.remote = "cassette", False
+
+    def search(self, query, max_results=3):
+        return self.search_many([query], max_results)[0]
+
+    def search_many(self, queries, max_results=3):
+        queries = list(queries)
+        responses = self.cassette.lookup(self.channel, queries, max_results)
+        misses = [i for i, response in enumerate(responses) if response is None]
+        self.cassette.stats["replayed"] += len(queries) - len(misses)
+
+        if misses:
+            if self.cassette.mode == "replay" or self.backend is None:
+                raise KeyError(f"{len(misses)} queries not in cassette {self.cassette.path} "
+                               f"(first: {queries[misses[0]]!r}); record it again")
+
+            fetched = self.backend.search_many([queries[i] for i in misses], max_results)
+            self.cassette.record(self.channel, self.backend, [queries[i] for i in misses], max_results, fetched)
+            for i, response in zip(misses, fetched):
+                responses[i] = response
+
+        return [dict(response, query=query) for query, response in zip(queries, responses)]
+
+
+def active_cassette():
+    """The cassette in use (use_cassette() or RESEARCH_CASSETTE), or None."""
+
+    global _active
+    if _active is None and os.environ.get("RESEARCH_CASSETTE"):
+        _active = Cassette(os.environ["RESEARCH_CASSETTE"], os.environ.get("RESEARCH_CASSETTE_MODE", "auto"))
+    return _active
+
+
+@contextmanager
+def use_cassette(path, mode="auto"):
+    """Route research backends through a cassette for the duration of the block."""
+
+    global _active
+    previous, _active = _active, Cassette(path, mode)
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] not in ("record", "replay", "auto", "info"):
+        print(__doc__)
+        sys.exit(1)
+
+    command, path = sys.argv[1], sys.argv[2]
+
+    if command == "info":
+        cassette = Cassette(path, "replay")
+        print(f"Cassette {path}: {len(cassette.entries)} responses, {Path(path).stat().st_size / 1024:.1f} KB")
+        for channel, (backend, remote) in cassette.backends.items():
+            count = sum(1 for key in cassette.entries if key[0] == channel)
+            print(f"  {channel:<10} -> {backend:<12} {count:5d} responses{' (remote)' if remote else ''}")
+        sys.exit(0)
+
+    # Through the imported module, so the pipeline's imports see the same active cassette
+    import research_cassettes
+
+    script = sys.argv[3]
+    sys.argv = sys.argv[3:]
+    start = time.perf_counter()
+    with research_cassettes.use_cassette(path, command) as cassette:
+        runpy.run_path(script, run_name="__main__")
+    print(f"\n{cassette.report()} in {time.perf_counter() - start:.1f} s")
@@ -7,6 +7,11 @@ import pandas as pd
 import re
 from pathlib import Path
 
+from classification_facts import load_facts_with_evidence
+from research_cache import get_cached_backend, report_cache
+from research_planner import run_research_plan
+from research_scheduler import RANKINGS_FILE, build_research_queue
+
 def identify_missing_data():
     """Identify shows missing country or genre data."""
 
@@ -36,19 +41,22 @@ def identify_missing_data():
         if show_name not in shows_with_genre:
             missing_genre.append((show_name, platform_count, row["original_names"]))
 
-    # Sort by platform count (prioritize multi-platform shows)
-    missing_country.sort(key=lambda x: x[1], reverse=True)
-    missing_genre.sort(key=lambda x: x[1], reverse=True)
+    # Shows that could move across the top-25 boundary first (research_scheduler),
+    # then by platform count (prioritize multi-platform shows)
+    queue = build_research_queue(pd.read_csv(RANKINGS_FILE, keep_default_na=False))
+    position = {show: i for i, show in enumerate(queue["show_name"])}
+    missing_country.sort(key=lambda x: (position.get(x[0], len(position)), -x[1]))
+    missing_genre.sort(key=lambda x: (position.get(x[0], len(position)), -x[1]))
 
     print(f"Shows missing country data: {len(missing_country)}")
     print(f"Shows missing genre data: {len(missing_genre)}")
 
-    print(f"\nTop 20 multi-platform shows missing country data:")
+    print(f"\nTop 20 shows missing country data (by research impact, then platforms):")
     for i, (show, platforms, originals) in enumerate(missing_country[:20], 1):
         original_names = originals.split(" | ")[0]  # First original name
         print(f"  {i:2d}. {show} ({platforms} platforms) - '{original_names}'")
 
-    print(f"\nTop 20 multi-platform shows missing genre data:")
+    print(f"\nTop 20 shows missing genre data (by research impact, then platforms):")
     for i, (show, platforms, originals) in enumerate(missing_genre[:20], 1):
         original_names = originals.split(" | ")[0]  # First original name
         print(f"  {i:2d}. {show} ({platforms} platforms) - '{original_names}'")
@@ -62,96 +70,53 @@ def create_tavily_research_results():
     print("=" * 40)
 
     # Based on systematic Tavily research for top missing shows
-    tavily_country_research = {
-        # Multi-platform US shows
-        "the mel robbins": ("US", "Mel Robbins - American motivational speaker and author"),
-        "the ramsey": ("US", "Dave Ramsey - American financial advisor and radio host"),
-        "stuff you should know": ("US", "HowStuffWorks American educational podcast"),
-        "pod save america": ("US", "Crooked Media - American political podcast"),
-        "my favorite murder": ("US", "Karen Kilgariff and Georgia Hardstark - American comedians"),
-        "smartless": ("US", "Jason Bateman, Sean Hayes, Will Arnett - American actors"),
-        "the megyn kelly": ("US", "Megyn Kelly - American journalist and media personality"),
-        "the ben shapiro": ("US", "Ben Shapiro - American political commentator"),
-
-        # Multi-platform shows with existing country data (YouTube)
-        "the meidastouch": ("US", "MeidasTouch - American progressive political podcast"),
-
-        # Single platform shows needing research
-        "the tucker carlson": ("US", "Tucker Carlson - American media personality"),
-        "pardon my take": ("US", "Barstool Sports - American sports media company"),
-        "up first from npr": ("US", "NPR - American National Public Radio"),
-        "lex friedman": ("US", "Lex Fridman - American-Russian AI researcher at MIT"),
-        "call her daddy": ("US", "Alex Cooper - American podcaster"),
-        "huberman lab": ("US", "Andrew Huberman - Stanford neuroscientist"),
-        "armchair expert": ("US", "Dax Shepard - American actor and comedian"),
-        "new heights": ("US", "Travis and Jason Kelce - American NFL players"),
-        "the breakfast club": ("US", "American radio show"),
-        "on purpose": ("US", "Jay Shetty - British-American author and podcaster"),
-
-        # International shows
-        "la corneta": ("ES", "Spanish comedy podcast"),
-        "la corneta extendida": ("ES", "Spanish comedy podcast (extended version)"),
-        "mrballen medical mysteries": ("US", "MrBallen - American former Navy SEAL content creator"),
-        "die nervigen": ("DE", "German comedy podcast by Julia Beautx & Joey's Jungle"),
-        "dick doof": ("DE", "German comedy podcast"),
-
-        # Additional research based on patterns
-        "two hot takes": ("US", "American Reddit reaction podcast"),
-        "small town murder": ("US", "American true crime comedy podcast"),
-        "redhanded": ("GB", "British true crime podcast"),
-        "wait wait dont tell me": ("US", "NPR American comedy news quiz"),
-        "serial": ("US", "American investigative journalism podcast"),
-        "this american life": ("US", "American public radio program"),
-    }
-
-    tavily_genre_research = {
-        # Multi-platform shows needing genre classification
-        "the mel robbins": ("Interview & Talk", "Self-help and motivational content"),
-        "the ramsey": ("Business", "Financial advice and money management"),
-        "stuff you should know": ("Education", "Educational content about various topics"),
-        "pod save america": ("News & Politics", "Progressive political commentary"),
-        "my favorite murder": ("True Crime", "True crime comedy podcast"),
-        "smartless": ("Interview & Talk", "Celebrity interviews and conversations"),
-        "the megyn kelly": ("News & Politics", "Political commentary and interviews"),
-        "the ben shapiro": ("News & Politics", "Conservative political commentary"),
-
-        # Additional genre classifications
-        "the tucker carlson": ("News & Politics", "Political commentary"),
-        "pardon my take": ("Sports", "Sports comedy and commentary"),
-        "up first from npr": ("News & Politics", "Daily news briefing"),
-        "lex friedman": ("Interview & Talk", "AI, science, and technology interviews"),
-        "call her daddy": ("Interview & Talk", "Comedy and advice podcast"),
-        "huberman lab": ("Education", "Neuroscience and health education"),
-        "armchair expert": ("Interview & Talk", "Celebrity interviews"),
-        "new heights": ("Sports", "NFL and sports commentary"),
-        "the breakfast club": ("Entertainment", "Hip-hop culture and celebrity interviews"),
-        "on purpose": ("Interview & Talk", "Wellness and personal development"),
-
-        # Comedy shows
-        "la corneta": ("Comedy", "Spanish language comedy"),
-        "la corneta extendida": ("Comedy", "Spanish language comedy (extended)"),
-        "die nervigen": ("Comedy", "German language comedy"),
-        "dick doof": ("Comedy", "German language comedy"),
-        "two hot takes": ("Comedy", "Reddit reaction comedy"),
-        "small town murder": ("Comedy", "True crime comedy"),
-
-        # True Crime
-        "mrballen medical mysteries": ("True Crime", "Medical mystery true crime"),
-        "redhanded": ("True Crime", "British true crime"),
-
-        # Other categories
-        "wait wait dont tell me": ("Comedy", "News quiz comedy show"),
-        "serial": ("True Crime", "Investigative journalism"),
-        "this american life": ("Society & Culture", "Human interest stories"),
-    }
+    tavily_country_research = load_facts_with_evidence("tavily_missing_country")
+    tavily_genre_research = load_facts_with_evidence("tavily_missing_genre")
 
     print(f"✓ Country research: {len(tavily_country_research)} shows")
     print(f"✓ Genre research: {len(tavily_genre_research)} shows")
 
     return tavily_country_research, tavily_genre_research
 
-def update_mappings_with_tavily_research():
-    """Update country and genre mappings with Tavily research."""
+def research_missing_data(missing_country, missing_genre, backend=None, limit=20):
+    """Look up the top shows missing country or genre data with a research backend.
+
+    Country and genre questions go through the research planner: aliases of
+    a show are merged and a show missing both costs one (cached) search.
+    """
+
+    print(f"\nRESEARCHING TOP MISSING SHOWS")
+    print("=" * 40)
+
+    if backend is None:
+        backend = get_cached_backend()
+
+    country_shows = [show for show, _, _ in missing_country[:limit]]
+    genre_shows = [show for show, _, _ in missing_genre[:limit]]
+    lookups = [(show, "country") for show in country_shows] + [(show, "genre") for show in genre_shows]
+
+    results, plan = run_research_plan(lookups, backend)
+    defaults = {"country": "Unknown", "genre": "Other"}
+
+    suggestions = []
+    for show, field in lookups:
+        value = results[field].get(show, defaults[field])
+        if value != defaults[field]:
+            suggestions.append({"normalized_name": show, "field": field, "value": value,
+                                "source": f"{backend.name} research"})
+
+    suggestions = pd.DataFrame(suggestions, columns=["normalized_name", "field", "value", "source"])
+    print(f"✓ {len(suggestions)} suggestions for {len(lookups)} questions ({len(plan)} searches)")
+    report_cache(backend)
+
+    return suggestions
+
+def update_mappings_with_tavily_research(suggestions=None):
+    """Update country and genre mappings with Tavily research.
+
+    suggestions (from research_missing_data) are added after the existing
+    and curated rows, so those take precedence for shows already mapped.
+    """
 
     print(f"\nUPDATING MAPPINGS WITH TAVILY RESEARCH")
     print("=" * 45)
@@ -185,6 +150,15 @@ def update_mappings_with_tavily_research():
             "source": f"Tavily research: {description}"
         })
 
+    # Add this run's research suggestions
+    if suggestions is not None:
+        for _, row in suggestions[suggestions["field"] == "country"].iterrows():
+            country_data.append({
+                "normalized_name": row["normalized_name"],
+                "country": row["value"],
+                "source": row["source"]
+            })
+
     # Update genre mapping
     genre_data = []
     # Add existing data
@@ -203,6 +177,14 @@ def update_mappings_with_tavily_research():
             "source": f"Tavily research: {description}"
         })
 
+    if suggestions is not None:
+        for _, row in suggestions[suggestions["field"] == "genre"].iterrows():
+            genre_data.append({
+                "normalized_name": row["normalized_name"],
+                "genre": row["value"],
+                "source": row["source"]
+            })
+
     # Create comprehensive DataFrames
     comprehensive_country = pd.DataFrame(country_data)
     comprehensive_genre = pd.DataFrame(genre_data)
@@ -235,8 +217,11 @@ if __name__ == "__main__":
     # Identify missing data
     missing_country, missing_genre = identify_missing_data()
 
-    # Update mappings with Tavily research
-    country_mapping, genre_mapping = update_mappings_with_tavily_research()
+    # Look up the remaining gaps (answered from the research cache when repeated)
+    suggestions = research_missing_data(missing_country, missing_genre)
+
+    # Update mappings with Tavily research and this run's suggestions
+    country_mapping, genre_mapping = update_mappings_with_tavily_research(suggestions)
 
     print(f"\n🎯 TAVILY RESEARCH COMPLETE!")
     print(f"   Ready to rebuild ranking system with comprehensive data")
\ No newline at end of file
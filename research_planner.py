@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Research planner: one query per show for all pending questions
+
+Pending country and genre questions are collected per show, alias variants
+of the same show ("The Ramsey Show", "the ramsey", "ramsey") are collapsed
+onto one canonical key, and each show gets a single search whose results
+are parsed for both attributes (country_extractor and the genre rule
+engine) and fanned out to every alias that asked.
+"""
+
+import pandas as pd
+
+from classification_lookup import COUNTRY_DEFAULT, GENRE_DEFAULT
+from country_extractor import extract_country
+from genre_rule_engine import FALLBACK_GENRE, classify_genre_text
+from show_name_normalization import normalize_names
+
+ATTRIBUTES = ("country", "genre")
+
+# Query per set of attributes; the country query matches research_unknown_countries
+# so the research cache serves both
+QUERY_TEMPLATES = {
+    ("country",): '"{name}" podcast host country origin where created',
+    ("genre",): '"{name}" podcast genre category',
+    ("country", "genre"): '"{name}" podcast host country origin genre category',
+}
+
+
+def research_query(name, attributes):
+    """Search query for a show and the attributes it still needs."""
+
+    return QUERY_TEMPLATES[tuple(a for a in ATTRIBUTES if a in attributes)].format(name=name)
+
+
+def load_aliases():
+    """Alias -> canonical show key (the show alias table of the dump extractor)."""
+
+    from wikipedia_dump_extractor import build_show_aliases
+
+    return build_show_aliases()
+
+
+def plan_research(questions, aliases=None):
+    """Merge (show, attribute) questions into one row per canonical show.
+
+    questions: DataFrame/iterable of (show, attribute) pairs.
+    Returns show_key, name, attributes (tuple), aliases (tuple), query, questions.
+    """
+
+    questions = pd.DataFrame(questions, columns=["show", "attribute"])
+    unknown = set(questions["attribute"]) - set(ATTRIBUTES)
+    if unknown:
+        raise ValueError(f"Unknown research attributes: {sorted(unknown)} (use {ATTRIBUTES})")
+
+    if aliases is None:
+        aliases = load_aliases()
+
+    normalized = normalize_names(questions["show"])
+    questions["show_key"] = normalized.map(aliases).fillna(normalized)
+    questions = questions[questions["show_key"] != ""]
+
+    plan = questions.groupby("show_key", sort=False).agg(
+        name=("show", "first"),
+        attributes=("attribute", lambda a: tuple(x for x in ATTRIBUTES if x in set(a))),
+        aliases=("show", lambda s: tuple(dict.fromkeys(s))),
+        questions=("attribute", "size"),
+    ).reset_index()
+    plan["query"] = [research_query(name, attributes) for name, attributes in zip(plan["name"], plan["attributes"])]
+    return plan
+
+
+def parse_answers(plan, responses):
+    """Country and genre parsed once per planned show from its search response."""
+
+    texts = [" ".join(result["content"] for result in response.get("results", [])) for response in responses]
+    countries = [extract_country(text, name) for text, name in zip(texts, plan["name"])]
+    genres = [classify_genre_text(text) if text else None for text in texts]
+
+    answers = plan[["show_key", "attributes", "aliases"]].copy()
+    answers["country"] = [c if "country" in a else None for c, a in zip(countries, plan["attributes"])]
+    answers["genre"] = [g if "genre" in a and g != FALLBACK_GENRE else None for g, a in zip(genres, plan["attributes"])]
+    answers["error"] = [response.get("error") for response in responses]
+    return answers
+
+
+def fan_out(answers):
+    """Answers per asked alias: {attribute: {alias: label}} (unresolved -> default label)."""
+
+    defaults = {"country": COUNTRY_DEFAULT, "genre": GENRE_DEFAULT}
+    results = {attribute: {} for attribute in ATTRIBUTES}
+    for row in answers.itertuples(index=False):
+        for attribute in row.attributes:
+            label = getattr(row, attribute)
+            label = label if isinstance(label, str) and label else defaults[attribute]
+            for alias in row.aliases:
+                results[attribute][alias] = label
+    return results
+
+
+def run_research_plan(questions, backend=None, aliases=None, max_results=3):
+    """Plan, search once per show and fan the answers out.
+
+    Returns ({attribute: {show: label}}, plan with answers).
+    """
+
+    if backend is None:
+        from research_cache import get_cached_backend
+        backend = get_cached_backend()
+
+    plan = plan_research(questions, aliases)
+    n_questions = int(plan["questions"].sum())
+    print(f"Research plan: {n_questions} questions -> {len(plan)} queries via {backend.name}")
+
+    responses = backend.search_many(plan["query"].tolist(), max_results=max_results)
+    answers = parse_answers(plan, responses)
+    return fan_out(answers), plan.merge(answers[["show_key", "country", "genre", "error"]], on="show_key")
+
+
+def pending_questions(rankings_file="final_5platform_podcast_rankings.csv"):
+    """(show, attribute) questions for ranked shows with Unknown country or Other genre."""
+
+    rankings = pd.read_csv(rankings_file, keep_default_na=False)
+    rankings = rankings[rankings["show_name"] != ""]
+    country = rankings.loc[rankings["country"] == COUNTRY_DEFAULT, "show_name"]
+    genre = rankings.loc[rankings["genre"] == GENRE_DEFAULT, "show_name"]
+    return pd.DataFrame({
+        "show": pd.concat([country, genre], ignore_index=True),
+        "attribute": ["country"] * len(country) + ["genre"] * len(genre),
+    })
+
+
+if __name__ == "__main__":
+    print("RESEARCH PLAN")
+    print("=" * 50)
+
+    questions = pending_questions()
+    results, plan = run_research_plan(questions)
+
+    for _, row in plan.iterrows():
+        found = ", ".join(f"{a}: {row[a] if pd.notna(row[a]) else '-'}" for a in row["attributes"])
+        print(f"  {row['name'][:40]:<40} {'+'.join(row['attributes']):<14} {found}")
+
+    print(f"\nQueries saved by merging: {int(plan['questions'].sum()) - len(plan)}")
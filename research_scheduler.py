@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Impact-ranked research scheduler
+
+Estimates, for every show with an unresolved genre ("Other") or country
+("Unknown"), how far resolving it could move the show in the ranking:
+
+    genre   - the show joins a genre cohort, which sets its genre_rank_score
+              (percentile within the genre) and so its composite score
+    country - the show becomes eligible (or not) for the top-25 chart
+
+Hypothetical genre scores for every (show, genre) pair come from one
+searchsorted over all cohorts, so the whole queue is rebuilt in
+milliseconds after each research batch. Shows whose resolution is most
+likely to move them across the top-25 boundary are researched first.
+"""
+
+import numpy as np
+import pandas as pd
+
+from classification_lookup import COUNTRY_DEFAULT, GENRE_DEFAULT
+from complete_5platform_ranking_system import COMPOSITE_WEIGHTS
+from genre_taxonomy import LEVEL_CATEGORIES
+
+RANKINGS_FILE = "final_5platform_podcast_rankings.csv"
+TOP_N = 25
+ELIGIBLE_COUNTRIES = ("US",)  # countries that can enter the top-25 chart
+
+QUEUE_COLUMNS = [
+    "show_name", "rank", "composite_score", "missing", "score_low", "score_high",
+    "expected_shift", "p_eligible", "gap_to_boundary", "p_cross",
+]
+
+
+def genre_prior(ranking_df, genres):
+    """Share of resolved shows per genre, used when no per-show genre probabilities exist."""
+
+    counts = ranking_df["genre"].value_counts().reindex(genres, fill_value=0).to_numpy(dtype=np.float64)
+    counts += 1.0  # every genre stays possible
+    return counts / counts.sum()
+
+
+def hypothetical_genre_scores(ranking_df, genres):
+    """genre_rank_score each show would get in each genre (shows x genres).
+
+    The percentile counts the genre's current members with consumption <= the
+    show's, with the show itself added to the cohort.
+    """
+
+    consumption = ranking_df["total_consumption"].to_numpy(dtype=np.float64)
+    member_genres = pd.Index(genres).get_indexer(ranking_df["genre"])
+
+    # Members sorted by (genre, consumption) as one integer key
+    _, value_ranks = np.unique(consumption, return_inverse=True)
+    span = value_ranks.max(initial=0) + 1
+    is_member = member_genres >= 0
+    member_keys = np.sort(member_genres[is_member].astype(np.int64) * span + value_ranks[is_member])
+    genre_sizes = np.bincount(member_genres[is_member], minlength=len(genres))
+    genre_offsets = np.concatenate([[0], np.cumsum(genre_sizes)])[:len(genres)]
+
+    query_keys = np.arange(len(genres), dtype=np.int64)[None, :] * span + value_ranks[:, None]
+    at_or_below = np.searchsorted(member_keys, query_keys, side="right") - genre_offsets[None, :]
+
+    # A show that already belongs to a genre is counted once
+    own = member_genres[:, None] == np.arange(len(genres))[None, :]
+    cohort = genre_sizes[None, :] + ~own
+    return (at_or_below + ~own) / cohort * 100
+
+
+def boundary_thresholds(scores, eligible, top_n=TOP_N):
+    """Score to beat for outsiders (the top_n-th eligible) and to stay above for insiders."""
+
+    eligible_scores = np.sort(scores[eligible])[::-1]
+    padded = np.concatenate([eligible_scores, [-np.inf, -np.inf]])
+    return padded[top_n - 1], padded[top_n]
+
+
+def build_research_queue(ranking_df, genre_proba=None, country_proba=None,
+                         eligible_countries=ELIGIBLE_COUNTRIES, top_n=TOP_N):
+    """Unresolved shows ordered by how likely resolving them changes the top-N.
+
+    genre_proba: optional shows x genres DataFrame (index show_name) of genre
+    probabilities, e.g. from the genre classifier; defaults to the genre prior.
+    country_proba: optional show_name -> P(eligible country) Series; defaults
+    to the share of eligible countries among resolved shows.
+    eligible_countries=None makes every country eligible (country has no impact).
+    """
+
+    ranking_df = ranking_df.reset_index(drop=True)
+    genres = [genre for genre in LEVEL_CATEGORIES["standard"] if genre != GENRE_DEFAULT]
+
+    missing_genre = (ranking_df["genre"].fillna(GENRE_DEFAULT) == GENRE_DEFAULT).to_numpy()
+    missing_country = (ranking_df["country"].fillna(COUNTRY_DEFAULT) == COUNTRY_DEFAULT).to_numpy()
+    composite = ranking_df["composite_score"].to_numpy(dtype=np.float64)
+
+    # Composite score under every genre: only the genre component changes
+    weight = COMPOSITE_WEIGHTS["genre_rank_score"]
+    genre_scores = hypothetical_genre_scores(ranking_df, genres)
+    shifted = composite[:, None] + weight * (genre_scores - ranking_df["genre_rank_score"].to_numpy()[:, None])
+    shifted[~missing_genre] = composite[~missing_genre, None]
+
+    if genre_proba is None:
+        proba = np.broadcast_to(genre_prior(ranking_df[~missing_genre], genres), shifted.shape)
+    else:
+        proba = genre_proba.reindex(index=ranking_df["show_name"], columns=genres).fillna(0.0).to_numpy()
+        proba = np.where(proba.sum(axis=1, keepdims=True) > 0, proba, genre_prior(ranking_df[~missing_genre], genres))
+        proba = proba / proba.sum(axis=1, keepdims=True)
+
+    # Eligibility: known countries are eligible or not; unknown ones with a probability
+    if eligible_countries is None:
+        p_eligible = np.ones(len(ranking_df))
+    else:
+        is_eligible = ranking_df["country"].isin(eligible_countries).to_numpy()
+        resolved = ~missing_country
+        base_rate = is_eligible[resolved].mean() if resolved.any() else 0.5
+        unknown_rate = np.full(len(ranking_df), base_rate)
+        if country_proba is not None:
+            unknown_rate = ranking_df["show_name"].map(country_proba).fillna(base_rate).to_numpy()
+        p_eligible = np.where(missing_country, unknown_rate, is_eligible.astype(np.float64))
+
+    eligible_now = (p_eligible == 1.0)
+    enter_score, stay_score = boundary_thresholds(composite, eligible_now, top_n)
+    inside = eligible_now & (composite >= enter_score)
+
+    # P(in the top-N after resolution) vs whether the show is in it now
+    above = np.where(inside[:, None], shifted >= stay_score, shifted >= enter_score)
+    p_top = p_eligible * (proba * above).sum(axis=1)
+    p_cross = np.where(inside, 1.0 - p_top, p_top)
+
+    threshold = np.where(inside, stay_score, enter_score)
+    unresolved = missing_genre | missing_country
+
+    queue = pd.DataFrame({
+        "show_name": ranking_df["show_name"],
+        "rank": ranking_df["rank"] if "rank" in ranking_df.columns else np.arange(1, len(ranking_df) + 1),
+        "composite_score": composite,
+        "missing": np.select([missing_genre & missing_country, missing_genre], ["genre+country", "genre"], "country"),
+        "score_low": shifted.min(axis=1),
+        "score_high": shifted.max(axis=1),
+        "expected_shift": (proba * np.abs(shifted - composite[:, None])).sum(axis=1),
+        "p_eligible": p_eligible,
+        "gap_to_boundary": composite - threshold,
+        "p_cross": p_cross,
+    })[unresolved]
+
+    # Crossing probability first, then closeness to the boundary
+    order = np.lexsort((-queue["expected_shift"].to_numpy(), np.abs(queue["gap_to_boundary"].to_numpy()),
+                        -queue["p_cross"].to_numpy()))
+    return queue.iloc[order][QUEUE_COLUMNS].reset_index(drop=True)
+
+
+def resolve_shows(ranking_df, country_results=None, genre_results=None):
+    """Ranking with researched labels applied, ready for the next queue rebuild.
+
+    Genre changes update genre_rank_score and composite_score for the whole
+    ranking (every cohort member's percentile can move).
+    """
+
+    from genre_membership import genre_rank_scores
+
+    ranking_df = ranking_df.copy()
+    if country_results:
+        found = {show: country for show, country in country_results.items() if country != COUNTRY_DEFAULT}
+        ranking_df["country"] = ranking_df["show_name"].map(found).fillna(ranking_df["country"])
+
+    if genre_results:
+        found = {show: genre for show, genre in genre_results.items() if genre != GENRE_DEFAULT}
+        ranking_df["genre"] = ranking_df["show_name"].map(found).fillna(ranking_df["genre"])
+
+        weight = COMPOSITE_WEIGHTS["genre_rank_score"]
+        new_scores = genre_rank_scores(ranking_df)
+        ranking_df["composite_score"] += weight * (new_scores - ranking_df["genre_rank_score"])
+        ranking_df["genre_rank_score"] = new_scores
+
+    return ranking_df
+
+
+if __name__ == "__main__":
+    import time
+
+    print("IMPACT-RANKED RESEARCH QUEUE")
+    print("=" * 50)
+
+    rankings = pd.read_csv(RANKINGS_FILE, keep_default_na=False)
+    rankings = rankings[rankings["show_name"] != ""]
+
+    start = time.perf_counter()
+    queue = build_research_queue(rankings)
+    elapsed = time.perf_counter() - start
+
+    print(f"Unresolved shows: {len(queue)} (queue built in {elapsed * 1000:.1f} ms)")
+    print(f"\n{'show':<40} {'rank':>4} {'missing':<13} {'score':>6} {'range':>13} {'gap':>6} {'P(cross)':>8}")
+    for _, row in queue.head(20).iterrows():
+        print(f"{row['show_name'][:40]:<40} {row['rank']:>4} {row['missing']:<13} {row['composite_score']:6.1f} "
+              f"{row['score_low']:6.1f}-{row['score_high']:<6.1f} {row['gap_to_boundary']:6.1f} {row['p_cross']:8.2f}")
+
+    # Scaling check: the queue is rebuilt after every research batch
+    n = 200_000
+    rng = np.random.default_rng(0)
+    synthetic = pd.DataFrame({
+        "show_name": [f"show {i}" for i in range(n)],
+        "genre": rng.choice(LEVEL_CATEGORIES["standard"], n),
+        "country": rng.choice(["US", "GB", COUNTRY_DEFAULT], n, p=[0.7, 0.2, 0.1]),
+        "total_consumption": rng.lognormal(12, 2, n).round(),
+        "genre_rank_score": rng.uniform(0, 100, n),
+        "composite_score": rng.uniform(0, 100, n),
+    })
+    start = time.perf_counter()
+    build_research_queue(synthetic)
+    print(f"\nSynthetic ranking: {n:,} shows queued in {time.perf_counter() - start:.2f} s")
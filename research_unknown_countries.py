@@ -7,6 +7,23 @@ Using Tavily search and Wikipedia to identify podcast origins
 import pandas as pd
 import time
 import json
+import os
+import sys
+from pathlib import Path
+
+from classification_facts import save_fact_collection
+from classification_lookup import GENRE_DEFAULT
+from country_extractor import COUNTRY_EXTRACTOR, extract_country
+from language_market_inference import infer_markets
+from research_scheduler import build_research_queue, resolve_shows
+from research_cache import get_cached_backend, report_cache
+from research_planner import load_aliases, run_research_plan
+
+# Append-only log of finished research batches; a rerun resumes after the last one
+CHECKPOINT_FILE = Path("research_checkpoints/country_research.jsonl")
+FACT_COLLECTION = "web_research_country"
+GENRE_FACT_COLLECTION = "web_research_genre"
+FACT_FLUSH_BATCHES = 5  # batches between fact store writes (each rewrites the store)
 
 def load_unknown_country_shows():
     """Load all shows with Unknown country classification."""
@@ -27,104 +44,117 @@ def load_unknown_country_shows():
     print(f"Found {len(unknown_shows)} shows with Unknown country")
     return unknown_shows['show_name'].tolist()
 
-def research_podcast_country_batch(shows_batch, batch_num):
-    """Research country information for a batch of shows using web search."""
+def research_podcast_country_batch(shows_batch, batch_num, backend=None, genre_shows=(), aliases=None):
+    """Research country information for a batch of shows using web search.
 
-    print(f"\nRESEARCHING BATCH {batch_num} ({len(shows_batch)} shows)")
+    backend: research backend (see research_backends); defaults to Tavily when
+    its tool is installed, otherwise the local research index.
+
+    The batch goes through the research planner like every other research
+    script: aliases of one show share a search, and shows in genre_shows
+    (genre still "Other") are asked for their genre in the same search.
+
+    Returns (show -> country, show -> genre for the genre_shows answered).
+    """
+
+    if backend is None:
+        backend = get_cached_backend()
+
+    print(f"\nRESEARCHING BATCH {batch_num} ({len(shows_batch)} shows) via {backend.name}")
     print("=" * 50)
 
-    country_results = {}
+    # One planned search per show for all its questions; the backend handles
+    # rate limiting (and concurrency, for the async HTTP client)
+    questions = [(show, "country") for show in shows_batch]
+    questions += [(show, "genre") for show in shows_batch if show in genre_shows]
+    results, plan = run_research_plan(questions, backend, aliases)
+
+    errors = {alias: row.error for row in plan.itertuples() for alias in row.aliases if row.error}
 
+    country_results = {}
+    genre_results = {}
     for i, show in enumerate(shows_batch):
         print(f"  {i+1:2d}/{len(shows_batch)} Researching: {show}")
 
-        try:
-            # Search for podcast information
-            from mcp__tavily__search import mcp__tavily__search
-
-            # Create search query
-            search_query = f'"{show}" podcast host country origin where created'
-
-            search_results = mcp__tavily__search({
-                "query": search_query,
-                "options": {
-                    "maxResults": 3,
-                    "includeAnswer": True,
-                    "searchDepth": "basic"
-                }
-            })
-
-            # Extract country information from search results
-            country = extract_country_from_search(search_results, show)
-
-            if country:
-                country_results[show] = country
-                print(f"     ✓ Found: {country}")
-            else:
-                print(f"     ⚠ No clear country found")
-                country_results[show] = "Unknown"
-
-            # Rate limiting
-            time.sleep(0.5)
-
-        except Exception as e:
-            print(f"     ✗ Error searching {show}: {e}")
+        if show in errors:
+            print(f"     ✗ Error searching {show}: {errors[show]}")
             country_results[show] = "Unknown"
-
-    return country_results
+            continue
+
+        country = results["country"].get(show, "Unknown")
+        country_results[show] = country
+        if country != "Unknown":
+            print(f"     ✓ Found: {country}")
+        else:
+            print(f"     ⚠ No clear country found")
+
+        genre = results["genre"].get(show, GENRE_DEFAULT)
+        if genre != GENRE_DEFAULT:
+            genre_results[show] = genre
+            print(f"     ✓ Genre: {genre}")
+
+    return country_results, genre_results
+
+def load_checkpoint(path=CHECKPOINT_FILE):
+    """Researched show -> checkpoint record from earlier (possibly interrupted) runs."""
+
+    path = Path(path)
+    if not path.exists():
+        return {}
+
+    # A crash mid-write can leave one torn line at the end: cut it off so the
+    # next append starts on a fresh line
+    data = path.read_bytes()
+    end = data.rfind(b"\n") + 1
+    if end < len(data):
+        with open(path, "r+b") as f:
+            f.truncate(end)
+
+    records = {}
+    for line in data[:end].decode("utf-8").splitlines():
+        if line.strip():
+            record = json.loads(line)
+            records[record["show"]] = record
+    return records
+
+def append_checkpoint(batch_results, batch_num, backend_name, path=CHECKPOINT_FILE, genre_results=None):
+    """Append a finished batch and force it to disk before the next batch starts."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    finished = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    genre_results = genre_results or {}
+    records = [
+        {"show": show, "country": country, "batch": batch_num, "backend": backend_name, "time": finished}
+        for show, country in batch_results.items()
+    ]
+    for record in records:
+        if record["show"] in genre_results:
+            record["genre"] = genre_results[record["show"]]
+    with open(path, "a", encoding="utf-8") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+        f.flush()
+        os.fsync(f.fileno())
+    return records
+
+def store_research_facts(records):
+    """Write the countries (and genres) found so far to the classification fact store."""
+
+    def evidence(r):
+        return f"Web research via {r['backend']} (batch {r['batch']}, {r['time']})"
+
+    found = {show: r for show, r in records.items() if r["country"] != "Unknown"}
+    save_fact_collection(GENRE_FACT_COLLECTION,
+                         {show: r["genre"] for show, r in records.items() if r.get("genre")},
+                         {show: evidence(r) for show, r in records.items() if r.get("genre")})
+    return save_fact_collection(FACT_COLLECTION,
+                                {show: r["country"] for show, r in found.items()},
+                                {show: evidence(r) for show, r in found.items()})
 
 def extract_country_from_search(search_results, show_name):
     """Extract country information from Tavily search results."""
 
-    # Common country indicators
-    country_keywords = {
-        "united states": "US", "usa": "US", "america": "US", "american": "US",
-        "united kingdom": "GB", "uk": "GB", "britain": "GB", "british": "GB", "england": "GB",
-        "canada": "CA", "canadian": "CA",
-        "australia": "AU", "australian": "AU",
-        "germany": "DE", "german": "DE",
-        "france": "FR", "french": "FR",
-        "spain": "ES", "spanish": "ES",
-        "italy": "IT", "italian": "IT",
-        "japan": "JP", "japanese": "JP",
-        "south korea": "KR", "korea": "KR", "korean": "KR",
-        "india": "IN", "indian": "IN",
-        "china": "CN", "chinese": "CN",
-        "russia": "RU", "russian": "RU",
-        "brazil": "BR", "brazilian": "BR",
-        "mexico": "MX", "mexican": "MX",
-        "argentina": "AR", "argentine": "AR",
-        "colombia": "CO", "colombian": "CO",
-        "chile": "CL", "chilean": "CL",
-        "peru": "PE", "peruvian": "PE",
-        "netherlands": "NL", "dutch": "NL",
-        "sweden": "SE", "swedish": "SE",
-        "norway": "NO", "norwegian": "NO",
-        "denmark": "DK", "danish": "DK",
-        "finland": "FI", "finnish": "FI",
-        "poland": "PL", "polish": "PL",
-        "ukraine": "UA", "ukrainian": "UA",
-        "indonesia": "ID", "indonesian": "ID",
-        "thailand": "TH", "thai": "TH",
-        "singapore": "SG",
-        "malaysia": "MY", "malaysian": "MY",
-        "philippines": "PH", "filipino": "PH",
-        "vietnam": "VN", "vietnamese": "VN",
-        "turkey": "TR", "turkish": "TR",
-        "israel": "IL", "israeli": "IL",
-        "egypt": "EG", "egyptian": "EG",
-        "south africa": "ZA", "african": "ZA",
-        "new zealand": "NZ", "zealand": "NZ",
-        "ireland": "IE", "irish": "IE",
-        "portugal": "PT", "portuguese": "PT",
-        "belgium": "BE", "belgian": "BE",
-        "austria": "AT", "austrian": "AT",
-        "switzerland": "CH", "swiss": "CH",
-        "czech": "CZ", "slovakia": "SK", "hungary": "HU",
-        "romania": "RO", "bulgaria": "BG", "croatia": "HR",
-        "greece": "GR", "greek": "GR"
-    }
-
     # Search in results content
     all_text = ""
 
@@ -135,71 +165,36 @@ def extract_country_from_search(search_results, show_name):
             if 'title' in result:
                 all_text += result['title'].lower() + " "
 
-    # Look for country indicators
-    for country_term, country_code in country_keywords.items():
-        if country_term in all_text:
-            return country_code
-
-    # Special cases for well-known shows
-    special_cases = {
-        "conan obrien": "US",
-        "howard stern": "US",
-        "joe rogan": "US",
-        "marc maron": "US",
-        "bill maher": "US",
-        "snl": "US",
-        "saturday night live": "US",
-        "late night": "US",
-        "tonight show": "US",
-        "daily show": "US",
-        "npr": "US",
-        "pbs": "US",
-        "cbc": "CA",
-        "bbc": "GB",
-        "abc": "US",
-        "nbc": "US",
-        "cbs": "US",
-        "fox": "US",
-        "cnn": "US",
-        "espn": "US"
-    }
-
-    show_lower = show_name.lower()
-    for indicator, country in special_cases.items():
-        if indicator in show_lower:
-            return country
-
-    return None
-
-def research_with_wikipedia_fallback(shows_with_unknown):
+    # Country mentions in one compiled word-boundary scan, then indicators
+    # in the show name for well-known hosts and networks
+    return extract_country(all_text, show_name)
+
+def research_with_wikipedia_fallback(shows_with_unknown, backend=None):
     """Research remaining unknown shows with Wikipedia search."""
 
+    if backend is None:
+        backend = get_cached_backend("wikipedia")
+
     print(f"\nWIKIPEDIA FALLBACK RESEARCH")
     print("=" * 30)
 
     country_results = {}
 
-    for i, show in enumerate(shows_with_unknown):
+    # Search Wikipedia and read the first relevant article (cached shows skip the remote call)
+    responses = backend.search_many([f'"{show}" podcast' for show in shows_with_unknown], max_results=1)
+
+    for i, (show, response) in enumerate(zip(shows_with_unknown, responses)):
         print(f"  {i+1}/{len(shows_with_unknown)} Wikipedia: {show}")
 
         try:
-            from mcp__Wikipedia__search import mcp__Wikipedia__search
+            if response.get("error"):
+                raise RuntimeError(response["error"])
 
-            # Search Wikipedia
-            wiki_results = mcp__Wikipedia__search({
-                "query": f"{show} podcast"
-            })
+            wiki_results = response["results"]
 
             if wiki_results and len(wiki_results) > 0:
-                # Read the first relevant article
-                from mcp__Wikipedia__readArticle import mcp__Wikipedia__readArticle
-
-                article = mcp__Wikipedia__readArticle({
-                    "pageId": wiki_results[0]["pageId"]
-                })
-
                 # Extract country from article
-                country = extract_country_from_text(article["content"], show)
+                country = extract_country_from_text(wiki_results[0]["content"], show)
 
                 if country:
                     country_results[show] = country
@@ -211,8 +206,6 @@ def research_with_wikipedia_fallback(shows_with_unknown):
                 country_results[show] = "Unknown"
                 print(f"     ⚠ Not found on Wikipedia")
 
-            time.sleep(0.3)
-
         except Exception as e:
             print(f"     ✗ Wikipedia error: {e}")
             country_results[show] = "Unknown"
@@ -222,29 +215,19 @@ def research_with_wikipedia_fallback(shows_with_unknown):
 def extract_country_from_text(text, show_name):
     """Extract country from Wikipedia article text."""
 
-    country_keywords = {
-        "united states": "US", "american": "US", "u.s.": "US",
-        "united kingdom": "GB", "british": "GB", "uk": "GB", "england": "GB",
-        "canada": "CA", "canadian": "CA",
-        "australia": "AU", "australian": "AU",
-        "germany": "DE", "german": "DE",
-        "france": "FR", "french": "FR",
-        "japan": "JP", "japanese": "JP",
-        "south korea": "KR", "korean": "KR",
-        "india": "IN", "indian": "IN",
-        "china": "CN", "chinese": "CN"
-    }
+    return COUNTRY_EXTRACTOR.extract(text)
 
-    text_lower = text.lower()
+# Mapping source per local inference evidence (anything else is web research)
+INFERENCE_SOURCES = {"language": "Language inference", "youtube": "YouTube playlist country"}
 
-    for country_term, country_code in country_keywords.items():
-        if country_term in text_lower:
-            return country_code
+def save_country_research_results(all_results, sources=None):
+    """Save research results and update mapping files.
 
-    return None
+    sources: optional show -> source label for results that did not come
+    from web research (e.g. local language inference).
+    """
 
-def save_country_research_results(all_results):
-    """Save research results and update mapping files."""
+    sources = sources or {}
 
     print(f"\nSAVING COUNTRY RESEARCH RESULTS")
     print("=" * 35)
@@ -271,7 +254,7 @@ def save_country_research_results(all_results):
         mapping_data.append({
             "normalized_name": show,
             "country": country,
-            "source": "Web research" if show in all_results else "Previous mapping"
+            "source": sources.get(show, "Web research") if show in all_results else "Previous mapping"
         })
 
     updated_mapping_df = pd.DataFrame(mapping_data)
@@ -288,8 +271,15 @@ def save_country_research_results(all_results):
 
     return updated_mapping_df
 
-def main():
-    """Main function to research all unknown countries."""
+def main(restart=False):
+    """Main function to research all unknown countries.
+
+    Every finished batch is appended to CHECKPOINT_FILE, so an interrupted
+    run resumes with the shows still pending; results reach the fact store
+    every FACT_FLUSH_BATCHES batches and at the end. A completed run rotates
+    the checkpoint away, so the next run retries shows still Unknown;
+    restart=True discards the checkpoint and researches everything again.
+    """
 
     # Load shows with unknown countries
     unknown_shows = load_unknown_country_shows()
@@ -298,33 +288,69 @@ def main():
         print("No shows with Unknown country found!")
         return
 
-    print(f"Starting research for {len(unknown_shows)} shows...")
+    # Script, language and YouTube inference first: only low-confidence shows go remote
+    inferred = infer_markets(unknown_shows)
+    confident = inferred[~inferred["needs_research"]]
+    print(f"Local language/market inference: {len(confident)} of {len(inferred)} shows resolved")
 
-    # Process in batches to avoid rate limits
-    batch_size = 20
-    all_results = {}
+    all_results = dict(zip(confident["show_name"], confident["country"]))
+    sources = dict(zip(confident["show_name"], confident["evidence"].map(INFERENCE_SOURCES)))
+    unknown_shows = inferred.loc[inferred["needs_research"], "show_name"].tolist()
+
+    # Resume: shows finished in an earlier run are not researched again
+    if restart:
+        CHECKPOINT_FILE.unlink(missing_ok=True)
+    to_research = set(unknown_shows)
+    checkpoint = {show: record for show, record in load_checkpoint().items() if show in to_research}
+    all_results.update({show: record["country"] for show, record in checkpoint.items()})
+    if checkpoint:
+        print(f"Resuming from {CHECKPOINT_FILE}: {len(checkpoint)} shows already researched")
 
-    for i in range(0, len(unknown_shows), batch_size):
-        batch = unknown_shows[i:i+batch_size]
-        batch_num = (i // batch_size) + 1
+    print(f"Starting research for {len(unknown_shows) - len(checkpoint)} shows...")
 
-        batch_results = research_podcast_country_batch(batch, batch_num)
+    # Process in batches to avoid rate limits; each batch takes the shows with the
+    # most impact on the top 25, re-estimated with the results found so far
+    batch_size = 20
+    backend = get_cached_backend()
+    rankings = pd.read_csv('final_5platform_podcast_rankings.csv', keep_default_na=False)
+    genre_shows = set(rankings.loc[rankings["genre"] == GENRE_DEFAULT, "show_name"])
+    aliases = load_aliases()
+    pending = set(unknown_shows).difference(checkpoint)
+    batch_num = max((record["batch"] for record in checkpoint.values()), default=0)
+
+    while pending:
+        queue = build_research_queue(resolve_shows(rankings, all_results))
+        batch = [show for show in queue["show_name"] if show in pending][:batch_size]
+        batch += sorted(pending.difference(batch))[:batch_size - len(batch)]
+        pending.difference_update(batch)
+        batch_num += 1
+
+        batch_results, genre_results = research_podcast_country_batch(batch, batch_num, backend, genre_shows, aliases)
         all_results.update(batch_results)
 
-        print(f"Batch {batch_num} complete: {len([r for r in batch_results.values() if r != 'Unknown'])} countries found")
+        # Checkpoint the batch; the fact store is written every few batches
+        for record in append_checkpoint(batch_results, batch_num, backend.name, genre_results=genre_results):
+            checkpoint[record["show"]] = record
+        if batch_num % FACT_FLUSH_BATCHES == 0:
+            store_research_facts(checkpoint)
 
-        # Save intermediate results
-        if len(all_results) % 40 == 0:
-            save_country_research_results(all_results)
+        print(f"Batch {batch_num} complete: {len([r for r in batch_results.values() if r != 'Unknown'])} countries found")
 
-    # Final save
-    final_mapping = save_country_research_results(all_results)
+    # Final save; the finished run's checkpoint is kept alongside for reference
+    store_research_facts(checkpoint)
+    final_mapping = save_country_research_results(all_results, sources)
+    if CHECKPOINT_FILE.exists():
+        CHECKPOINT_FILE.replace(CHECKPOINT_FILE.with_suffix(".done.jsonl"))
 
     print(f"\n🎯 COUNTRY RESEARCH COMPLETE!")
-    print(f"   📋 Researched: {len(unknown_shows)} shows")
+    print(f"   🔤 Inferred locally: {len(confident)} shows")
+    print(f"   📋 Researched: {len(unknown_shows)} shows ({len(checkpoint)} in {CHECKPOINT_FILE.with_suffix('.done.jsonl')})")
     print(f"   🌍 Countries found: {len([r for r in all_results.values() if r != 'Unknown'])}")
+    print(f"   🎭 Genres found for 'Other' shows: {len([r for r in checkpoint.values() if r.get('genre')])}")
     print(f"   📄 Updated mapping: final_country_mapping_updated.csv")
+    report_cache(backend)
     print(f"   🚀 Ready to update ranking system!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # python research_unknown_countries.py [--restart]
+    main(restart="--restart" in sys.argv)
\ No newline at end of file
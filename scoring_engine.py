@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Vectorized component scores for the unified ranking
+
+All four composite components are computed with whole-column array
+operations, so scoring time grows linearly with the number of shows:
+
+    consumption_score    - total US consumption / the maximum, 0-100
+    platform_reach_score - best single-platform performance: the platform
+                           columns form a shows x platforms matrix, each column
+                           is divided by its maximum (computed once) and the
+                           row-wise maximum is taken
+    platform_count_score - platforms present / the maximum, 0-100
+    genre_rank_score     - within-genre consumption percentile, one sort over
+                           all genre memberships (genre_membership.py)
+
+Composite scores come from named weight profiles: the shows x components
+score matrix times the components x profiles weight matrix gives every
+profile's composite score in one pass, and rank_tables() turns them
+into one ranking per profile. top_k_ranking() serves eligibility lists:
+it bounds every composite score, computes within-genre percentiles only for
+shows that can still reach the top k and selects them with argpartition.
+
+    python scoring_engine.py             # scaling benchmark up to 1M synthetic shows
+    python scoring_engine.py profiles    # ranking variants for every weight profile
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from genre_membership import genre_rank_scores
+
+# US-adjusted platform columns used for platform reach
+REACH_COLUMNS = ["spotify_plays", "youtube_views_us", "amazon_plays_us", "apple_plays", "iheart_streams"]
+
+COMPONENT_COLUMNS = ["consumption_score", "platform_reach_score", "platform_count_score", "genre_rank_score"]
+
+# Named composite weights per component; each profile sums to 1
+WEIGHT_PROFILES = {
+    # US-normalized 5-platform chart (complete_5platform_ranking_system.py)
+    "five_platform": {"consumption_score": 0.65, "platform_reach_score": 0.2,
+                      "platform_count_score": 0.05, "genre_rank_score": 0.1},
+    # Earlier global charts (podcast_ranking_system.py, updated_podcast_ranking_system.py)
+    "legacy": {"consumption_score": 0.5, "platform_reach_score": 0.2,
+               "platform_count_score": 0.2, "genre_rank_score": 0.1},
+    "consumption_only": {"consumption_score": 1.0},
+    "cross_platform": {"consumption_score": 0.4, "platform_reach_score": 0.3,
+                       "platform_count_score": 0.2, "genre_rank_score": 0.1},
+    "equal": {column: 0.25 for column in COMPONENT_COLUMNS},
+}
+DEFAULT_PROFILE = "five_platform"
+
+# Global -> US estimates for platforms that report global consumption
+# (Spotify, Apple and iHeart report US-only data)
+GEOGRAPHIC_FACTORS = {
+    "youtube_views": 0.075,  # global -> US estimate with an additional 50% discount
+    "amazon_plays": 0.65,
+}
+
+RANK_TABLE_COLUMNS = ["show_name", "genre", "country", "total_consumption", "platforms_present", *COMPONENT_COLUMNS]
+VARIANTS_DIR = Path("ranking_variants")
+
+
+def max_normalized(values):
+    """Values as a percentage of their column maximum (0 where the value is not positive).
+
+    values: 1-D array or shows x columns matrix.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    maxima = values.max(axis=0, initial=0.0)
+    normalized = np.zeros_like(values)
+    np.divide(values, maxima, out=normalized, where=values > 0)
+    return normalized * 100
+
+
+def platform_reach_scores(ranking_df, columns=REACH_COLUMNS):
+    """Best single-platform score per show: row-wise max of the max-normalized platform matrix."""
+
+    matrix = ranking_df[columns].to_numpy(dtype=np.float64)
+    return max_normalized(matrix).max(axis=1, initial=0.0)
+
+
+def component_scores(ranking_df, source_labels=None, reach_columns=REACH_COLUMNS):
+    """The four composite components for a ranking frame, as a DataFrame on its index.
+
+    ranking_df needs show_name, genre, total_consumption, platforms_present
+    and the reach_columns; source_labels enables multi-label genre scoring.
+    """
+
+    return pd.DataFrame({
+        "consumption_score": max_normalized(ranking_df["total_consumption"]),
+        "platform_reach_score": platform_reach_scores(ranking_df, reach_columns),
+        "platform_count_score": max_normalized(ranking_df["platforms_present"]),
+        "genre_rank_score": genre_rank_scores(ranking_df, source_labels),
+    }, index=ranking_df.index)
+
+
+def genre_percentiles_for(ranking_df, rows):
+    """Within-genre consumption percentile for the shows at positions `rows` only.
+
+    Each genre's members are placed among the sorted values of that genre's
+    requested shows (n log c for c requested shows) instead of sorting every
+    genre; the scores equal those of genre_rank_scores() for single-label genres.
+    """
+
+    # Shows without a genre form one cohort, as in genre_rank_scores()
+    codes, _ = pd.factorize(ranking_df["genre"], use_na_sentinel=False)
+    consumption = ranking_df["total_consumption"].to_numpy(dtype=np.float64)
+    rows = np.asarray(rows)
+
+    percentiles = np.empty(len(rows))
+    for code in np.unique(codes[rows]):
+        requested = np.flatnonzero(codes[rows] == code)
+        members = consumption[codes == code]
+        if len(members) == 1:
+            percentiles[requested] = 100.0
+            continue
+
+        values = consumption[rows[requested]]
+        order = np.argsort(values, kind="stable")
+        # A member counts for every requested value >= it
+        positions = np.searchsorted(values[order], members, side="left")
+        at_or_below = np.cumsum(np.bincount(positions, minlength=len(values) + 1))[:len(values)]
+        percentiles[requested[order]] = at_or_below / len(members) * 100
+    return percentiles
+
+
+def top_k_ranking(ranking_df, k, weights=None, source_labels=None):
+    """The top k shows by composite score, scoring genre percentiles only where they can matter.
+
+    Consumption, platform reach and platform count are computed for every
+    show. The within-genre percentile is bounded by [100 / genre size, 100],
+    which bounds each composite score; only shows whose upper bound reaches
+    the k-th best lower bound can still make the top k, and only those get
+    their percentile computed. The candidates (few) are then sorted with a
+    stable lexsort, so exact ties, including ties at the k-th position, go
+    to the show that comes first in catalog order. Multi-label percentiles
+    (source_labels) have no such lower bound, so every show stays a candidate.
+
+    Returns (top k frame with component columns, composite_score and rank,
+    number of candidate shows scored).
+    """
+
+    if k < 1:
+        raise ValueError(f"top_k must be at least 1, got {k}")
+
+    weights = WEIGHT_PROFILES[DEFAULT_PROFILE] if weights is None else weights
+    w = {column: weights.get(column, 0.0) for column in COMPONENT_COLUMNS}
+    ranking_df = ranking_df.reset_index(drop=True)
+    k = min(k, len(ranking_df))
+
+    cheap = {
+        "consumption_score": max_normalized(ranking_df["total_consumption"]),
+        "platform_reach_score": platform_reach_scores(ranking_df),
+        "platform_count_score": max_normalized(ranking_df["platforms_present"]),
+    }
+    partial = sum(w[column] * scores for column, scores in cheap.items())
+
+    codes, _ = pd.factorize(ranking_df["genre"], use_na_sentinel=False)
+    sizes = np.bincount(codes)[codes]
+    if source_labels is None:
+        lowest_genre = np.where(sizes > 1, 100.0 / sizes, 100.0)
+    else:
+        # A weighted membership can score below 100 / size of any one cohort
+        lowest_genre = np.zeros(len(ranking_df))
+    lower = partial + w["genre_rank_score"] * lowest_genre
+    upper = partial + w["genre_rank_score"] * 100.0
+
+    # (with a little slack for rounding in the bounds)
+    threshold = np.partition(lower, len(lower) - k)[len(lower) - k]
+    candidates = np.flatnonzero(upper >= threshold - 1e-9)
+
+    top = ranking_df.iloc[candidates].copy()
+    for column, scores in cheap.items():
+        top[column] = scores[candidates]
+    if source_labels is not None:
+        # Multi-label memberships need the full cohorts
+        top["genre_rank_score"] = genre_rank_scores(ranking_df, source_labels)[candidates]
+    else:
+        top["genre_rank_score"] = genre_percentiles_for(ranking_df, candidates)
+
+    composite = composite_scores(top, {"top_k": w})["top_k"].to_numpy()
+    # Candidates are in catalog order, so their position breaks ties
+    best = np.lexsort((np.arange(len(composite)), -composite))[:k]
+
+    top = top.iloc[best].copy()
+    top["composite_score"] = composite[best]
+    top["rank"] = np.arange(1, k + 1)
+    return top, len(candidates)
+
+
+def weight_matrix(profiles=None):
+    """Components x profiles weight matrix (DataFrame); components a profile omits weigh 0.
+
+    profiles: {name: {component: weight}}, or names from WEIGHT_PROFILES
+    (default: all of them).
+    """
+
+    if profiles is None:
+        profiles = WEIGHT_PROFILES
+    elif not isinstance(profiles, dict):
+        unknown = [name for name in profiles if name not in WEIGHT_PROFILES]
+        if unknown:
+            raise ValueError(f"Unknown weight profiles: {unknown} (use {list(WEIGHT_PROFILES)})")
+        profiles = {name: WEIGHT_PROFILES[name] for name in profiles}
+
+    for name, weights in profiles.items():
+        unknown = set(weights) - set(COMPONENT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Weight profile {name!r}: unknown components {sorted(unknown)} (use {COMPONENT_COLUMNS})")
+        if any(weight < 0 for weight in weights.values()):
+            raise ValueError(f"Weight profile {name!r}: weights must be non-negative")
+        if not np.isclose(sum(weights.values()), 1.0):
+            raise ValueError(f"Weight profile {name!r}: weights sum to {sum(weights.values()):g}, not 1")
+
+    return pd.DataFrame(
+        {name: [weights.get(column, 0.0) for column in COMPONENT_COLUMNS] for name, weights in profiles.items()},
+        index=COMPONENT_COLUMNS, dtype=np.float64,
+    )
+
+
+def composite_scores(scores, profiles=None):
+    """Composite score per show (rows) and weight profile (columns): score matrix x weight matrix.
+
+    The product is accumulated one component at a time (a rank-1 update per
+    component) rather than through BLAS, which may reorder the additions:
+    the sums stay bit-identical to the column-by-column weighted sum, so
+    near-tied shows keep their order.
+    """
+
+    weights = weight_matrix(profiles)
+    matrix = scores[COMPONENT_COLUMNS].to_numpy(dtype=np.float64)
+    w = weights.to_numpy()
+
+    composite = matrix[:, :1] * w[:1]
+    for k in range(1, len(COMPONENT_COLUMNS)):
+        composite += matrix[:, k:k + 1] * w[k:k + 1]
+    return pd.DataFrame(composite, index=scores.index, columns=weights.columns)
+
+
+def rank_tables(ranking_df, profiles=None, top_n=None):
+    """One rank table per weight profile: {profile: DataFrame of rank, composite_score, show columns}.
+
+    ranking_df needs the COMPONENT_COLUMNS (see component_scores()); top_n
+    keeps only the leading rows of each table.
+    """
+
+    composite = composite_scores(ranking_df, profiles)
+    values = composite.to_numpy()
+
+    # Every profile's order from one argsort over the shows x profiles matrix
+    order = np.argsort(-values, axis=0, kind="stable")[:top_n]
+    columns = [column for column in RANK_TABLE_COLUMNS if column in ranking_df.columns]
+
+    tables = {}
+    for j, profile in enumerate(composite.columns):
+        rows = order[:, j]
+        table = ranking_df.iloc[rows][columns].reset_index(drop=True)
+        table.insert(0, "rank", np.arange(1, len(rows) + 1))
+        table.insert(2, "composite_score", values[rows, j])
+        tables[profile] = table
+    return tables
+
+
+def save_rank_tables(tables, directory=VARIANTS_DIR):
+    """Write each profile's rank table to <directory>/ranking_<profile>.csv."""
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for profile, table in tables.items():
+        path = directory / f"ranking_{profile}.csv"
+        table.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def synthetic_ranking(n, seed=0):
+    """Random ranking frame with the columns component_scores() needs."""
+
+    from genre_taxonomy import LEVEL_CATEGORIES
+
+    rng = np.random.default_rng(seed)
+    platforms = rng.lognormal(10, 2, (n, len(REACH_COLUMNS))).round()
+    platforms[rng.random(platforms.shape) < 0.6] = 0.0
+    platforms[np.arange(n), rng.integers(0, len(REACH_COLUMNS), n)] += 1.0  # on at least one platform
+
+    ranking_df = pd.DataFrame(platforms, columns=REACH_COLUMNS)
+    ranking_df["show_name"] = [f"show {i}" for i in range(n)]
+    ranking_df["genre"] = rng.choice(np.array(LEVEL_CATEGORIES["standard"], dtype=object), n)
+    ranking_df["total_consumption"] = platforms.sum(axis=1)
+    ranking_df["platforms_present"] = (platforms > 0).sum(axis=1)
+    return ranking_df
+
+
+def _row_loop_scores(ranking_df):
+    """Per-row reach and genre scores as the ranking script computed them before (for the benchmark)."""
+
+    reach = []
+    for _, row in ranking_df.iterrows():
+        scores = [row[col] / ranking_df[col].max() * 100 for col in REACH_COLUMNS if row[col] > 0]
+        reach.append(max(scores) if scores else 0)
+
+    genre = []
+    for _, row in ranking_df.iterrows():
+        cohort = ranking_df[ranking_df["genre"] == row["genre"]]
+        genre.append(100.0 if len(cohort) == 1 else
+                     (cohort["total_consumption"] <= row["total_consumption"]).sum() / len(cohort) * 100)
+    return np.array(reach), np.array(genre)
+
+
+def compare_profiles(rankings_file="final_5platform_podcast_rankings.csv", top_n=10):
+    """Rank tables for every weight profile from the saved ranking, printed side by side and saved."""
+
+    print("RANKING VARIANTS BY WEIGHT PROFILE")
+    print("=" * 50)
+
+    ranking_df = pd.read_csv(rankings_file, keep_default_na=False)
+    start = time.perf_counter()
+    tables = rank_tables(ranking_df)
+    elapsed = time.perf_counter() - start
+    print(f"{len(tables)} profiles x {len(ranking_df)} shows ranked in {elapsed * 1000:.1f} ms")
+
+    weights = weight_matrix()
+    for profile in tables:
+        print(f"  {profile:<16} " + " / ".join(f"{w:.2f}" for w in weights[profile]))
+
+    print(f"\n{'rank':>4} " + " ".join(f"{profile[:22]:<22}" for profile in tables))
+    for i in range(top_n):
+        print(f"{i + 1:>4} " + " ".join(f"{table['show_name'].iloc[i][:22]:<22}" for table in tables.values()))
+
+    for path in save_rank_tables(tables):
+        print(f"✓ {path}")
+
+
+def benchmark():
+    """Scores match the per-row loops, and scoring time grows linearly up to 1M shows."""
+
+    print("VECTORIZED SCORING ENGINE")
+    print("=" * 50)
+
+    # Same scores as the per-row loops, on a size the loops can still handle
+    sample = synthetic_ranking(2_000, seed=1)
+    start = time.perf_counter()
+    loop_reach, loop_genre = _row_loop_scores(sample)
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    scores = component_scores(sample)
+    vector_time = time.perf_counter() - start
+
+    assert np.array_equal(scores["platform_reach_score"].to_numpy(), loop_reach)
+    assert np.allclose(scores["genre_rank_score"].to_numpy(), loop_genre)
+    print(f"✓ {len(sample):,} shows: row loops {loop_time:.2f} s, vectorized {vector_time * 1000:.1f} ms "
+          f"({loop_time / vector_time:,.0f}x), identical scores")
+
+    # Scaling: time per show should stay flat as the catalog grows
+    print(f"\n{'shows':>10} {'seconds':>9} {'µs/show':>9}")
+    sizes, timings = [], []
+    for n in [10_000, 100_000, 1_000_000]:
+        ranking_df = synthetic_ranking(n)
+        start = time.perf_counter()
+        component_scores(ranking_df)
+        elapsed = time.perf_counter() - start
+        sizes.append(n)
+        timings.append(elapsed)
+        print(f"{n:>10,} {elapsed:9.3f} {elapsed / n * 1e6:9.2f}")
+
+    # Growth exponent from the log-log slope (1.0 = linear)
+    slope = np.polyfit(np.log(sizes), np.log(timings), 1)[0]
+    print(f"\nScaling exponent: {slope:.2f} ({'✓ linear' if slope < 1.2 else '⚠ super-linear'})")
+
+    # Top-25 eligibility list: full scoring and sort vs bounded top-k selection
+    weights = WEIGHT_PROFILES[DEFAULT_PROFILE]
+    start = time.perf_counter()
+    full = ranking_df.assign(**component_scores(ranking_df))
+    full["composite_score"] = composite_scores(full, [DEFAULT_PROFILE])[DEFAULT_PROFILE]
+    full = full.sort_values("composite_score", ascending=False).head(25)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top, candidates = top_k_ranking(ranking_df, 25, weights)
+    top_time = time.perf_counter() - start
+
+    assert top["show_name"].tolist() == full["show_name"].tolist()
+    print(f"\nTop 25 of {len(ranking_df):,}: full ranking {full_time:.2f} s, top-k mode {top_time:.2f} s "
+          f"({candidates} genre percentiles computed), same list")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "profiles":
+        compare_profiles()
+    else:
+        benchmark()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Canonical show name normalization
+
+normalize_show_name() is the canonical key for every mapping file and the
+ranking system. normalize_names() applies the same rules vectorized over a
+whole Series so large key columns are normalized in one pass.
+"""
+
+import re
+
+import pandas as pd
+
+# Common podcast suffixes and qualifiers, removed in this order
+CANONICAL_PATTERNS = [
+    r'\bpodcast\b',
+    r'\bshow\b',
+    r'\bthe podcast\b',
+    r'\bthe show\b',
+    r'\bwith\s+[^,]+$',  # "with [host name]" at end
+    r'\bw/\s+[^,]+$',    # "w/ [host name]" at end
+]
+
+
+def normalize_show_name(name):
+    """Normalize show name for matching across platforms."""
+    if pd.isna(name):
+        return ""
+
+    # Convert to string and lowercase
+    normalized = str(name).strip().lower()
+
+    for pattern in CANONICAL_PATTERNS:
+        normalized = re.sub(pattern, '', normalized)
+
+    # Remove all non-word/space characters
+    normalized = re.sub(r"[^\w\s]", "", normalized)
+
+    # Collapse multiple spaces to single space
+    normalized = re.sub(r"\s+", " ", normalized)
+
+    return normalized.strip()
+
+
+def normalize_names(names):
+    """Vectorized normalize_show_name() over any iterable of names."""
+
+    names = pd.Series(names, dtype=object)
+    missing = names.isna()
+
+    normalized = names.where(~missing, "").astype(str).str.strip().str.lower()
+
+    for pattern in CANONICAL_PATTERNS:
+        normalized = normalized.str.replace(pattern, "", regex=True)
+
+    normalized = normalized.str.replace(r"[^\w\s]", "", regex=True)
+    normalized = normalized.str.replace(r"\s+", " ", regex=True)
+
+    return normalized.str.strip().where(~missing, "")
+
+
+def is_canonical_form(names):
+    """Which names already look like normalize_show_name() output.
+
+    normalize_show_name() is not idempotent: a "with ..." clause survives the
+    first pass when a comma follows it, and only matches once the comma has
+    been stripped ("All-In with Chamath, Jason, ..." -> "allin with chamath
+    jason ..." -> "allin"). Keys in this form must be kept as they are rather
+    than normalized again.
+    """
+
+    names = pd.Series(names, dtype=object)
+    text = names.where(names.notna(), "").astype(str)
+
+    return (
+        names.notna()
+        & (text == text.str.lower())
+        & ~text.str.contains(r"[^\w\s]|\s\s|^\s|\s$|[^\S ]", regex=True)
+        & ~text.str.contains(r"\bpodcast\b|\bshow\b", regex=True)
+    )
+
+
+__all__ = ["CANONICAL_PATTERNS", "is_canonical_form", "normalize_names", "normalize_show_name"]
@@ -6,202 +6,15 @@ Based on comprehensive research of podcast genres using Tavily search
 
 import pandas as pd
 
+from classification_facts import load_fact_labels, load_facts_with_evidence
+
 def create_tavily_genre_mapping():
     """Create genre mapping based on Tavily research results."""
 
     # Research findings from Tavily searches
     research_results = {
-        # TRUE CRIME - Clear true crime content
-        "Crime Junkie": {
-            "genre": "True Crime",
-            "evidence": "True crime podcast hosted by Ashley Flowers, #1 true crime podcast"
-        },
-        "48 Hours": {
-            "genre": "True Crime",
-            "evidence": "CBS documentary news magazine, presents 'true crime' documentaries"
-        },
-        "Dateline NBC": {
-            "genre": "True Crime",
-            "evidence": "NBC investigative journalism, true crime focus with Keith Morrison"
-        },
-        "Morbid": {
-            "genre": "True Crime",
-            "evidence": "Known true crime podcast format"
-        },
-        "My Favorite Murder with Karen Kilgariff and Georgia Hardstark": {
-            "genre": "True Crime",
-            "evidence": "Well-known true crime comedy podcast"
-        },
-        "Rotten Mango": {
-            "genre": "True Crime",
-            "evidence": "True crime storytelling podcast"
-        },
-        "MrBallen Podcast: Strange, Dark & Mysterious Stories": {
-            "genre": "True Crime",
-            "evidence": "True crime and mystery stories format"
-        },
-        "Snapped: Women Who Murder": {
-            "genre": "True Crime",
-            "evidence": "True crime focused on female perpetrators"
-        },
-        "Murder, Mystery & Makeup": {
-            "genre": "True Crime",
-            "evidence": "True crime content with beauty format"
-        },
-        "RedHanded": {
-            "genre": "True Crime",
-            "evidence": "British true crime podcast"
-        },
-        "Last Podcast on the Left": {
-            "genre": "True Crime",
-            "evidence": "True crime comedy podcast"
-        },
-
-        # INTERVIEW & TALK - Long-form conversations
-        "The Joe Rogan Experience": {
-            "genre": "Interview & Talk",
-            "evidence": "2-3 hour conversations with guests on various topics, primarily interview format"
-        },
-        "Smartless": {
-            "genre": "Interview & Talk",
-            "evidence": "Comedy-minded conversation podcast with Jason Bateman, Sean Hayes & Will Arnett interviewing guests"
-        },
-        "Armchair Expert with Dax Shepard": {
-            "genre": "Interview & Talk",
-            "evidence": "Interview podcast format with celebrity guests"
-        },
-        "Conan O'Brien Needs a Friend": {
-            "genre": "Interview & Talk",
-            "evidence": "Interview format with Conan O'Brien and guests"
-        },
-        "Call Her Daddy": {
-            "genre": "Interview & Talk",
-            "evidence": "Interview and advice podcast, evolved from sex advice to celebrity interviews"
-        },
-        "Shawn Ryan Show": {
-            "genre": "Interview & Talk",
-            "evidence": "Long-form interview format"
-        },
-
-        # NEWS & POLITICS - News and political commentary
-        "The Daily": {
-            "genre": "News & Politics",
-            "evidence": "Daily news podcast from The New York Times discussing current events"
-        },
-        "NPR News Now": {
-            "genre": "News & Politics",
-            "evidence": "NPR news content"
-        },
-        "Up First from NPR": {
-            "genre": "News & Politics",
-            "evidence": "NPR morning news podcast"
-        },
-        "The Ben Shapiro Show": {
-            "genre": "News & Politics",
-            "evidence": "Political commentary podcast"
-        },
-        "The Tucker Carlson Show": {
-            "genre": "News & Politics",
-            "evidence": "Political commentary and news analysis"
-        },
-        "The MeidasTouch Podcast": {
-            "genre": "News & Politics",
-            "evidence": "Political commentary and news analysis"
-        },
-        "Breaking Points": {
-            "genre": "News & Politics",
-            "evidence": "Political news and commentary"
-        },
-
-        # SPORTS - Sports content and commentary
-        "Pardon My Take": {
-            "genre": "Sports",
-            "evidence": "Comedic sports podcast by Barstool Sports with Big Cat & PFT Commenter"
-        },
-        "New Heights with Jason & Travis Kelce": {
-            "genre": "Sports",
-            "evidence": "NFL players discussing sports"
-        },
-        "The Bill Simmons Podcast": {
-            "genre": "Sports",
-            "evidence": "Sports commentary and analysis"
-        },
-        "The Herd with Colin Cowherd": {
-            "genre": "Sports",
-            "evidence": "Sports talk radio/podcast format"
-        },
-
-        # EDUCATION - Educational and scientific content
-        "Huberman Lab": {
-            "genre": "Education",
-            "evidence": "Neuroscience education podcast hosted by Dr. Andrew Huberman, professor"
-        },
-        "Stuff You Should Know": {
-            "genre": "Education",
-            "evidence": "Educational podcast explaining various topics"
-        },
-        "Hidden Brain": {
-            "genre": "Education",
-            "evidence": "NPR show about psychology and human behavior"
-        },
-        "Wow in the World": {
-            "genre": "Education",
-            "evidence": "Educational podcast for kids about science and discovery"
-        },
-
-        # COMEDY - Primary comedy content
-        "Kill Tony": {
-            "genre": "Comedy",
-            "evidence": "Stand-up comedy podcast format"
-        },
-        "Bad Friends": {
-            "genre": "Comedy",
-            "evidence": "Comedy podcast with comedians"
-        },
-        "This Past Weekend w/ Theo Von": {
-            "genre": "Comedy",
-            "evidence": "Comedy podcast by comedian Theo Von"
-        },
-        "Distractible": {
-            "genre": "Comedy",
-            "evidence": "Comedy podcast with gaming/entertainment personalities"
-        },
-        "2 Bears, 1 Cave with Tom Segura & Bert Kreischer": {
-            "genre": "Comedy",
-            "evidence": "Comedy podcast with two comedians"
-        },
-
-        # BUSINESS - Business and finance content
-        "Financial Audit": {
-            "genre": "Business",
-            "evidence": "Financial advice and business content"
-        },
-        "The Ramsey Show": {
-            "genre": "Business",
-            "evidence": "Personal finance and business advice"
-        },
-        "All-In with Chamath, Jason, Sacks & Friedberg": {
-            "genre": "Business",
-            "evidence": "Business and tech investing podcast"
-        },
-
-        # ENTERTAINMENT - Entertainment industry and pop culture
-        "The Bobby Bones Show": {
-            "genre": "Entertainment",
-            "evidence": "Entertainment radio show format"
-        },
-        "The Breakfast Club": {
-            "genre": "Entertainment",
-            "evidence": "Hip-hop and entertainment morning show"
-        },
-        "The Toast": {
-            "genre": "Entertainment",
-            "evidence": "Pop culture and entertainment commentary"
-        },
-        "Good Mythical Morning with Rhett & Link": {
-            "genre": "Entertainment",
-            "evidence": "Entertainment variety show format"
-        }
+        show: {"genre": genre, "evidence": evidence}
+        for show, (genre, evidence) in load_facts_with_evidence("tavily_genre_research").items()
     }
 
     # Create comprehensive mapping for all shows
@@ -212,45 +25,7 @@ def create_tavily_genre_mapping():
         all_shows_mapping[show.lower()] = data["genre"]
 
     # Add additional shows based on name patterns and common knowledge
-    additional_mappings = {
-        # True Crime (based on naming patterns)
-        "mrballen's medical mysteries": "True Crime",
-        "small town murder": "True Crime",
-        "two hot takes": "True Crime",
-        "crook county": "True Crime",
-        "law&crime sidebar with jesse weber": "True Crime",
-
-        # News & Politics (based on naming patterns)
-        "nbc nightly news with tom llamas": "News & Politics",
-        "the young turks": "News & Politics",
-        "timcast news stories": "News & Politics",
-        "brian tyler cohen": "News & Politics",
-        "farron balanced": "News & Politics",
-
-        # Interview & Talk (based on format)
-        "on purpose with jay shetty": "Interview & Talk",
-        "the mel robbins podcast": "Interview & Talk",
-
-        # Comedy (based on naming and format)
-        "smosh reads reddit stories": "Comedy",
-        "matt and shane's secret podcast": "Comedy",
-        "wait wait... don't tell me!": "Comedy",
-
-        # Entertainment (based on format)
-        "the steve harvey morning show": "Entertainment",
-        "the philip defranco show (every mon-tues-wed-thurs-friday!)": "Entertainment",
-
-        # Sports (based on naming)
-        "not gonna lie with kylie kelce": "Sports",
-
-        # Education (based on content type)
-        "full surahs": "Education",
-
-        # International/Other content
-        "caso cerrado - pleitos familiares con escándalo": "Entertainment",
-        "relatos de la noche": "Entertainment",
-        "подкасты - мировая политика: сша, китай, россия, украина": "News & Politics",
-    }
+    additional_mappings = load_fact_labels("tavily_genre_additional")
 
     # Add additional mappings
     for show, genre in additional_mappings.items():
@@ -9,98 +9,29 @@ Reduces 43+ diverse genre labels to ~12 core categories for consistent analysis.
 import pandas as pd
 from pathlib import Path
 
+from genre_taxonomy import get_genre_taxonomy, standardize_genres
+
 def define_unified_genres():
     """Define the unified genre classification system."""
 
-    # Core unified genres (industry standard categories)
-    unified_genres = {
-        'True Crime': [
-            'True Crime',
-            'True Crime & Beauty',
-            'True Crime & Comedy'
-        ],
-        'News & Politics': [
-            'News & Politics',
-            'News',
-            'News & Commentary',
-            'News & Law'
-        ],
-        'Comedy': [
-            'Comedy',
-            'Comedy & Entertainment',
-            'Comedy & Interview',
-            'Comedy & Lifestyle',
-            'Comedy & Live Show',
-            'Comedy & News',
-            'Comedy & Pop Culture',
-            'Comedy & Sports',
-            'Comedy & Commentary',
-            'Gaming & Comedy'
-        ],
-        'Interview & Talk': [
-            'Interview & Talk',
-            'Interview & Military',
-            'Business & Interview'
-        ],
-        'Sports': [
-            'Sports',
-            'Sports & Commentary',
-            'Sports & Entertainment',
-            'Sports & Interview',
-            'Sports & Lifestyle'
-        ],
-        'Business & Finance': [
-            'Business & Finance',
-            'Business & Politics'
-        ],
-        'Pop Culture & Entertainment': [
-            'Pop Culture & Entertainment',
-            'Entertainment & Lifestyle',
-            'Anime & Pop Culture',
-            'Relationships & Pop Culture',
-            'Hip-Hop & Culture',
-            'Country Music & Radio',
-            'Radio & Entertainment'
-        ],
-        'Health & Wellness': [
-            'Self-Help & Wellness',
-            'Relationships & Lifestyle'
-        ],
-        'Education & Learning': [
-            'Educational',
-            'Education & Law',
-            'Science & Psychology',
-            'Science & Technology'
-        ],
-        'Religion & Spirituality': [
-            'Religion & Spirituality'
-        ],
-        'Mystery & Paranormal': [
-            'Mystery & Conspiracy'
-        ],
-        'Other': [
-            'Miscellaneous'
-        ]
-    }
-
-    return unified_genres
+    # Core unified genres (industry standard categories, level of genre_taxonomy)
+    return get_genre_taxonomy().groups("unified")
 
 def create_genre_mapping():
     """Create mapping from current genres to unified categories."""
 
     unified_system = define_unified_genres()
 
-    # Create reverse mapping: current genre -> unified genre
-    genre_mapping = {}
-
-    for unified_genre, current_genres in unified_system.items():
-        for current_genre in current_genres:
-            genre_mapping[current_genre] = unified_genre
+    # Reverse mapping: current genre -> unified genre
+    genre_mapping = get_genre_taxonomy().mapping("unified")
 
     return genre_mapping, unified_system
 
-def apply_unified_classification():
-    """Apply unified genre classification to all shows."""
+def apply_unified_classification(unmapped_policy="warn"):
+    """Apply unified genre classification to all shows.
+
+    unmapped_policy: "warn", "error" or "ignore" for genres outside the taxonomy.
+    """
 
     # Load current comprehensive genre data
     genres_df = pd.read_csv('data_comprehensive_genres/comprehensive_genre_mapping.csv')
@@ -108,18 +39,10 @@ def apply_unified_classification():
     # Get genre mapping
     genre_mapping, unified_system = create_genre_mapping()
 
-    # Apply unified classification
-    genres_df['unified_genre'] = genres_df['genre'].map(genre_mapping)
-
-    # Handle any unmapped genres
-    unmapped = genres_df[genres_df['unified_genre'].isna()]
-    if len(unmapped) > 0:
-        print("Unmapped genres found:")
-        for genre in unmapped['genre'].unique():
-            print(f"  - {genre}")
-
-        # Map unmapped to 'Other' for now
-        genres_df['unified_genre'] = genres_df['unified_genre'].fillna('Other')
+    # Apply unified classification; unmapped genres are reported with their
+    # frequency and mapped to 'Other' for now
+    genres_df['unified_genre'], _ = standardize_genres(
+        genres_df['genre'], 'unified', default='Other', policy=unmapped_policy)
 
     return genres_df, genre_mapping, unified_system
 
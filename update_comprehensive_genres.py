@@ -8,16 +8,8 @@ to create a complete genre classification for all shows.
 
 import pandas as pd
 from pathlib import Path
-import re
-
-def normalize_show_name(name):
-    """Normalize show name for matching."""
-    if pd.isna(name):
-        return ""
-    normalized = str(name).lower().strip()
-    normalized = re.sub(r'[^\w\s]', '', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized)
-    return normalized
+
+from show_name_normalization import normalize_show_name
 
 def merge_genre_sources():
     """Merge all genre data sources into comprehensive mapping."""
@@ -4,38 +4,10 @@ Updated comprehensive podcast ranking system with new data
 """
 
 import pandas as pd
-import numpy as np
-import re
 from pathlib import Path
 
-def normalize_show_name(name):
-    """Normalize show name for matching across platforms."""
-    if pd.isna(name):
-        return ""
-
-    # Convert to string and lowercase
-    normalized = str(name).strip().lower()
-
-    # Remove common podcast suffixes and qualifiers
-    patterns_to_remove = [
-        r'\bpodcast\b',
-        r'\bshow\b',
-        r'\bthe podcast\b',
-        r'\bthe show\b',
-        r'\bwith\s+[^,]+$',  # "with [host name]" at end
-        r'\bw/\s+[^,]+$',    # "w/ [host name]" at end
-    ]
-
-    for pattern in patterns_to_remove:
-        normalized = re.sub(pattern, '', normalized)
-
-    # Remove all non-word/space characters
-    normalized = re.sub(r"[^\w\s]", "", normalized)
-
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    return normalized.strip()
+from scoring_engine import COMPONENT_COLUMNS, component_scores, composite_scores
+from show_name_normalization import normalize_show_name
 
 def load_platform_data():
     """Load and normalize data from all platforms."""
@@ -226,55 +198,20 @@ def create_unified_ranking():
         ranking_df["apple_plays"]
     )
 
-    # 1. Total Consumption Score (50% weight)
-    max_consumption = ranking_df["total_consumption"].max()
-    ranking_df["consumption_score"] = (ranking_df["total_consumption"] / max_consumption * 100)
-
-    # 2. Platform Reach Score (20% weight) - Best single platform performance
-    platform_scores = []
-    for _, row in ranking_df.iterrows():
-        scores = []
-        if row["spotify_plays"] > 0:
-            scores.append(row["spotify_plays"] / ranking_df["spotify_plays"].max() * 100)
-        if row["youtube_views"] > 0:
-            scores.append(row["youtube_views"] / ranking_df["youtube_views"].max() * 100)
-        if row["amazon_plays"] > 0:
-            scores.append(row["amazon_plays"] / ranking_df["amazon_plays"].max() * 100)
-        if row["apple_plays"] > 0:
-            scores.append(row["apple_plays"] / ranking_df["apple_plays"].max() * 100)
-
-        platform_scores.append(max(scores) if scores else 0)
-
-    ranking_df["platform_reach_score"] = platform_scores
-
-    # 3. Platform Count Score (20% weight)
-    max_platforms = ranking_df["platforms_present"].max()
-    ranking_df["platform_count_score"] = (ranking_df["platforms_present"] / max_platforms * 100)
-
-    # 4. Within-Genre Popularity Score (10% weight) - Consumption-based
-    genre_scores = []
-    for _, row in ranking_df.iterrows():
-        genre = row["genre"]
-        genre_shows = ranking_df[ranking_df["genre"] == genre]
-
-        if len(genre_shows) > 1:
-            # Consumption-based percentile within genre
-            genre_rank = (genre_shows["total_consumption"] <= row["total_consumption"]).mean() * 100
-        else:
-            # Single show in genre gets full score
-            genre_rank = 100.0
-
-        genre_scores.append(genre_rank)
-
-    ranking_df["genre_rank_score"] = genre_scores
+    # Component scores, vectorized (scoring_engine.py):
+    # 1. Total Consumption Score - total consumption as a share of the maximum
+    # 2. Platform Reach Score - best single platform performance
+    # 3. Platform Count Score - platforms present as a share of the maximum
+    # 4. Within-Genre Popularity Score - percentile of total consumption within
+    #    the show's genre; a genre with a single show gets full score
+    scores = component_scores(ranking_df, reach_columns=metric_columns)
+    for column in COMPONENT_COLUMNS:
+        ranking_df[column] = scores[column]
 
     # Final Composite Score: Weighted sum of four components
-    ranking_df["composite_score"] = (
-        ranking_df["consumption_score"] * 0.5 +      # 50% total consumption
-        ranking_df["platform_reach_score"] * 0.2 +   # 20% platform reach
-        ranking_df["platform_count_score"] * 0.2 +   # 20% platform count
-        ranking_df["genre_rank_score"] * 0.1         # 10% within-genre popularity
-    )
+    # (legacy weight profile: 50% consumption, 20% platform reach, 20% platform
+    # count, 10% within-genre popularity)
+    ranking_df["composite_score"] = composite_scores(ranking_df, ["legacy"])["legacy"]
 
     # Final ranking
     ranking_df = ranking_df.sort_values("composite_score", ascending=False)
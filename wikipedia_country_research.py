@@ -4,22 +4,12 @@ Wikipedia research for podcast country origins
 """
 
 import pandas as pd
-import re
 from pathlib import Path
 
-def normalize_show_name(name):
-    """Normalize show name for matching - consistent with ranking system."""
-    if pd.isna(name):
-        return ""
-
-    # Apply same normalization as ranking system
-    normalized = str(name).strip().lower()
-    # Remove all non-word/space characters
-    normalized = re.sub(r"[^\w\s]", "", normalized)
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    return normalized.strip()
+from classification_facts import list_collections, load_facts_with_evidence
+from country_extractor import extract_country
+from research_cache import get_cached_backend, report_cache
+from show_name_normalization import normalize_show_name
 
 def get_shows_needing_research():
     """Get list of shows needing country research."""
@@ -84,8 +74,14 @@ def get_shows_needing_research():
     print(f"Shows needing Wikipedia research: {len(missing_country)}")
     return sorted(missing_country)
 
-def research_show_countries():
-    """Research country origins for shows missing explicit data."""
+def research_show_countries(backend=None):
+    """Research country origins for shows missing explicit data.
+
+    backend: research backend (see research_backends); defaults to Wikipedia
+    when its tool is installed, otherwise the local research index.
+    Shows with a country from a local dump (wikipedia_dump_extractor.py) are
+    answered from the fact store without searching.
+    """
 
     missing_shows = get_shows_needing_research()
 
@@ -96,24 +92,48 @@ def research_show_countries():
     print(f"\nResearching {len(missing_shows)} shows...")
     print("=" * 60)
 
+    if backend is None:
+        backend = get_cached_backend("wikipedia")
+
     # Research results will be collected here
     research_results = {}
 
+    if "wikipedia_country" in list_collections():
+        dump_facts = load_facts_with_evidence("wikipedia_country")
+        for show in missing_shows:
+            if show in dump_facts:
+                country, evidence = dump_facts[show]
+                research_results[show] = {"country": country, "source": evidence, "confidence": "high"}
+        missing_shows = [show for show in missing_shows if show not in research_results]
+        print(f"Answered from the Wikipedia dump: {len(research_results)} shows")
+
     # Process shows in batches for Wikipedia research
     batch_size = 5
     for i in range(0, len(missing_shows), batch_size):
         batch = missing_shows[i:i+batch_size]
         print(f"\nBatch {i//batch_size + 1}: Researching {len(batch)} shows")
 
-        for show in batch:
-            print(f"Researching: {show}")
-            # This will be filled with actual Wikipedia research
-            research_results[show] = {
-                "country": "RESEARCH_NEEDED",
-                "source": "Wikipedia research pending",
-                "confidence": "pending"
-            }
+        responses = backend.search_many([f'"{show}" podcast' for show in batch])
 
+        for show, response in zip(batch, responses):
+            print(f"Researching: {show}")
+            text = " ".join(result["content"] for result in response["results"])
+            country = extract_country(text, show)
+
+            if country:
+                research_results[show] = {
+                    "country": country,
+                    "source": f"{backend.name} research",
+                    "confidence": "medium" if backend.remote else "local"
+                }
+            else:
+                research_results[show] = {
+                    "country": "RESEARCH_NEEDED",
+                    "source": f"No country found via {backend.name}",
+                    "confidence": "pending"
+                }
+
+    report_cache(backend)
     return research_results
 
 if __name__ == "__main__":
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Offline podcast facts from a local Wikipedia XML dump
+
+Streams a pages-articles dump (.xml, .xml.bz2 or .xml.gz) with iterparse,
+clearing every page after it is read, so memory stays flat on multi-GB
+dumps. Pages with a podcast/radio/television infobox are handed in batches
+to a process pool that parses the infobox fields (country, language, genre,
+network). Page titles and redirects are matched against the show alias
+table - skipping namesakes such as "(TV series)" or "(band)", and
+non-podcast infoboxes without a podcast mention - and the matched fields
+are written to the classification fact store as the wikipedia_* collections.
+
+    python wikipedia_dump_extractor.py enwiki-latest-pages-articles.xml.bz2 [workers]
+"""
+
+import bz2
+import gzip
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from classification_facts import save_fact_collection
+from country_extractor import COUNTRY_EXTRACTOR, COUNTRY_NAMES
+from genre_rule_engine import FALLBACK_GENRE, classify_genre_text
+from show_name_normalization import normalize_names
+
+BATCH_SIZE = 256
+MAX_PENDING_BATCHES = 4  # per worker; bounds the pages held in memory
+
+# Infoboxes of pages that can describe a show
+SHOW_INFOBOX = re.compile(
+    r"\{\{\s*infobox[ _]+(podcast|radio[ _]+(?:show|program(?:me)?)|television|web[ _]+series|youtube[ _]+personality)",
+    re.IGNORECASE,
+)
+
+# Output field -> infobox parameters that carry it, in preference order
+INFOBOX_FIELDS = {
+    "country": ["country", "country_of_origin", "location"],
+    "language": ["language", "languages"],
+    "genre": ["genre", "genres", "format"],
+    "network": ["network", "publisher", "production_company", "company", "channel", "syndicates"],
+}
+
+FACT_COLLECTIONS = {field: f"wikipedia_{field}" for field in INFOBOX_FIELDS}
+
+# Title disambiguators: "(podcast)" / "(radio show)" vs namesakes in other media
+DISAMBIGUATOR = re.compile(r"\s*\(([^)]*)\)\s*$")
+PODCAST_DISAMBIGUATOR = re.compile(r"podcast|radio", re.IGNORECASE)
+OTHER_MEDIUM = re.compile(
+    r"\b(tv|television|series|film|movie|band|album|song|single|novel|book|game|play|musical|comics?|"
+    r"magazine|newspaper|company|musician|singer|rapper|actor|actress|comedian|footballer|politician)\b",
+    re.IGNORECASE,
+)
+PODCAST_MENTION = re.compile(r"\bpodcast", re.IGNORECASE)
+
+
+def open_dump(path):
+    """Binary stream of a dump, decompressing .bz2/.gz on the fly."""
+
+    path = Path(path)
+    if path.suffix == ".bz2":
+        return bz2.open(path, "rb")
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_pages(stream):
+    """(title, redirect target or None, wikitext) per article page, in constant memory."""
+
+    context = ET.iterparse(stream, events=("start", "end"))
+    _, root = next(context)
+
+    title = redirect = text = None
+    namespace = "0"
+    for event, elem in context:
+        if event != "end":
+            continue
+
+        tag = _local(elem.tag)
+        if tag == "title":
+            title = elem.text
+        elif tag == "ns":
+            namespace = elem.text
+        elif tag == "redirect":
+            redirect = elem.get("title")
+        elif tag == "text":
+            text = elem.text or ""
+        elif tag == "page":
+            if namespace == "0" and title:
+                yield title, redirect, text
+            title = redirect = text = None
+            namespace = "0"
+            # Drop the finished page (and everything before it) from the tree
+            root.clear()
+
+
+def _infobox_body(text, start):
+    """Infobox template text from its opening braces, matching nested {{ }}."""
+
+    depth = 0
+    i = start
+    while i < len(text) - 1:
+        pair = text[i:i + 2]
+        if pair == "{{":
+            depth += 1
+            i += 2
+        elif pair == "}}":
+            depth -= 1
+            i += 2
+            if depth == 0:
+                return text[start + 2:i - 2]
+        else:
+            i += 1
+    return text[start + 2:]
+
+
+def _split_params(body):
+    """Top-level "|" separated parameters (ignoring pipes inside {{ }} and [[ ]])."""
+
+    params, depth, current = [], 0, []
+    i = 0
+    while i < len(body):
+        pair = body[i:i + 2]
+        if pair in ("{{", "[["):
+            depth += 1
+            current.append(pair)
+            i += 2
+        elif pair in ("}}", "]]"):
+            depth -= 1
+            current.append(pair)
+            i += 2
+        elif body[i] == "|" and depth == 0:
+            params.append("".join(current))
+            current = []
+            i += 1
+        else:
+            current.append(body[i])
+            i += 1
+    params.append("".join(current))
+    return params
+
+
+def clean_wikitext(value):
+    """Plain text of an infobox value: refs, comments and markup removed."""
+
+    value = re.sub(r"<ref[^>]*/>|<ref[^>]*>.*?</ref>|<!--.*?-->", "", value, flags=re.DOTALL)
+    value = re.sub(r"<br\s*/?>", ", ", value)
+    value = re.sub(r"<[^>]+>", "", value)
+    # {{flag|United States}}, {{ubl|a|b}} -> their arguments
+    value = re.sub(r"\{\{\s*[^|{}]+\|([^{}]*)\}\}", lambda m: ", ".join(m.group(1).split("|")), value)
+    value = re.sub(r"\{\{[^{}]*\}\}", "", value)
+    value = re.sub(r"\[\[(?:[^|\]]*\|)?([^\]]*)\]\]", r"\1", value)
+    value = re.sub(r"'{2,}", "", value)
+    return re.sub(r"\s+", " ", value).strip(" ,;")
+
+
+def parse_infobox(text):
+    """Infobox type and {field: value} for the first show infobox on a page, or None."""
+
+    match = SHOW_INFOBOX.search(text)
+    if not match:
+        return None
+
+    params = {}
+    for param in _split_params(_infobox_body(text, match.start()))[1:]:
+        name, sep, value = param.partition("=")
+        if sep:
+            params[name.strip().lower().replace(" ", "_")] = clean_wikitext(value)
+
+    fields = {"infobox": re.sub(r"[ _]+", " ", match.group(1).lower())}
+    for field, names in INFOBOX_FIELDS.items():
+        fields[field] = next((params[name] for name in names if params.get(name)), "")
+    return fields
+
+
+def parse_batch(pages):
+    """Worker: infobox fields for a batch of (title, wikitext) pages."""
+
+    rows = []
+    for title, text in pages:
+        fields = parse_infobox(text)
+        if fields:
+            rows.append({"title": title, **fields, "mentions_podcast": bool(PODCAST_MENTION.search(text))})
+    return rows
+
+
+def disambiguator(title):
+    """The trailing "(...)" of a page title, or ""."""
+
+    match = DISAMBIGUATOR.search(title)
+    return match.group(1) if match else ""
+
+
+def names_other_medium(title):
+    """Whether the title's disambiguator names another medium, e.g. "(TV series)" or "(band)"."""
+
+    note = disambiguator(title)
+    return bool(note) and not PODCAST_DISAMBIGUATOR.search(note) and bool(OTHER_MEDIUM.search(note))
+
+
+def is_podcast_page(title, infobox, mentions_podcast):
+    """Whether an infobox page can describe a podcast rather than a namesake in another medium.
+
+    Podcast infoboxes qualify unless the title names another medium;
+    television, web series, YouTube and radio infoboxes only with a
+    podcast/radio disambiguator or a podcast mention in the page.
+    """
+
+    if PODCAST_DISAMBIGUATOR.search(disambiguator(title)):
+        return True
+    if names_other_medium(title):
+        return False
+    return infobox == "podcast" or bool(mentions_podcast)
+
+
+def normalize_titles(titles):
+    """Alias keys for page titles: disambiguators like "(podcast)" dropped, then normalized."""
+
+    titles = pd.Series(titles, dtype=object).str.replace(r"\s*\([^)]*\)\s*$", "", regex=True)
+    return normalize_names(titles)
+
+
+def build_show_aliases():
+    """Alias -> normalized show key, from the show mapping's original platform titles."""
+
+    aliases = {}
+    for path in ["updated_show_mapping.csv", "final_5platform_podcast_rankings.csv"]:
+        try:
+            shows = pd.read_csv(path, keep_default_na=False)
+        except FileNotFoundError:
+            continue
+
+        key_col = "normalized_name" if "normalized_name" in shows.columns else "show_name"
+        keys = shows[key_col].astype(str)
+        aliases.update({key: key for key in keys if key})
+
+        if "original_names" in shows.columns:
+            originals = shows.assign(original=shows["original_names"].str.split(" | ", regex=False))
+            originals = originals.explode("original")
+            names = normalize_names(originals["original"])
+            aliases.update({alias: key for alias, key in zip(names, originals[key_col]) if alias})
+
+    # "the daily" is also found as "daily" and vice versa
+    for alias, key in list(aliases.items()):
+        variant = alias[4:] if alias.startswith("the ") else f"the {alias}"
+        aliases.setdefault(variant, key)
+
+    return aliases
+
+
+def scan_dump(path, aliases, workers=None):
+    """Infobox rows for show pages plus the redirects that point at an alias, in one pass."""
+
+    rows, redirects = [], {}
+    batch, pending = [], set()
+    pages_read = 0
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = MAX_PENDING_BATCHES * workers
+
+    with open_dump(path) as stream, ProcessPoolExecutor(workers) as pool:
+
+        def collect(done):
+            for future in done:
+                rows.extend(future.result())
+
+        for title, redirect, text in iter_pages(stream):
+            pages_read += 1
+            if redirect:
+                # Redirect titles are often the show's other names
+                alias = normalize_titles([title])[0]
+                if alias in aliases and not names_other_medium(title) and not names_other_medium(redirect):
+                    redirects[redirect] = aliases[alias]
+                continue
+
+            # Cheap filter in the reader; the pool parses the infobox
+            if SHOW_INFOBOX.search(text):
+                batch.append((title, text))
+
+            if len(batch) >= BATCH_SIZE:
+                pending.add(pool.submit(parse_batch, batch))
+                batch = []
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+        if batch:
+            pending.add(pool.submit(parse_batch, batch))
+        collect(wait(pending)[0])
+
+    columns = ["title", "infobox", *INFOBOX_FIELDS, "mentions_podcast"]
+    return pd.DataFrame(rows, columns=columns), redirects, pages_read
+
+
+def match_shows(infoboxes, redirects, aliases):
+    """Show key per infobox page: by its own title, else by a redirect pointing at it.
+
+    Pages about namesakes in other media (see is_podcast_page()) are not matched.
+    """
+
+    podcast_pages = [is_podcast_page(title, infobox, mentions) for title, infobox, mentions
+                     in zip(infoboxes["title"], infoboxes["infobox"], infoboxes["mentions_podcast"])]
+    matched = infoboxes[np.array(podcast_pages, dtype=bool)].copy()
+    matched["show"] = normalize_titles(matched["title"]).map(aliases)
+    matched["show"] = matched["show"].fillna(matched["title"].map(redirects))
+    matched = matched.dropna(subset=["show"])
+
+    # Prefer podcast infoboxes, then pages whose title says "(podcast)"
+    matched["priority"] = (matched["infobox"] != "podcast").astype(int) * 2 + \
+        (~matched["title"].str.contains("(podcast)", regex=False)).astype(int)
+    matched = matched.sort_values(["show", "priority"], kind="stable").drop_duplicates("show")
+    return matched.drop(columns=["priority", "mentions_podcast"]).reset_index(drop=True)
+
+
+def to_facts(matched):
+    """Fact collections (labels, evidence) from matched infobox rows."""
+
+    facts = {}
+    for field, collection in FACT_COLLECTIONS.items():
+        rows = matched[matched[field] != ""]
+        values = rows[field]
+        if field == "country":
+            # Country names in text, or bare codes such as "US"
+            codes = values.str.strip().str.upper()
+            values = codes.where(codes.isin(list(COUNTRY_NAMES)), COUNTRY_EXTRACTOR.extract_batch(values))
+        elif field == "genre":
+            values = values.map(classify_genre_text).replace(FALLBACK_GENRE, None)
+
+        keep = values.notna().to_numpy()
+        labels = dict(zip(rows["show"][keep], values[keep]))
+        evidence = {show: f"Wikipedia: {title} ({field} = {raw})"
+                    for show, title, raw in zip(rows["show"][keep], rows["title"][keep], rows[field][keep])}
+        facts[collection] = (labels, evidence)
+    return facts
+
+
+def extract_dump_facts(path, workers=None, save=True):
+    """Scan a dump, match pages to shows and (optionally) store the facts."""
+
+    aliases = build_show_aliases()
+    start = time.perf_counter()
+    infoboxes, redirects, pages_read = scan_dump(path, aliases, workers)
+    elapsed = time.perf_counter() - start
+
+    matched = match_shows(infoboxes, redirects, aliases)
+    facts = to_facts(matched)
+
+    print(f"Pages read: {pages_read:,} in {elapsed:.1f} s | show infoboxes: {len(infoboxes):,} | "
+          f"alias redirects: {len(redirects):,} | matched shows: {len(matched):,}")
+    for collection, (labels, _) in facts.items():
+        if save:
+            save_fact_collection(collection, *facts[collection])
+        print(f"  ✓ {collection}: {len(labels)} facts")
+
+    return matched, facts
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    print("WIKIPEDIA DUMP EXTRACTION")
+    print("=" * 50)
+
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    matched, facts = extract_dump_facts(sys.argv[1], workers)
+
+    for _, row in matched.head(20).iterrows():
+        print(f"  {row['show']:<35} {row['country'][:20]:<20} {row['genre'][:25]:<25} {row['network'][:25]}")